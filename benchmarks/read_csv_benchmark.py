@@ -0,0 +1,77 @@
+r"""Compare backends of :func:`traffic_weaver.readers.read_csv` with :func:`numpy.loadtxt`.
+
+Backends are timed on the bundled Sandvine datasets and on a synthetic file,
+and their results are checked to be identical to :func:`numpy.loadtxt`.
+
+Usage::
+
+    python benchmarks/read_csv_benchmark.py [--nr-of-rows 10000000] [--repeat 3]
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+from importlib import resources
+
+import numpy as np
+
+from traffic_weaver.datasets._base import RESOURCES_DATASETS
+from traffic_weaver.readers import BACKENDS, read_csv
+
+
+def loadtxt(file_name):
+    return np.loadtxt(file_name, delimiter=',', dtype=np.float64)
+
+
+def available_readers():
+    readers = {'np.loadtxt': loadtxt}
+    for backend in BACKENDS:
+        try:
+            read_csv(io.BytesIO(b'0,0\n'), backend=backend)
+        except ImportError:
+            print(f"Skipping '{backend}' backend, its package is not installed.")
+            continue
+        readers[backend] = lambda file_name, backend=backend: read_csv(file_name, backend=backend)
+    readers['default'] = read_csv
+    return readers
+
+
+def benchmark(name, file_names, readers, repeat):
+    expected = [loadtxt(file_name) for file_name in file_names]
+    print(f"\n{name}: {len(file_names)} file(s), {sum(map(os.path.getsize, file_names)) / 2 ** 20:.1f} MiB")
+    for reader_name, reader in readers.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = [reader(file_name) for file_name in file_names]
+            times.append(time.perf_counter() - start)
+        identical = all(result.dtype == np.float64 and np.array_equal(result, exp, equal_nan=True)
+                        for result, exp in zip(results, expected))
+        print(f"  {reader_name:<12} {min(times) * 1e3:10.2f} ms   identical: {identical}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nr-of-rows', type=int, default=10 ** 7, help="number of rows of the synthetic file")
+    parser.add_argument('--repeat', type=int, default=3, help="number of repetitions, the best time is reported")
+    args = parser.parse_args()
+
+    readers = available_readers()
+
+    with resources.as_file(resources.files(RESOURCES_DATASETS) / 'sandvine') as sandvine_dir:
+        file_names = sorted(os.path.join(sandvine_dir, name) for name in os.listdir(sandvine_dir)
+                            if name.endswith('.csv'))
+        benchmark('Sandvine datasets', file_names, readers, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = os.path.join(tmp_dir, 'synthetic.csv')
+        rng = np.random.default_rng(0)
+        x = np.arange(args.nr_of_rows) * 300.0
+        y = rng.lognormal(20, 1, args.nr_of_rows)
+        np.savetxt(file_name, np.column_stack((x, y)), delimiter=',', fmt='%.17g')
+        benchmark(f'Synthetic file of {args.nr_of_rows} rows', [file_name], readers, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,18 +3,25 @@ from . import rfa
 from . import match
 from . import process
 from . import interval
+from . import parallel
+from . import readers
+from . import sinks
 from . import sorted_array_utils
 from ._version import __version__
-from .weaver import Weaver
+from .weaver import Weaver, WeaverPipeline
 
 # @formatter:off
 __all__ = [
     Weaver,
+    WeaverPipeline,
     __version__,
     datasets,
     rfa,
     match,
     process,
     interval,
+    parallel,
+    readers,
+    sinks,
     sorted_array_utils,
 ]
@@ -1,15 +1,33 @@
-from ._base import (get_data_home, load_dataset)
-
-from ._sandvine import sandvine_dataset_description
-from ._mix_it import mix_it_dataset_description
-from ._ams_ix import ams_ix_dataset_description
-from ._ix_br import ix_br_dataset_description
-
-__all__ = [
-    load_dataset,
-    get_data_home,
-    sandvine_dataset_description,
-    mix_it_dataset_description,
-    ams_ix_dataset_description,
-    ix_br_dataset_description,
-]
+"""Datasets of time series.
+
+Submodules are imported on the first access of their functions,
+so importing this package does not import modules used to download and parse datasets.
+"""
+import importlib
+
+_ATTRIBUTE_MODULES = {
+    'load_dataset': '._base',
+    'prefetch': '._base',
+    'clear_dataset_cache': '._base',
+    'set_dataset_cache_max_bytes': '._base',
+    'get_data_home': '._base',
+    'sandvine_dataset_description': '._sandvine',
+    'mix_it_dataset_description': '._mix_it',
+    'ams_ix_dataset_description': '._ams_ix',
+    'ix_br_dataset_description': '._ix_br',
+}
+
+__all__ = list(_ATTRIBUTE_MODULES)
+
+
+def __getattr__(name):
+    if name not in _ATTRIBUTE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_ATTRIBUTE_MODULES[name], __name__), name)
+    # next accesses do not call __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,20 +1,28 @@
+import functools
 import hashlib
+import io
 import logging
 import os
 import pickle
 import shutil
 import time
 import warnings
-from collections import namedtuple
-from gzip import GzipFile
+import zlib
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
 from importlib import resources
 from os import environ, path, makedirs
 from tempfile import TemporaryDirectory
-from urllib.error import URLError
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+from http.client import IncompleteRead
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
 import numpy as np
 
+from ..readers import read_csv
+from ._registry import DATASETS
+
 RESOURCES_DATASETS = 'traffic_weaver.datasets.data'
 RESOURCES_DATASETS_DESCRIPTION = 'traffic_weaver.datasets.data_description'
 
@@ -23,7 +31,43 @@ RemoteFileMetadata = namedtuple("RemoteFileMetadata", ["filename", "url", "check
 logger = logging.getLogger(__name__)
 
 
-def load_dataset(dataset, unpack_dataset_columns=False, **kwargs):
+class _DatasetCache:
+    """Least recently used cache of loaded datasets bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._datasets = OrderedDict()
+
+    def get(self, key):
+        dataset = self._datasets.get(key)
+        if dataset is not None:
+            self._datasets.move_to_end(key)
+        return dataset
+
+    def put(self, key, dataset):
+        if key in self._datasets:
+            self.nbytes -= self._datasets.pop(key).nbytes
+        if dataset.nbytes > self.max_bytes:
+            return
+        self._datasets[key] = dataset
+        self.nbytes += dataset.nbytes
+        self.evict()
+
+    def evict(self):
+        while self.nbytes > self.max_bytes:
+            _, dataset = self._datasets.popitem(last=False)
+            self.nbytes -= dataset.nbytes
+
+    def clear(self, name=None):
+        for key in [key for key in self._datasets if name is None or key[0] == name]:
+            self.nbytes -= self._datasets.pop(key).nbytes
+
+
+_dataset_cache = _DatasetCache(int(environ.get("TRAFFIC_WEAVER_DATASET_CACHE_MAX_BYTES", 256 * 2 ** 20)))
+
+
+def load_dataset(dataset, unpack_dataset_columns=False, use_cache=True, **kwargs):
     """Load dataset as np.ndarray of shape (nr_of_samples, 2).
 
     It is 2D array with each row representing one point in time series.
@@ -33,6 +77,12 @@ def load_dataset(dataset, unpack_dataset_columns=False, **kwargs):
 
     The list of available datasets is in the `traffic_weaver.datasets.data_description` module.
 
+    Loaded datasets are kept in a least recently used in-process cache, keyed by the dataset
+    name and `kwargs`. Dataset loaded with `download_even_if_available=True` is not read from the cache,
+    it replaces the cached one. Unless `use_cache` is False, returned datasets are read-only,
+    copy them before modification. The total size of cached datasets is limited to 256 MiB by default,
+    it can be changed with :func:`set_dataset_cache_max_bytes` or
+    `TRAFFIC_WEAVER_DATASET_CACHE_MAX_BYTES` environment variable.
 
     Parameters
     ----------
@@ -40,6 +90,10 @@ def load_dataset(dataset, unpack_dataset_columns=False, **kwargs):
         Name of the dataset to load.
     unpack_dataset_columns: bool, default=False
         If True, the dataset is unpacked to two separate arrays x and y.
+    use_cache: bool, default=True
+        If False, the dataset is loaded again, and it is neither read from nor stored in the cache.
+    **kwargs
+        Parameters passed to the loading function of the dataset.
 
     Returns
     -------
@@ -50,19 +104,114 @@ def load_dataset(dataset, unpack_dataset_columns=False, **kwargs):
     Examples
     --------
     >>> data = load_dataset('sandvine_audio')
+    >>> data is load_dataset('sandvine_audio')
+    True
+    >>> data.flags.writeable
+    False
 
     """
-    import traffic_weaver.datasets._datasets
-    if dataset.startswith("sandvine"):
-        fun_name = f"load_{dataset.replace('-', '_')}"
+    # dataset downloaded again replaces the cached one loaded with the same parameters
+    refresh = bool(kwargs.get('download_even_if_available', False))
+    key = (dataset, tuple(sorted((k, v) for k, v in kwargs.items() if k != 'download_even_if_available')))
+    try:
+        hash(key)
+    except TypeError:
+        use_cache = False
+
+    data = _dataset_cache.get(key) if use_cache and not refresh else None
+    if data is None:
+        data = _get_dataset_loader(dataset)(**kwargs)
+        if use_cache:
+            data.setflags(write=False)
+            _dataset_cache.put(key, data)
+
+    if unpack_dataset_columns:
+        return data[:, 0], data[:, 1]
     else:
-        fun_name = f"fetch_{dataset.replace('-', '_')}"
+        return data
+
 
+def _get_dataset_metadata(dataset):
+    """Get registry entry of the dataset."""
     try:
-        getattr(traffic_weaver.datasets._datasets, fun_name)
-    except AttributeError:
-        raise ValueError(f"No such dataset: {dataset}")
-    return getattr(traffic_weaver.datasets._datasets, fun_name)(unpack_dataset_columns=unpack_dataset_columns)
+        return DATASETS[dataset.replace('-', '_')]
+    except KeyError:
+        raise ValueError(f"No such dataset: {dataset}") from None
+
+
+def _get_dataset_loader(dataset):
+    """Get function loading the dataset."""
+    metadata = _get_dataset_metadata(dataset)
+    if metadata.source == 'resources':
+        return functools.partial(load_csv_dataset_from_resources, path.join(metadata.folder, metadata.filename))
+    remote = RemoteFileMetadata(filename=metadata.filename + ('.csv.gz' if metadata.gzip else '.csv'),
+                                url=metadata.url, checksum=metadata.checksum)
+    return functools.partial(load_csv_dataset_from_remote, remote=remote, dataset_filename=metadata.filename,
+                             dataset_folder=metadata.folder, gzip=metadata.gzip)
+
+
+def prefetch(datasets='all', max_workers=8, **kwargs):
+    """Download remote datasets concurrently and store them in the cache folder.
+
+    Datasets already available in the cache folder are not downloaded again.
+    Interrupted downloads are resumed on the next call.
+
+    Parameters
+    ----------
+    datasets: str | list[str], default='all'
+        Name or names of the datasets to download. If 'all', all remote datasets are downloaded.
+    max_workers: int, default=8
+        Number of datasets downloaded at the same time.
+    **kwargs
+        Parameters passed to the loading function of each dataset, e.g., `data_home` or `n_retries`.
+
+    Raises
+    ------
+    ValueError
+        If there is no dataset with given name.
+    """
+    if datasets == 'all':
+        datasets = list(DATASETS)
+    elif isinstance(datasets, str):
+        datasets = [datasets]
+    datasets = dict.fromkeys(dataset.replace('-', '_') for dataset in datasets)
+    # datasets bundled with the package are not downloaded
+    loaders = [_get_dataset_loader(dataset) for dataset in datasets
+               if _get_dataset_metadata(dataset).source == 'remote']
+    # cached datasets are only memory-mapped, not read
+    kwargs.setdefault('mmap_mode', 'r')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(loader, **kwargs) for loader in loaders]
+    for future in futures:
+        if future.exception() is not None:
+            raise future.exception()
+
+
+def clear_dataset_cache(dataset: str = None):
+    """Remove datasets from the cache of :func:`load_dataset`.
+
+    Parameters
+    ----------
+    dataset: str, default=None
+        Name of the dataset to remove, loaded with any options.
+        If `None`, all datasets are removed.
+    """
+    _dataset_cache.clear(dataset)
+
+
+def set_dataset_cache_max_bytes(max_bytes: int):
+    """Set the maximal total size of datasets in the cache of :func:`load_dataset`.
+
+    Least recently used datasets are removed until cached datasets fit in the new limit.
+
+    Parameters
+    ----------
+    max_bytes: int
+        Maximal total size in bytes. If 0, datasets are not cached.
+    """
+    _dataset_cache.max_bytes = max_bytes
+    _dataset_cache.evict()
 
 
 def get_data_home(data_home: str = None) -> str:
@@ -128,33 +277,221 @@ def load_csv_dataset_from_resources(file_name, resources_module=RESOURCES_DATASE
         The first column is the x-variable and the second column is the y-variable.
 
     """
-    data_path = resources.files(resources_module) / file_name
-    data_file = np.loadtxt(data_path, delimiter=',', dtype=np.float64)
+    with resources.as_file(resources.files(resources_module) / file_name) as data_path:
+        data_file = read_csv(data_path)
     if unpack_dataset_columns:
         return data_file[:, 0], data_file[:, 1]
     else:
         return data_file
 
 
-def _sha256(path):
-    """Calculate the sha256 hash of the file at path."""
-    sha256hash = hashlib.sha256()
-    chunk_size = 8192
-    with open(path, "rb") as f:
+class _CsvStreamParser:
+    """Parse CSV file with float values from consecutive chunks of its bytes, optionally compressed with gzip.
+
+    Complete lines are parsed with :func:`~traffic_weaver.readers.read_csv` in blocks of at least
+    `block_size` bytes, and appended to a float64 buffer that grows geometrically.
+    """
+
+    def __init__(self, gzip=False, block_size=2 ** 20):
+        self.gzip = gzip
+        self.block_size = block_size
+        self.reset()
+
+    def reset(self):
+        """Discard all data parsed so far."""
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if self.gzip else None
+        self._in_member = False
+        self._pending = []
+        self._pending_size = 0
+        self._buffer = None
+        self._nr_of_rows = 0
+
+    def update(self, data):
+        """Parse the next chunk of bytes."""
+        if self._decompressor is not None:
+            data = self._decompress(data)
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.block_size:
+            pending = b''.join(self._pending)
+            end = pending.rfind(b'\n') + 1
+            self._pending = [pending[end:]]
+            self._pending_size = len(pending) - end
+            self._parse(pending[:end])
+
+    def result(self):
+        """Parse remaining bytes and return parsed array of shape (nr_of_rows, nr_of_columns)."""
+        if self._in_member:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        self._parse(b''.join(self._pending))
+        self._pending = []
+        self._pending_size = 0
+        if self._buffer is None:
+            return np.empty((0, 2), dtype=np.float64)
+        # shrink without copying, the buffer is not referenced elsewhere
+        self._buffer.resize((self._nr_of_rows, self._buffer.shape[1]), refcheck=False)
+        dataset, self._buffer = self._buffer, None
+        return dataset
+
+    def _decompress(self, data):
+        # file can consist of many concatenated gzip members
+        decompressed = []
+        while data:
+            decompressed.append(self._decompressor.decompress(data))
+            self._in_member = not self._decompressor.eof
+            if self._in_member:
+                break
+            data = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        return b''.join(decompressed)
+
+    def _parse(self, lines):
+        if not lines.strip():
+            return
+        rows = read_csv(io.BytesIO(lines))
+        if len(rows) == 0:
+            return
+        if self._buffer is None:
+            self._buffer = np.empty((len(rows), rows.shape[1]), dtype=np.float64)
+        elif self._nr_of_rows + len(rows) > len(self._buffer):
+            capacity = max(2 * len(self._buffer), self._nr_of_rows + len(rows))
+            self._buffer.resize((capacity, self._buffer.shape[1]), refcheck=False)
+        self._buffer[self._nr_of_rows:self._nr_of_rows + len(rows)] = rows
+        self._nr_of_rows += len(rows)
+
+
+def _lock_file(f):
+    """Wait until the exclusive lock of the open file is acquired."""
+    if os.name == 'nt':
+        import msvcrt
         while True:
-            buffer = f.read(chunk_size)
-            if not buffer:
+            try:
+                # retries for 10 seconds before raising an error
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+@contextmanager
+def _exclusive_lock(lock_file_path):
+    """Hold an exclusive lock of `lock_file_path`, shared by threads and processes.
+
+    Lock file is created if it does not exist, and removed when the lock is released.
+    """
+    while True:
+        f = open(lock_file_path, 'a')
+        _lock_file(f)
+        try:
+            # lock file could be removed by the previous holder while waiting for the lock
+            if path.samestat(os.fstat(f.fileno()), os.stat(lock_file_path)):
                 break
+        except FileNotFoundError:
+            pass
+        f.close()
+    try:
+        yield
+    finally:
+        if os.name == 'nt':
+            # open files cannot be removed on Windows, the file is closed first, and if another
+            # thread or process has already opened it, removal fails and it is left for the next holder
+            f.close()
+        try:
+            os.remove(lock_file_path)
+        except OSError:
+            pass
+        # on POSIX, the file is removed before the lock is released, so the next holder does not
+        # lock the removed file while another one locks a new file
+        f.close()
+
+
+def _read_local(file_path, sha256hash, chunk_size=2 ** 16, parser=None):
+    """Pass content of local file_path to sha256hash and parser, and return its size."""
+    size = 0
+    with open(file_path, "rb") as f:
+        for buffer in iter(lambda: f.read(chunk_size), b''):
             sha256hash.update(buffer)
+            if parser is not None:
+                parser.update(buffer)
+            size += len(buffer)
+    return size
+
+
+def _download(url, file_path, chunk_size=2 ** 16, parser=None):
+    """Download url into file_path and return its SHA256 checksum.
+
+    If `file_path` already exists, it is treated as partially downloaded file and
+    only the remaining bytes are requested with HTTP Range header. If the server
+    does not support ranges, the whole file is downloaded again.
+    Checksum is calculated from the data while it is written.
+    If `parser` is given, the data is also passed to it, so the file is downloaded,
+    hashed and parsed in a single pass.
+    """
+    sha256hash = hashlib.sha256()
+    if parser is not None:
+        parser.reset()
+    offset = 0
+    if path.exists(file_path):
+        offset = _read_local(file_path, sha256hash, chunk_size=chunk_size, parser=parser)
+
+    request = Request(url, headers={'Range': f'bytes={offset}-'} if offset > 0 else {})
+    try:
+        response = urlopen(request)
+    except HTTPError as e:
+        # range starting at the end of the file, it has been already downloaded
+        if e.code == 416 and offset > 0:
+            return sha256hash.hexdigest()
+        raise
+
+    with response:
+        if offset > 0 and response.status != 206:
+            sha256hash = hashlib.sha256()
+            if parser is not None:
+                parser.reset()
+            offset = 0
+        with open(file_path, "ab" if offset > 0 else "wb") as f:
+            for buffer in iter(lambda: response.read(chunk_size), b''):
+                sha256hash.update(buffer)
+                if parser is not None:
+                    parser.update(buffer)
+                f.write(buffer)
+        # reading closed connection does not raise an error, even if not all bytes were received
+        remaining = getattr(response, 'length', None)
+        if remaining:
+            raise IncompleteRead(b'', remaining)
     return sha256hash.hexdigest()
 
 
-def _fetch_remote(remote: RemoteFileMetadata, dirname=None, n_retries=3, delay=1.0, validate_checksum=True):
+def _is_valid_local(remote, file_path, validate_checksum, parser):
+    """Check checksum of the local file downloaded from remote, passing its content to the parser."""
+    if parser is None and not validate_checksum:
+        return True
+    sha256hash = hashlib.sha256()
+    if parser is not None:
+        parser.reset()
+    try:
+        _read_local(file_path, sha256hash, parser=parser)
+    except FileNotFoundError:
+        # file was removed after it was parsed by the thread or process that downloaded it
+        return False
+    return not validate_checksum or sha256hash.hexdigest() == remote.checksum
+
+
+def _fetch_remote(remote: RemoteFileMetadata, dirname=None, n_retries=3, delay=1.0, validate_checksum=True,
+                  parser=None):
     """Download remote dataset into path.
 
     Fetch a dataset pointed by remote's url, save into path using remote's filename and
     ensure integrity based on the SHA256 Checksum of the downloaded file.
 
+    The file is downloaded to a `.part` file, which is renamed after successful download.
+    Download is resumed from the `.part` file left by failed attempts, also in previous calls.
+    Only one thread or process downloads the file at once, the others wait for it,
+    and use the downloaded file if it is still present and valid.
+
     Parameters
     ----------
     remote: RemoteFileMetadata
@@ -172,41 +509,72 @@ def _fetch_remote(remote: RemoteFileMetadata, dirname=None, n_retries=3, delay=1
     validate_checksum: bool, default=True
         If True, check the SHA256 checksum of the downloaded file.
 
+    parser: _CsvStreamParser, default=None
+        If given, downloaded data is parsed with it while it is written,
+        and the parsed dataset is available from its `result` method.
+
     Returns
     -------
     file_path: str
         Full path of the created file.
     """
     file_path = remote.filename if dirname is None else path.join(dirname, remote.filename)
+    part_file_path = file_path + '.part'
 
-    while True:
-        try:
-            urlretrieve(remote.url, file_path)
-            break
-        except (URLError, TimeoutError):
-            if n_retries == 0:
-                # If no more retries are left, re-raise the caught exception.
-                raise
-            warnings.warn(f"Retry downloading from url: {remote.url}")
-            n_retries -= 1
-            time.sleep(delay)
-
-    if validate_checksum:
-        checksum = _sha256(file_path)
-        if remote.checksum != checksum:
+    # other threads and processes downloading the same file wait, so they do not append to the same part file
+    with _exclusive_lock(part_file_path + '.lock'):
+        if path.exists(file_path) and _is_valid_local(remote, file_path, validate_checksum, parser):
+            return file_path
+        while True:
+            try:
+                checksum = _download(remote.url, part_file_path, parser=parser)
+                break
+            except (URLError, TimeoutError, ConnectionError, IncompleteRead):
+                if n_retries == 0:
+                    # If no more retries are left, re-raise the caught exception.
+                    raise
+                warnings.warn(f"Retry downloading from url: {remote.url}")
+                n_retries -= 1
+                time.sleep(delay)
+
+        if validate_checksum and remote.checksum != checksum:
+            os.remove(part_file_path)
             raise OSError("{} has an SHA256 checksum ({}) "
                           "differing from expected ({}), "
                           "file may be corrupted.".format(file_path, checksum, remote.checksum))
-    return file_path
+        os.replace(part_file_path, file_path)
+        return file_path
+
+
+def _save_npy_cache(dataset, dataset_file_path):
+    """Save dataset to `.npy` cache file, replacing it atomically."""
+    with TemporaryDirectory(dir=path.dirname(dataset_file_path)) as tmp_dir:
+        dataset_tmp_file_path = path.join(tmp_dir, path.basename(dataset_file_path))
+        np.save(dataset_tmp_file_path, dataset)
+        os.replace(dataset_tmp_file_path, dataset_file_path)
+
+
+def _convert_pickle_cache(pickle_file_path, dataset_file_path):
+    """Convert dataset cached in pickle format by previous versions to `.npy` cache and remove the pickle."""
+    try:
+        if not path.exists(dataset_file_path):
+            logger.info(f"Converting cached {pickle_file_path} to .npy format")
+            with open(pickle_file_path, "rb") as f:
+                _save_npy_cache(pickle.load(f), dataset_file_path)
+        os.remove(pickle_file_path)
+    except FileNotFoundError:
+        # pickle was converted at the same time by another process
+        pass
 
 
 def load_csv_dataset_from_remote(remote: RemoteFileMetadata, dataset_filename, dataset_folder, data_home=None,
                                  download_if_missing: bool = True, download_even_if_available: bool = False,
                                  validate_checksum: bool = True, n_retries=3, delay=1.0, gzip=False,
-                                 unpack_dataset_columns=False, ):
+                                 unpack_dataset_columns=False, mmap_mode=None):
     """
     Load a dataset from a remote location in csv.gz format.
-    After downloading the dataset it is stored in the cache folder for further use in pickle format.
+    After downloading the dataset it is stored in the cache folder for further use in `.npy` format.
+    Cache stored by previous versions in pickle format is converted to `.npy` format on the first load.
 
     Parameters
     ----------
@@ -233,6 +601,10 @@ def load_csv_dataset_from_remote(remote: RemoteFileMetadata, dataset_filename, d
         If True, the file is assumed to be compressed in gzip format in the remote.
     unpack_dataset_columns: bool, default=False
         If True, the dataset is unpacked to two separate arrays x and y.
+    mmap_mode: {None, 'r', 'r+', 'c'}, default=None
+        If not None, the cached dataset is memory-mapped with the given mode,
+        see :func:`numpy.load`. Memory-mapped dataset is read from disk on access,
+        and its pages are shared by all processes loading it.
 
     Returns
     -------
@@ -243,28 +615,37 @@ def load_csv_dataset_from_remote(remote: RemoteFileMetadata, dataset_filename, d
     data_home = get_data_home(data_home)
 
     dataset_dir = path.join(data_home, dataset_folder)
-    dataset_file_path = path.join(dataset_dir, dataset_filename)
+    dataset_file_path = path.join(dataset_dir, dataset_filename + '.npy')
+    pickle_file_path = path.join(dataset_dir, dataset_filename)
+
+    if path.exists(pickle_file_path):
+        _convert_pickle_cache(pickle_file_path, dataset_file_path)
 
     available = path.exists(dataset_file_path)
 
     dataset = None
     if (download_if_missing and not available) or (download_if_missing and download_even_if_available and available):
         os.makedirs(dataset_dir, exist_ok=True)
-        with TemporaryDirectory(dir=dataset_dir) as tmp_dir:
-            logger.info(f"Downloading {remote.url}")
-            archive_path = _fetch_remote(remote, dirname=tmp_dir, n_retries=n_retries, delay=delay,
-                                         validate_checksum=validate_checksum)
-            if gzip:
-                dataset = np.loadtxt(GzipFile(filename=archive_path), delimiter=',', dtype=np.float64)
-            else:
-                dataset = np.loadtxt(archive_path, delimiter=',', dtype=np.float64)
-            dataset_tmp_file_path = path.join(tmp_dir, dataset_filename)
-            pickle.dump(dataset, open(dataset_tmp_file_path, "wb"))
-            os.rename(dataset_tmp_file_path, dataset_file_path)
+        logger.info(f"Downloading {remote.url}")
+        # partially downloaded file is kept in the dataset directory to resume the download later,
+        # the file is parsed while it is downloaded, without reading it again
+        parser = _CsvStreamParser(gzip=gzip)
+        archive_path = _fetch_remote(remote, dirname=dataset_dir, n_retries=n_retries, delay=delay,
+                                     validate_checksum=validate_checksum, parser=parser)
+        try:
+            dataset = parser.result()
+        finally:
+            try:
+                os.remove(archive_path)
+            except OSError:
+                # file downloaded at the same time by another process was removed by it,
+                # or on Windows, it is still read by that process
+                pass
+        _save_npy_cache(dataset, dataset_file_path)
     elif not available and not download_if_missing:
         raise OSError("Data not found and `download_if_missing` is False")
-    if dataset is None:
-        dataset = pickle.load(open(dataset_file_path, "rb"))
+    if dataset is None or mmap_mode is not None:
+        dataset = np.load(dataset_file_path, mmap_mode=mmap_mode)
     if unpack_dataset_columns:
         return dataset[:, 0], dataset[:, 1]
     else:
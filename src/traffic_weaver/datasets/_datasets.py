@@ -1,78 +1,23 @@
-# @formatter:off
-# flake8: noqa
-from ._sandvine import (
-    sandvine_dataset_description,
-    load_sandvine_audio,
-    load_sandvine_cloud,
-    load_sandvine_file_sharing,
-    load_sandvine_fixed_social_media,
-    load_sandvine_gaming,
-    load_sandvine_marketplace,
-    load_sandvine_measurements,
-    load_sandvine_messaging,
-    load_sandvine_mobile_messaging,
-    load_sandvine_mobile_social_media,
-    load_sandvine_mobile_video,
-    load_sandvine_mobile_youtube,
-    load_sandvine_mobile_zoom,
-    load_sandvine_snapchat,
-    load_sandvine_social_networking,
-    load_sandvine_tiktok,
-    load_sandvine_video_streaming,
-    load_sandvine_vpn_and_security,
-    load_sandvine_web,
-)
+"""Loading functions of datasets used by previous versions.
 
-from ._mix_it import (
-    mix_it_dataset_description,
-    fetch_mix_it_bologna_daily,
-    fetch_mix_it_bologna_monthly,
-    fetch_mix_it_bologna_weekly,
-    fetch_mix_it_bologna_yearly,
-    fetch_mix_it_milan_daily,
-    fetch_mix_it_milan_weekly,
-    fetch_mix_it_milan_monthly,
-    fetch_mix_it_milan_yearly,
-    fetch_mix_it_palermo_daily,
-    fetch_mix_it_palermo_weekly,
-    fetch_mix_it_palermo_monthly,
-    fetch_mix_it_palermo_yearly,
-)
+Functions `load_<dataset>` of bundled datasets and `fetch_<dataset>` of remote datasets,
+e.g., `load_sandvine_audio` or `fetch_ams_ix_daily`, are created from
+:data:`~traffic_weaver.datasets._registry.DATASETS` on access.
+Use :func:`~traffic_weaver.datasets.load_dataset` instead.
+"""
+from ._base import _get_dataset_loader
+from ._registry import DATASETS
 
-from ._ams_ix import (
-    ams_ix_dataset_description,
-    fetch_ams_ix_yearly_by_day,
-    fetch_ams_ix_daily,
-    fetch_ams_ix_monthly,
-    fetch_ams_ix_weekly,
-    fetch_ams_ix_yearly_input,
-    fetch_ams_ix_yearly_output,
-    fetch_ams_ix_grx_yearly_by_day,
-    fetch_ams_ix_grx_daily,
-    fetch_ams_ix_grx_monthly,
-    fetch_ams_ix_grx_weekly,
-    fetch_ams_ix_grx_yearly_input,
-    fetch_ams_ix_grx_yearly_output,
-    fetch_ams_ix_i_ipx_diameter_daily,
-    fetch_ams_ix_i_ipx_diameter_monthly,
-    fetch_ams_ix_i_ipx_diameter_weekly,
-    fetch_ams_ix_i_ipx_diameter_yearly_input,
-    fetch_ams_ix_i_ipx_diameter_yearly_output,
-    fetch_ams_ix_i_ipx_yearly_by_day,
-    fetch_ams_ix_i_ipx_daily,
-    fetch_ams_ix_i_ipx_monthly,
-    fetch_ams_ix_i_ipx_weekly,
-    fetch_ams_ix_i_ipx_yearly_input,
-    fetch_ams_ix_i_ipx_yearly_output,
-    fetch_ams_ix_isp_yearly_by_day,
-    fetch_ams_ix_isp_daily,
-    fetch_ams_ix_isp_monthly,
-    fetch_ams_ix_isp_weekly,
-    fetch_ams_ix_isp_yearly_input,
-    fetch_ams_ix_isp_yearly_output,
-    fetch_ams_ix_nawas_anti_ddos_daily,
-    fetch_ams_ix_nawas_anti_ddos_monthly,
-    fetch_ams_ix_nawas_anti_ddos_weekly,
-    fetch_ams_ix_nawas_anti_ddos_yearly_input,
-    fetch_ams_ix_nawas_anti_ddos_yearly_output,
-)
+_PREFIXES = {'resources': 'load_', 'remote': 'fetch_'}
+
+
+def __getattr__(name):
+    for prefix in _PREFIXES.values():
+        dataset = name[len(prefix):]
+        if name.startswith(prefix) and dataset in DATASETS and _PREFIXES[DATASETS[dataset].source] == prefix:
+            return _get_dataset_loader(dataset)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + [_PREFIXES[metadata.source] + dataset for dataset, metadata in DATASETS.items()])
@@ -0,0 +1,210 @@
+r"""Registry of datasets loaded with :func:`~traffic_weaver.datasets.load_dataset`.
+
+Each dataset is described by a single entry of :data:`DATASETS`, mapping its name
+to the source of the dataset, the folder and file name it is stored in,
+the URL and SHA256 checksum of remote datasets, and whether they are compressed with gzip.
+
+Bundled datasets are stored in `folder` of `traffic_weaver.datasets.data` resources.
+Remote datasets are downloaded from `url` and cached as `filename` in `folder` of the data home,
+see :func:`~traffic_weaver.datasets.get_data_home`.
+
+Names of datasets are lowercase with words separated with underscores.
+Hyphens in the name passed to :func:`~traffic_weaver.datasets.load_dataset` are treated as underscores.
+"""
+from collections import namedtuple
+
+DatasetMetadata = namedtuple("DatasetMetadata", ["source", "folder", "filename", "url", "checksum", "gzip"])
+
+_FIGSHARE_URL = 'https://figshare.com/ndownloader/files/'
+
+
+def _resource(folder, filename):
+    return DatasetMetadata(source='resources', folder=folder, filename=filename, url=None, checksum=None, gzip=False)
+
+
+def _remote(folder, filename, url, checksum, gzip=False):
+    return DatasetMetadata(source='remote', folder=folder, filename=filename, url=url, checksum=checksum, gzip=gzip)
+
+
+# @formatter:off
+DATASETS = {
+    'sandvine_audio': _resource('sandvine', 'audio.csv'),
+    'sandvine_cloud': _resource('sandvine', 'cloud.csv'),
+    'sandvine_file_sharing': _resource('sandvine', 'file_sharing.csv'),
+    'sandvine_fixed_social_media': _resource('sandvine', 'fixed_social_media.csv'),
+    'sandvine_gaming': _resource('sandvine', 'gaming.csv'),
+    'sandvine_marketplace': _resource('sandvine', 'marketplace.csv'),
+    'sandvine_measurements': _resource('sandvine', 'measurements.csv'),
+    'sandvine_messaging': _resource('sandvine', 'messaging.csv'),
+    'sandvine_mobile_messaging': _resource('sandvine', 'mobile_messaging.csv'),
+    'sandvine_mobile_social_media': _resource('sandvine', 'mobile_social_media.csv'),
+    'sandvine_mobile_video': _resource('sandvine', 'mobile_video.csv'),
+    'sandvine_mobile_youtube': _resource('sandvine', 'mobile_youtube.csv'),
+    'sandvine_mobile_zoom': _resource('sandvine', 'mobile_zoom.csv'),
+    'sandvine_snapchat': _resource('sandvine', 'snapchat.csv'),
+    'sandvine_social_networking': _resource('sandvine', 'social_networking.csv'),
+    'sandvine_tiktok': _resource('sandvine', 'tiktok.csv'),
+    'sandvine_video_streaming': _resource('sandvine', 'video_streaming.csv'),
+    'sandvine_vpn_and_security': _resource('sandvine', 'vpn_and_security.csv'),
+    'sandvine_web': _resource('sandvine', 'web.csv'),
+
+    'mix_it_bologna_daily': _remote('mix-it', 'mix-it-bologna_daily', _FIGSHARE_URL + '49543767',
+                                    '9f0970dfeca937818f40eab2fbc62c72a4270b6d93d4b2b9d91e3db0f6092c2a'),
+    'mix_it_bologna_weekly': _remote('mix-it', 'mix-it-bologna_weekly', _FIGSHARE_URL + '49543773',
+                                     'b852c310c6f543659e7fa194d19c3a6cadd7de6b47f184843909acfee98cb781'),
+    'mix_it_bologna_monthly': _remote('mix-it', 'mix-it-bologna_monthly', _FIGSHARE_URL + '49543770',
+                                      'e29881dc7c44782da783f70d9123548c4aeb75bdcd82f31e6d8622d51617db99'),
+    'mix_it_bologna_yearly': _remote('mix-it', 'mix-it-bologna_yearly', _FIGSHARE_URL + '49543776',
+                                     '0cbd8c03d46f0ae76ab958fca384f3d5692fefcbbb4c99995d17d5a86e5bd401'),
+    'mix_it_milan_daily': _remote('mix-it', 'mix-it-milan_daily', _FIGSHARE_URL + '49543779',
+                                  'fbd873d3f91896d992508b00f42c98ac44d1a03ad42551fb09903168831e42f1'),
+    'mix_it_milan_weekly': _remote('mix-it', 'mix-it-milan_weekly', _FIGSHARE_URL + '49543788',
+                                   'a38147bb0a4d857ac80f6440f64d7c5983faf326bae6433cad7a4b05fa98afab'),
+    'mix_it_milan_monthly': _remote('mix-it', 'mix-it-milan_monthly', _FIGSHARE_URL + '49543782',
+                                    '30d6b7c5b8bbfbff92992052cde3ac9ed3b31aa47103fd5fdc6ab34a6ca9ef59'),
+    'mix_it_milan_yearly': _remote('mix-it', 'mix-it-milan_yearly', _FIGSHARE_URL + '49543791',
+                                   'd3d925d1ffae871a65a7ef4f158722953352cc5f2e0a4165880c69115c56f17c'),
+    'mix_it_palermo_daily': _remote('mix-it', 'mix-it-palermo_daily', _FIGSHARE_URL + '49543794',
+                                    '3b1f43504f26c38e5c81247da20ce9194fc138ecb4e549f3c3af35d9bc60fb9e'),
+    'mix_it_palermo_weekly': _remote('mix-it', 'mix-it-palermo_weekly', _FIGSHARE_URL + '49543800',
+                                     'a239292b440a6f9cf6f4ce1b5b8766164c6aafca9b12f5352fb56247bc9a28ce'),
+    'mix_it_palermo_monthly': _remote('mix-it', 'mix-it-palermo_monthly', _FIGSHARE_URL + '49543797',
+                                      '8b94d22ef455ba61d16557b2c587db7aee030e052da7c8c3da9507a5f1074e6b'),
+    'mix_it_palermo_yearly': _remote('mix-it', 'mix-it-palermo_yearly', _FIGSHARE_URL + '49543803',
+                                     'b3f0d9240803edfa6000086df38613b719b85eaa9c39d5f031fdfb3c9bee3e4f'),
+
+    'ams_ix_yearly_by_day': _remote('ams-ix', 'ams-ix-yearly-by-day', _FIGSHARE_URL + '49549962',
+                                    '56d31d4f0469599a80b5e952d484fe7b6fde8aec0a88ae6fc35e8b450e078447'),
+    'ams_ix_daily': _remote('ams-ix', 'ams-ix_daily', _FIGSHARE_URL + '49549860',
+                            '2f606b0adecbbae50727539cebd2d107c6d5a962298d34cbeb1bf4b7cab0d3a9'),
+    'ams_ix_weekly': _remote('ams-ix', 'ams-ix_weekly', _FIGSHARE_URL + '49549866',
+                             '2273530aeca328721764491d770a8259b255df5c028c899aa5c6c3b2001e33f4'),
+    'ams_ix_monthly': _remote('ams-ix', 'ams-ix_monthly', _FIGSHARE_URL + '49549863',
+                              'a8aeaabbd9089bf25455ab8d164f69a868032f7f0ba2c1a771bf5d04a2e16581'),
+    'ams_ix_yearly_input': _remote('ams-ix', 'ams-ix_yearly_input', _FIGSHARE_URL + '49549869',
+                                   '19fe5560606477ccacead54a993e856be45d59b5beb1dab819b612a437a301d3'),
+    'ams_ix_yearly_output': _remote('ams-ix', 'ams-ix_yearly_output', _FIGSHARE_URL + '49549872',
+                                    '9f67208e8b6155634bb517d78c796e5344c1400d174e8ab62a65580a24b553f5'),
+    'ams_ix_isp_yearly_by_day': _remote('ams-ix', 'ams-ix-isp-yearly-by-day', _FIGSHARE_URL + '49549941',
+                                        'd9efb4dd7158c223c45ea2c66f2455ed2f15c5a94d8db437ad0cc6e29c8b0e03'),
+    'ams_ix_isp_daily': _remote('ams-ix', 'ams-ix-isp_daily', _FIGSHARE_URL + '49549926',
+                                'b839bef4522fdfd19eee291f713834caf812a1da20d871adb429b03c10c3b692'),
+    'ams_ix_isp_weekly': _remote('ams-ix', 'ams-ix-isp_weekly', _FIGSHARE_URL + '49549929',
+                                 '02ec0fbe6fdd0429ef79427a9b3c1210a0e912cb8b2d146305fdab35c9c22928'),
+    'ams_ix_isp_monthly': _remote('ams-ix', 'ams-ix-isp_monthly', _FIGSHARE_URL + '49549932',
+                                  '11cb8057c1984072285c841553e478cacb0672e9153e4d72930c5af40c899875'),
+    'ams_ix_isp_yearly_input': _remote('ams-ix', 'ams-ix-isp_yearly_input', _FIGSHARE_URL + '49549935',
+                                       'd6cac12520f3ebcb33b04e2a096106b42fa082510187f83d36e53dd4a81d96a0'),
+    'ams_ix_isp_yearly_output': _remote('ams-ix', 'ams-ix-isp_yearly_output', _FIGSHARE_URL + '49549938',
+                                        'b7ec0614c03704388528005be5899948a84a70c418c3fd7de8bddc1d0d4db0c1'),
+    'ams_ix_grx_yearly_by_day': _remote('ams-ix', 'ams-ix-grx-yearly-by-day', _FIGSHARE_URL + '49549890',
+                                        'aff17528c4b3855cfb52bc42d1d67c1cb8d24fc44153f6def0febe30ce7c5892'),
+    'ams_ix_grx_daily': _remote('ams-ix', 'ams-ix-grx_daily', _FIGSHARE_URL + '49549875',
+                                'cc69b78859fcf8a328bde5cf407decf01493930efa1d31397af56b8060895c15'),
+    'ams_ix_grx_weekly': _remote('ams-ix', 'ams-ix-grx_monthly', _FIGSHARE_URL + '49549881',
+                                 'e7b2afd06e4e5302ad9745cf6887ee73f76d09cce8ba10167b2152630e544058'),
+    'ams_ix_grx_monthly': _remote('ams-ix', 'ams-ix-grx_monthly', _FIGSHARE_URL + '49549878',
+                                  '4a9e45d2bf647c6eba6b2550c2d7b06da363e736a8d801763dba5244ed8f491d'),
+    'ams_ix_grx_yearly_input': _remote('ams-ix', 'ams-ix-grx_yearly_input', _FIGSHARE_URL + '49549884',
+                                       'e06a0ab9073057e618e7d41cf3cb4171650ee22bd5411a9bc95cd25104c44bc4'),
+    'ams_ix_grx_yearly_output': _remote('ams-ix', 'ams-ix-grx_yearly_output', _FIGSHARE_URL + '49549887',
+                                        'e2d2b1dda84328effca9b461f07a99afd598a6a13011a2c41338bf5a347c5d70'),
+    'ams_ix_i_ipx_yearly_by_day': _remote('ams-ix', 'ams-ix-i-ipx-yearly-by-day', _FIGSHARE_URL + '49549917',
+                                          'eee61d792e8427e5d4ea55b7e881acd646c676a8681270b63485102ca4062ebf'),
+    'ams_ix_i_ipx_daily': _remote('ams-ix', 'ams-ix-i-ipx_daily', _FIGSHARE_URL + '49549893',
+                                  'd9752817c7b635dab6cddd329e0d4238d7e94199de242d9d3327208c77cd3aa2'),
+    'ams_ix_i_ipx_weekly': _remote('ams-ix', 'ams-ix-i-ipx_weekly', _FIGSHARE_URL + '49549896',
+                                   '13e4cc3bb2124e03c58066e25d4beac8a323c7cfde6ad2ec6219d8798b81f69c'),
+    'ams_ix_i_ipx_monthly': _remote('ams-ix', 'ams-ix-i-ipx_monthly', _FIGSHARE_URL + '49549899',
+                                    '665b8841c0858e86db9aa8144d9404c175754055da5d1d23047f77f850c5a7ff'),
+    'ams_ix_i_ipx_yearly_input': _remote('ams-ix', 'ams-ix-i-ipx_yearly_input', _FIGSHARE_URL + '49549902',
+                                         '8549d3cd62a3b8074aac82450676fe359bcc679c897c487a8519322123f4bd93'),
+    'ams_ix_i_ipx_yearly_output': _remote('ams-ix', 'ams-ix-i-ipx_yearly_output', _FIGSHARE_URL + '49549905',
+                                          '450f50f262543c266503de7f89c9c5c5b07fdb5e40c0c39e82600e47e5d41ff8'),
+    'ams_ix_i_ipx_diameter_daily': _remote('ams-ix', 'ams-ix-i-ipx-diameter_daily', _FIGSHARE_URL + '49549908',
+                                           'abbe54c558d3cc954f361d7f5eab66c194ec6f0866332410386ab39678ee15c2'),
+    'ams_ix_i_ipx_diameter_weekly': _remote('ams-ix', './ams-ix-i-ipx-diameter_weekly', _FIGSHARE_URL + '49549914',
+                                            '2b5b622d041c4ad1f0e282420620b96da9ddee01c14eaf4457319515bbb1d286'),
+    'ams_ix_i_ipx_diameter_monthly': _remote('ams-ix', 'ams-ix-i-ipx-diameter_monthly', _FIGSHARE_URL + '49549911',
+                                             'cebf44d0c585a0685e3446af44d001bddf36e975f8963f60fb36d0c0583eb82b'),
+    'ams_ix_i_ipx_diameter_yearly_input': _remote('ams-ix', 'ams-ix-i-ipx-diameter_yearly_input.csv',
+                                                  _FIGSHARE_URL + '49549920',
+                                                  'eba37cdf6131d6d9ddd668e919ab5ef5f222171cf3f33170b9aa9af158e9025e'),
+    'ams_ix_i_ipx_diameter_yearly_output': _remote('ams-ix', 'ams-ix-i-ipx-diameter_yearly_output.csv',
+                                                   _FIGSHARE_URL + '49549923',
+                                                   '1a098f35c6b541569f0a5e3cbec5cafc020b98b038e0a3f2276de1b30231aed1'),
+    'ams_ix_nawas_anti_ddos_daily': _remote('ams-ix', 'ams-ix-nawas-anti-ddos_daily', _FIGSHARE_URL + '49549944',
+                                            '89682274e43228392120f1c28aaad1e2daa8c3781d1667944d7156e73c4363e2'),
+    'ams_ix_nawas_anti_ddos_weekly': _remote('ams-ix', 'ams-ix-nawas-anti-ddos_weekly', _FIGSHARE_URL + '49549950',
+                                             '1b70c8e7701d2fe6a5d737c3b46cfeeff1db1d577fe06ff67cefba788bdb807b'),
+    'ams_ix_nawas_anti_ddos_monthly': _remote('ams-ix', 'ams-ix-nawas-anti-ddos_monthly', _FIGSHARE_URL + '49549947',
+                                              '3d8332ac9761751604ce9f21ff03152a6051d8e2e7a3de512fb1cb3869746f36'),
+    'ams_ix_nawas_anti_ddos_yearly_input': _remote('ams-ix', 'ams-ix-nawas-anti-ddos_yearly_input',
+                                                   _FIGSHARE_URL + '49549953',
+                                                   '3cc39c26e667b09c1eae6e31665867e1aa89dbb9e614660a7705a385222734d1'),
+    'ams_ix_nawas_anti_ddos_yearly_output': _remote('ams-ix', 'ams-ix-nawas-anti-ddos_yearly_output',
+                                                    _FIGSHARE_URL + '49549956',
+                                                    'fa4f9c6e887aa9ecf1e98df856a894b125e892e773129a6e632549248f338776'),
+
+    'ix_br_aggregated_daily': _remote('ix-br', 'ix-br-aggregated_daily', _FIGSHARE_URL + '49549854',
+                                      '23ab0b2acca20587a4946b748e0013125f7a5ab575a6974437019a1916b565ed'),
+    'ix_br_aggregated_weekly': _remote('ix-br', 'ix-br-aggregated_weekly', _FIGSHARE_URL + '49549977',
+                                       '47ce1cfd63642a280eaa0710b3c9709fb80379eee28025925db45044f8e08afd'),
+    'ix_br_aggregated_monthly': _remote('ix-br', 'ix-br-aggregated_monthly', _FIGSHARE_URL + '49549974',
+                                        '24075687089ff5160abca7641aa9cef33098083e8a1e54171f542757ee9cab66'),
+    'ix_br_aggregated_yearly': _remote('ix-br', 'ix-br-aggregated_yearly', _FIGSHARE_URL + '49549980',
+                                       '13125805a7861db559fb193360f9d674abb5012cfac9868abf79effb583776d9'),
+    'ix_br_aggregated_decadely': _remote('ix-br', 'ix-br-aggregated_decadely', _FIGSHARE_URL + '49549971',
+                                         '30f574bf5f4da536b391e076c7cd68a7d39e198731ec95d82d85100152dfc2de'),
+    'ix_br_aracaju_daily': _remote('ix-br', 'ix-br-aracaju_daily', _FIGSHARE_URL + '49549983',
+                                   '6c022b25d8010d04dac176cce5e5f07e76e3269bd93b8fd27ef1ed87d0c0cde1'),
+    'ix_br_aracaju_weekly': _remote('ix-br', 'ix-br-aracaju_weekly', _FIGSHARE_URL + '49549992',
+                                    '149726b299f6338cb0f39265bc05e6ae71139901d5550baa167a6ab32fc12b89'),
+    'ix_br_aracaju_monthly': _remote('ix-br', 'ix-br-aracaju_monthly', _FIGSHARE_URL + '49549989',
+                                     'cc02eec0b2bde6134ad1ff0415826afc4d5ef55cad0844708d08e622b7ad3722'),
+    'ix_br_aracaju_yearly': _remote('ix-br', 'ix-br-aracaju_yearly', _FIGSHARE_URL + '49549995',
+                                    '608c51e6a21cca05836147785a57b21c462d42578dbbb43eb79178c347567002'),
+    'ix_br_aracaju_decadely': _remote('ix-br', 'ix-br-aracaju_decadely', _FIGSHARE_URL + '49549986',
+                                      'cec057400047245346128b8e2e55baf2be2d3ffb2e1d549c4e0467617f415f18'),
+    'ix_br_belem_daily': _remote('ix-br', 'ix-br-belem_daily', _FIGSHARE_URL + '49549998',
+                                 'ccf95b1cd4d3a4b16f848d90804702273a7f040cfc88fc6908d6caa1949fa6d5'),
+    'ix_br_belem_weekly': _remote('ix-br', 'ix-br-belem_weekly', _FIGSHARE_URL + '49550007',
+                                  '37f0e66e05faf35801d1a32cfe0145ac90ba482aa6ddf77e75e8d1323f3651a3'),
+    'ix_br_belem_monthly': _remote('ix-br', 'ix-br-belem_monthly', _FIGSHARE_URL + '49550004',
+                                   '1561895e780328580366e93ad07483878604752881f34e04c9a65534471ef383'),
+    'ix_br_belem_yearly': _remote('ix-br', 'ix-br-belem_yearly', _FIGSHARE_URL + '49550013',
+                                  'c511fcbe8e7b29c5ab6e147848f8c81641095eacd8072fc955df83475cf6f281'),
+    'ix_br_belem_decadely': _remote('ix-br', 'ix-br-belem_decadely', _FIGSHARE_URL + '49550001',
+                                    'd503b3c04a887cfeaa532fe972f69d31c1749aa709d1d5df0cabcd82a50ce994'),
+    'ix_br_brasilia_daily': _remote('ix-br', 'ix-br-brasilia_daily', _FIGSHARE_URL + '49550010',
+                                    '4c4a508ca7260e0503f3315bdf986e0ea9b3571656a15e9d9236b50e538fb028'),
+    'ix_br_brasilia_weekly': _remote('ix-br', 'ix-br-brasilia_weekly', _FIGSHARE_URL + '49550019',
+                                     'fb335060052e889e485cd5468dd02ad371f8fbecdcce2023a460640ddb2ca46f'),
+    'ix_br_brasilia_monthly': _remote('ix-br', 'ix-br-brasilia_monthly', _FIGSHARE_URL + '49550022',
+                                      '929406c9b8642ab9ed98974a5242400a70fb1cdf96823de567b9e7d908d41b0b'),
+    'ix_br_brasilia_yearly': _remote('ix-br', 'ix-br-brasilia_yearly', _FIGSHARE_URL + '49550025',
+                                     'bc80492a41164a8f8c0213e460e6dca40476e4ee798cff2d8ea2fad605cf8d2f'),
+    'ix_br_brasilia_decadely': _remote('ix-br', 'ix-br-brasilia_decadely', _FIGSHARE_URL + '49550016',
+                                       '161acfe24a14634375024e430586bb53ad4069bf08fadcea1c048f063b15b1bd'),
+    'ix_br_curitiba_daily': _remote('ix-br', 'ix-br-curitiba_daily', _FIGSHARE_URL + '49550028',
+                                    'fa8d19c7aef870259922cd0dc44a51056ee58503d4f52892483bd6acd0dad405'),
+    'ix_br_curitiba_weekly': _remote('ix-br', 'ix-br-curitiba_weekly', _FIGSHARE_URL + '49550037',
+                                     '8811ea7780a2987d4f46270674f1b24a36b888c1ec827985a0e41f3aaa85b57f'),
+    'ix_br_curitiba_monthly': _remote('ix-br', 'ix-br-curitiba_monthly', _FIGSHARE_URL + '49550034',
+                                      '7f30955046e7faed1b3eaa081ed8a25fcfab2b17050574c08b5548297b459d61'),
+    'ix_br_curitiba_yearly': _remote('ix-br', 'ix-br-curitiba_yearly', _FIGSHARE_URL + '49550040',
+                                     'ce58090551837acc96a268a51c858932cbed3fa048162d98649791861b46f4d5'),
+    'ix_br_curitiba_decadely': _remote('ix-br', 'ix-br-curitiba_decadely', _FIGSHARE_URL + '49550031',
+                                       '157103122da83f3b98f407d47fc550ea29fde7f5656879724b45762ec017b80a'),
+    'ix_br_rio_de_janeiro_daily': _remote('ix-br', 'ix-br-rio-de-janeiro_daily', _FIGSHARE_URL + '49550043',
+                                          'b8afdc89de49cacb0d067c0f01d2a963f3459c9774ea5f40e8aed5821f272904'),
+    'ix_br_rio_de_janeiro_weekly': _remote('ix-br', 'ix-br-rio-de-janeiro_weekly', _FIGSHARE_URL + '49550055',
+                                           '1b189a5ee6b81782ca41a5e602fe7178c6588fca3129639738e920a037884688'),
+    'ix_br_rio_de_janeiro_monthly': _remote('ix-br', 'ix-br-rio-de-janeiro_monthly', _FIGSHARE_URL + '49550049',
+                                            'a9efe70a794e226e4cbe3844ea707277c47d1bdbee078ebbd62881ee8eef3154'),
+    'ix_br_rio_de_janeiro_yearly': _remote('ix-br', 'ix-br-rio-de-janeiro_yearly', _FIGSHARE_URL + '49550052',
+                                           '052a944f403b579c4613f6a27353898f9f201eea3802b5a21f634f7883cfde00'),
+    'ix_br_rio_de_janeiro_decadely': _remote('ix-br', 'ix-br-rio-de-janeiro_decadely', _FIGSHARE_URL + '49550046',
+                                             'f683308bc8ac7907668c0a6dc3f09fc6ebb4b12cba5cc726424cd5c68ec2455d'),
+}
+# @formatter:on
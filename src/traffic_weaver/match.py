@@ -2,7 +2,7 @@ import warnings
 
 import numpy as np
 
-from .process import spline_smooth
+from .process import _spline_smooth_along_last_axis
 from .sorted_array_utils import find_closest_element_indices_to_values, integral, sum_over_indices
 
 
@@ -34,13 +34,14 @@ def integral_matching_reference_stretch(x, y, x_ref, y_ref, fixed_points_in_x=No
     ----------
     1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
-        Dependent variable.
+    y: array-like of shape (n, ) or (n_series, n)
+        Dependent variable. If 2-D, each row is stretched to match the corresponding
+        row of `y_ref`, sharing the fixed points and the weights calculated from `x`.
     x_ref: 1-D array-like of size m
         Independent variable in strictly increasing order of the reference function.
         Its size should be lower than size of `x`, and it should contain only subset
         of points of `x`.
-    y_ref: 1-D array-like of size m
+    y_ref: array-like of shape (m, ) or (n_series, m)
         Dependent variable of reference function.
     fixed_points_in_x: array-like, optional
         Points that should not be moved.
@@ -73,7 +74,7 @@ def integral_matching_reference_stretch(x, y, x_ref, y_ref, fixed_points_in_x=No
     Returns
     -------
     ndarray
-        of shape (n, ).
+        of shape (n, ) or (n_series, n).
         Stretched function matching integral value of reference function.
 
     Examples
@@ -86,6 +87,13 @@ def integral_matching_reference_stretch(x, y, x_ref, y_ref, fixed_points_in_x=No
     >>> x_ref = np.array([0, 1, 2, 3])
     >>> integral_matching_reference_stretch(x, y, x_ref, y_ref, reference_function_integral_method='trapezoid', s=0.0)
     array([1. , 3.5, 2. , 4. , 3. , 4. , 4. ])
+
+    Many series can be stretched at once.
+
+    >>> integral_matching_reference_stretch(x, [y, y + 1], x_ref, [y_ref, y_ref + 1],
+    ...                                     reference_function_integral_method='trapezoid')
+    array([[1. , 3.5, 2. , 4. , 3. , 4. , 4. ],
+           [2. , 4.5, 3. , 5. , 4. , 5. , 5. ]])
     """
     x, y, x_ref, y_ref = np.asarray(x), np.asarray(y), np.asarray(x_ref), np.asarray(y_ref)
 
@@ -131,7 +139,178 @@ def integral_matching_reference_stretch(x, y, x_ref, y_ref, fixed_points_in_x=No
     res_y = _interval_integral_matching_stretch(x, y, integral_values=integral_values,
                                                 integral_method=target_function_integral_method,
                                                 fixed_points_indices_in_x=fixed_points_indices_in_x, alpha=alpha)
-    return res_y if s is None else spline_smooth(x, res_y, s)(x)
+    return res_y if s is None else _spline_smooth_along_last_axis(x, res_y, s)
+
+
+def integral_matching_reference_stretch_iter(chunks, x_ref, y_ref, fixed_points_finding_strategy: str = 'closest',
+                                             target_function_integral_method: str = 'trapezoid',
+                                             reference_function_integral_method: str = 'rectangle', alpha=1.0):
+    r"""Stretch function given in consecutive chunks to match integrals in reference.
+
+    Streaming counterpart of :func:`integral_matching_reference_stretch`
+    with default fixed points, i.e., points in `x` closest to the points in `x_ref`.
+    Chunks are buffered until fixed points of the reference points they cover are
+    found, and matched intervals are yielded. Only the points after the last found
+    fixed point are kept between chunks, so memory is bounded by the chunk size
+    and the distance between fixed points. Concatenated results are equal to
+    the result of :func:`integral_matching_reference_stretch`.
+
+    Parameters
+    ----------
+    chunks: Iterable[tuple[ndarray, ndarray]]
+        Consecutive chunks `(x, y)` of the target function, e.g., from
+        :func:`~traffic_weaver.rfa.AbstractRFA.rfa_iter`. `y` of each chunk is
+        of shape `(len(x), )` or `(n_series, len(x))`.
+        The function should be sampled more densely than the reference function.
+    x_ref: 1-D array-like of size m
+        Independent variable in strictly increasing order of the reference function.
+    y_ref: array-like of shape (m, ) or (n_series, m)
+        Dependent variable of reference function.
+    fixed_points_finding_strategy: str, default: 'closest'
+        Strategy to find fixed points.
+        Available options:
+        'closest': closest element (lower or higher)
+        'lower': closest lower or equal element
+        'higher': closest higher or equal element
+    target_function_integral_method: str, default: 'trapezoid'
+        Method to calculate integral of target function.
+        Available options: 'trapezoid', 'rectangle'
+    reference_function_integral_method: str, default: 'rectangle'
+        Method to calculate integral of reference function.
+        Available options: 'trapezoid', 'rectangle'
+    alpha: scalar, default: 1
+        Stretching exponent factor.
+
+    Yields
+    ------
+    x: ndarray
+        Independent variable of the matched chunk.
+    y: ndarray
+        Stretched function of the matched chunk.
+
+    See Also
+    --------
+    :func:`~traffic_weaver.match.integral_matching_reference_stretch`
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from traffic_weaver.match import integral_matching_reference_stretch_iter
+    >>> from traffic_weaver.rfa import ExpAdaptiveRFA
+    >>> x, y = np.arange(10), np.array([1, 3, 4, 1, 2, 5, 6, 2, 2, 1])
+    >>> rfa = ExpAdaptiveRFA(x, y, 8)
+    >>> chunks = list(integral_matching_reference_stretch_iter(rfa.rfa_iter(chunk_intervals=3), x, y))
+    >>> res_y = np.concatenate([chunk_y for _, chunk_y in chunks])
+    >>> np.allclose(integral_matching_reference_stretch(*rfa.rfa(), x, y), res_y)
+    True
+    """
+    x_ref, y_ref = np.asarray(x_ref), np.asarray(y_ref)
+    integral_values = integral(x_ref, y_ref, reference_function_integral_method)
+
+    buffer_x, buffer_y = None, None
+    # number of reference points with found fixed point and number of matched intervals
+    nr_of_found, nr_of_matched = 0, 0
+    found_first = False
+    chunks = iter(chunks)
+    while True:
+        chunk = next(chunks, None)
+        if chunk is not None:
+            chunk_x, chunk_y = np.asarray(chunk[0]), np.asarray(chunk[1], dtype=float)
+            if buffer_x is None:
+                buffer_x, buffer_y = chunk_x, chunk_y
+            else:
+                buffer_x = np.concatenate([buffer_x, chunk_x])
+                buffer_y = np.concatenate([buffer_y, chunk_y], axis=-1)
+            if len(buffer_x) == 0:
+                continue
+            # fixed point is known if there is a point in `x` higher or equal to the reference point
+            nr_of_settled = np.searchsorted(x_ref, buffer_x[-1], side='right')
+        elif buffer_x is None:
+            return
+        else:
+            nr_of_settled = len(x_ref)
+
+        fixed_points = find_closest_element_indices_to_values(buffer_x, x_ref[nr_of_found:nr_of_settled],
+                                                              strategy=fixed_points_finding_strategy)
+        nr_of_found = nr_of_settled
+        if found_first:
+            # the last fixed point of previous chunks is the first point of the buffer
+            fixed_points = np.append(fixed_points, 0)
+        fixed_points = np.unique(fixed_points)
+
+        if len(fixed_points) > 0:
+            start, end = fixed_points[0], fixed_points[-1]
+            if not found_first and start > 0:
+                yield buffer_x[:start], buffer_y[..., :start]
+            found_first = True
+
+            if end > start:
+                values = integral_values[..., nr_of_matched:nr_of_matched + len(fixed_points) - 1]
+                nr_of_matched += len(fixed_points) - 1
+                res_y = _interval_integral_matching_stretch(buffer_x[start:end + 1], buffer_y[..., start:end + 1],
+                                                            integral_values=values,
+                                                            fixed_points_indices_in_x=fixed_points - start,
+                                                            integral_method=target_function_integral_method,
+                                                            alpha=alpha)
+                yield buffer_x[start:end], res_y[..., :-1]
+                # the last fixed point is moved by its interval, next interval starts from it
+                buffer_x, buffer_y = buffer_x[end:], buffer_y[..., end:].copy()
+                buffer_y[..., 0] = res_y[..., -1]
+            else:
+                buffer_x, buffer_y = buffer_x[start:], buffer_y[..., start:]
+
+        if chunk is None:
+            yield buffer_x, buffer_y
+            return
+
+
+def _integral_matching_stretch_weights(x, integral_method='trapezoid', alpha=1.0):
+    r"""Shifting factors of the points and their integral used to stretch function over `x`.
+
+    Weights depend only on `x`, so they can be shared by all series evaluated in `x`.
+
+    Parameters
+    ----------
+    x: array-like of shape (n, ) or (n_intervals, n)
+        Independent variable in strictly increasing order.
+        If 2-D, each row is a separate interval.
+    integral_method: str, default='trapezoid'
+        Method to calculate integral of target function.
+        Available options: 'trapezoid', 'rectangle'
+    alpha: scalar, default: 1
+        Stretching exponent factor.
+
+    Returns
+    -------
+    ndarray
+        of shape (n, ) or (n_intervals, n).
+        Shifting factor :math:`w_i` of each point.
+    float | ndarray
+        Integral of the shifting factors (in each interval), i.e., :math:`\Delta P / \hat{y}`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> _integral_matching_stretch_weights(np.array([0, 1, 2, 3, 4]))
+    (array([0. , 0.5, 1. , 0.5, 0. ]), 2.0)
+    """
+    if integral_method not in ['trapezoid', 'rectangle']:
+        raise ValueError("Unknown integral method")
+
+    x_n2 = (x[..., -1:] + x[..., :1]) / 2
+
+    delta_x = x[..., -1:] - x[..., :1]
+    delta_xi = np.diff(x)
+
+    # if there are only two points - set weights to 1
+    if x.shape[-1] == 2:
+        w = np.ones(x.shape)
+    else:
+        w = 1 - (2 * np.abs(x_n2 - x) / delta_x) ** alpha
+
+    if integral_method == 'trapezoid':
+        return w, np.sum((w[..., 1:] + w[..., :-1]) * delta_xi, axis=-1) / 2
+    return w, np.sum(w[..., :-1] * delta_xi, axis=-1)
 
 
 def _integral_matching_stretch(x, y, integral_value=0, integral_method='trapezoid', dx=1.0, alpha=1.0, s=None):
@@ -150,10 +329,10 @@ def _integral_matching_stretch(x, y, integral_value=0, integral_method='trapezoi
     x: 1-D array-like of size n, optional
         Independent variable in strictly increasing order.
         If passed None, it is evenly spaced `dx` apart.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable.
-    integral_value: float, default: 0
-        Target integral value.
+    integral_value: float | 1-D array-like of size n_series, default: 0
+        Target integral value (of each series).
     integral_method: str, default='trapezoid'
         Method to calculate integral of target function.
         Available options: 'trapezoid', 'rectangle'
@@ -172,7 +351,7 @@ def _integral_matching_stretch(x, y, integral_value=0, integral_method='trapezoi
     Returns
     -------
     ndarray
-        of shape (n, ).
+        of shape (n, ) or (n_series, n).
         Stretched function matching integral value.
 
     Notes
@@ -234,35 +413,19 @@ def _integral_matching_stretch(x, y, integral_value=0, integral_method='trapezoi
     """
     y = np.array(y)
     if x is None:
-        x = np.arange(len(y) * dx, step=dx)
+        x = np.arange(y.shape[-1] * dx, step=dx)
     else:
         x = np.array(x)
 
-    if integral_method not in ['trapezoid', 'rectangle']:
-        raise ValueError("Unknown integral method")
-
-    current_integral = integral(x, y, method=integral_method).sum()
-
-    delta_p = integral_value - current_integral
-    x_n2 = (x[-1] + x[0]) / 2
-
-    delta_x = x[-1] - x[0]
-    delta_xi = np.diff(x)
+    w, w_integral = _integral_matching_stretch_weights(x, integral_method=integral_method, alpha=alpha)
 
-    # if there are only two points - set weights to 1
-    if len(x) == 2:
-        w = np.array([1., 1.])
-    else:
-        w = 1 - (2 * np.abs(x_n2 - x) / delta_x) ** alpha
+    current_integral = integral(x, y, method=integral_method).sum(axis=-1)
 
-    y_hat = 0
-    if integral_method == 'trapezoid':
-        y_hat = 2 * delta_p / np.sum((w[1:] + w[:-1]) * delta_xi)
-    elif integral_method == 'rectangle':
-        y_hat = delta_p / np.sum(w[:-1] * delta_xi)
+    delta_p = np.asarray(integral_value) - current_integral
+    y_hat = delta_p / w_integral
 
-    res_y = y + y_hat * w
-    return res_y if s is None else spline_smooth(x, res_y, s)(x)
+    res_y = y + np.multiply.outer(y_hat, w)
+    return res_y if s is None else _spline_smooth_along_last_axis(x, res_y, s)
 
 
 def _interval_integral_matching_stretch(x, y, dx=1.0, integral_values=None, fixed_points_indices_in_x=None,
@@ -276,19 +439,27 @@ def _interval_integral_matching_stretch(x, y, dx=1.0, integral_values=None, fixe
     from the interval center. Function integral is numerically approximated on provided points
     according to the 'integral_method'.
 
-    Each period stretch is delegated to `integral_matching_stretch`.
+    Each period is stretched as in `_integral_matching_stretch`, but all periods with
+    the same number of points are stretched at once. If `y` contains many series,
+    each period is stretched in all series at once.
+
+    Consecutive periods share their boundary point, and the stretch of a period moves
+    its last point by (almost) zero, or by the full shift if period contains only two points.
+    The following period is stretched starting from that moved point. To give the same result
+    as stretching periods one by one, shifts of periods whose starting point is moved
+    are recalculated in order in a single pass.
 
     Parameters
     ----------
     x: 1-D array-like of size n, optional
         Independent variable in strictly increasing order.
         If passed None, it is evenly spaced `dx` apart.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable.
     dx : scalar, optional
         The spacing between sample points when `x` is None. By default, it is 1.
     integral_values: list[float] | ndarray, optional
-        Target integral values.
+        Target integral values, of shape (n_intervals, ) or (n_series, n_intervals).
         By default, it is `[0] * (len(interval_points_indices) - 1)`.
         If `interval_point_indices` are not specified, `ValueError` is raised.
     fixed_points_indices_in_x: list[int] | ndarray, optional
@@ -313,12 +484,13 @@ def _interval_integral_matching_stretch(x, y, dx=1.0, integral_values=None, fixe
     Returns
     -------
     ndarray
-        of shape (n, ).
+        of shape (n, ) or (n_series, n).
         Stretched function matching integral value.
     """
+    y = np.array(y, dtype=float)
 
     if x is None:
-        x = np.arange(len(y) * dx, step=dx)
+        x = np.arange(y.shape[-1] * dx, step=dx)
     else:
         x = np.asarray(x)
 
@@ -326,14 +498,53 @@ def _interval_integral_matching_stretch(x, y, dx=1.0, integral_values=None, fixe
         raise ValueError("integral_values and fixed_point_indices_in_x cannot be None at the same time")
     if integral_values is None:
         integral_values = [0] * (len(fixed_points_indices_in_x) - 1)
+    integral_values = np.asarray(integral_values)
     if fixed_points_indices_in_x is None:
-        fixed_points_indices_in_x = np.arange(0, len(y) + 1, int(len(y) / len(integral_values)))
-
-    y = np.array(y, dtype=float)
-
-    for integral_value, start, end in zip(integral_values, fixed_points_indices_in_x[:-1],
-                                          fixed_points_indices_in_x[1:]):
-        end = end + 1
-        y[start:end] = _integral_matching_stretch(x[start:end], y[start:end], integral_value=integral_value,
-                                                  integral_method=integral_method, alpha=alpha)
-    return y if s is None else spline_smooth(x, y, s)(x)
+        n_intervals = integral_values.shape[-1]
+        fixed_points_indices_in_x = np.arange(0, y.shape[-1] + 1, int(y.shape[-1] / n_intervals))
+
+    fixed_points_indices_in_x = np.asarray(fixed_points_indices_in_x, dtype=int)
+    nr_of_intervals = min(len(fixed_points_indices_in_x) - 1, integral_values.shape[-1])
+    starts = fixed_points_indices_in_x[:nr_of_intervals]
+    ends = fixed_points_indices_in_x[1:nr_of_intervals + 1]
+    integral_values = integral_values[..., :nr_of_intervals]
+
+    # group intervals by number of points, each group is stretched as a 2-D array of intervals
+    sizes = ends - starts + 1
+    groups = []
+    w_end = np.empty(nr_of_intervals)
+    w_integrals = np.empty(nr_of_intervals)
+    for size in np.unique(sizes):
+        group = np.flatnonzero(sizes == size)
+        indices = starts[group, np.newaxis] + np.arange(size)
+        w, w_integral = _integral_matching_stretch_weights(x[indices], integral_method=integral_method, alpha=alpha)
+        w_end[group] = w[:, -1]
+        w_integrals[group] = w_integral
+        groups.append((group, indices, w, w_integral))
+
+    # shifts of intervals starting from their original points
+    y_start = y[..., starts]
+    y_hat = np.empty(y.shape[:-1] + (nr_of_intervals,))
+    for group, indices, w, w_integral in groups:
+        # with many series, indexed intervals are not contiguous and would be summed in a different order
+        y_intervals = np.ascontiguousarray(y[..., indices])
+        current_integral = integral(x[indices], y_intervals, method=integral_method).sum(axis=-1)
+        y_hat[..., group] = (integral_values[..., group] - current_integral) / w_integral
+
+    # interval starts from the point moved by the stretch of the previous interval,
+    # they are recalculated in order, so each of them uses the final shift of the previous interval
+    for i in np.flatnonzero(w_end[:-1] != 0) + 1:
+        start, end = starts[i], ends[i] + 1
+        y_start[..., i] = y[..., start] + y_hat[..., i - 1] * w_end[i - 1]
+        y_interval = y[..., start:end].copy()
+        y_interval[..., 0] = y_start[..., i]
+        current_integral = integral(x[start:end], y_interval, method=integral_method).sum(axis=-1)
+        y_hat[..., i] = (integral_values[..., i] - current_integral) / w_integrals[i]
+
+    res_y = y.copy()
+    # starting points are written last as they override ends of the previous intervals
+    for group, indices, w, _ in groups:
+        res_y[..., indices[:, 1:]] = y[..., indices[:, 1:]] + y_hat[..., group, np.newaxis] * w[:, 1:]
+    for group, indices, w, _ in groups:
+        res_y[..., indices[:, 0]] = y_start[..., group] + y_hat[..., group] * w[:, 0]
+    return res_y if s is None else _spline_smooth_along_last_axis(x, res_y, s)
@@ -0,0 +1,140 @@
+r"""Parallel execution of Weaver pipelines over datasets."""
+import os
+
+import numpy as np
+
+from . import datasets as _datasets
+
+
+def _create_untracked_shared_memory(size):
+    r"""Create shared memory block that is not released by resource tracker of the process.
+
+    Block is released by the parent process, so it has to outlive the worker that created it.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    try:
+        # Python >= 3.13
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(create=True, size=size)
+    if os.name == 'posix':
+        # block is registered under its POSIX name, with the leading slash that `name` drops
+        resource_tracker.unregister('/' + shm.name.lstrip('/'), 'shared_memory')
+    return shm
+
+
+def _to_shared_memory(x, y):
+    r"""Copy x and y into a new shared memory block and return its description."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    shm = _create_untracked_shared_memory(max(x.nbytes + y.nbytes, 1))
+    buffer = np.ndarray(x.size + y.size, dtype=np.float64, buffer=shm.buf)
+    buffer[:x.size] = x
+    buffer[x.size:] = y.ravel()
+    del buffer
+    shm.close()
+    return shm.name, x.shape, y.shape
+
+
+def _from_shared_memory(name, x_shape, y_shape):
+    r"""Copy x and y out of the shared memory block and release it."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = np.ndarray(int(np.prod(x_shape)) + int(np.prod(y_shape)), dtype=np.float64, buffer=shm.buf)
+        x = buffer[:int(np.prod(x_shape))].reshape(x_shape).copy()
+        y = buffer[int(np.prod(x_shape)):].reshape(y_shape).copy()
+        del buffer
+    finally:
+        shm.close()
+        shm.unlink()
+    return x, y
+
+
+def _release_shared_memory(name):
+    r"""Release the shared memory block without reading it."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    shm.close()
+    shm.unlink()
+
+
+def _run_pipeline_chunk(pipeline, tasks):
+    r"""Run pipeline on each dataset in the chunk, with a random generator for each of them."""
+    results = []
+    try:
+        for dataset, seed_sequence in tasks:
+            # noise is drawn from the generator of the dataset instead of the global random state
+            rng = np.random.default_rng(seed_sequence)
+            steps = [(name, args, dict(kwargs, rng=rng) if name == 'noise' else kwargs)
+                     for name, args, kwargs in pipeline.steps]
+            x, y = _datasets.load_dataset(dataset, unpack_dataset_columns=True)
+            results.append(_to_shared_memory(*pipeline._run(x, y, steps)))
+    except BaseException:
+        # blocks are not tracked, they have to be released before the error is passed to the parent
+        for name, _, _ in results:
+            _release_shared_memory(name)
+        raise
+    return results
+
+
+def run_pipeline_on_datasets(pipeline, datasets, max_workers=None, chunksize=1, seed=None):
+    r"""Run Weaver pipeline on datasets in parallel processes.
+
+    Each dataset is loaded with :func:`~traffic_weaver.datasets.load_dataset` and processed
+    with :func:`~traffic_weaver.weaver.WeaverPipeline.run` in a separate process.
+    Noise of each dataset is drawn from a random generator created from a seed derived
+    from `seed` and the position of the dataset in `datasets`, so noise does not depend
+    on the number of workers and chunks, and global NumPy random state is not used.
+    Random generator `rng` recorded in :func:`~traffic_weaver.weaver.WeaverPipeline.noise`
+    is replaced by that generator.
+    Results are passed back from workers in shared memory.
+
+    Parameters
+    ----------
+    pipeline: WeaverPipeline
+        Pipeline to run. It has to be picklable, e.g., functions passed to
+        `trend` have to be defined at module level instead of lambdas.
+    datasets: list[str]
+        Names of datasets to process.
+    max_workers: int, optional
+        Number of worker processes. By default, it is the number of processors.
+    chunksize: int, default: 1
+        Number of datasets processed by a worker in a single task.
+    seed: int, optional
+        Seed from which seeds of each dataset are derived.
+        If None, fresh entropy is used.
+
+    Returns
+    -------
+    list[tuple[ndarray, ndarray]]
+        Processed `x` and `y` of each dataset, in the same order as in `datasets`.
+
+    Examples
+    --------
+    >>> from traffic_weaver import WeaverPipeline
+    >>> from traffic_weaver.parallel import run_pipeline_on_datasets
+    >>> pipeline = WeaverPipeline().append_one_sample(make_periodic=True).recreate_from_average(10).noise(40)
+    >>> results = run_pipeline_on_datasets(pipeline, ['sandvine_audio', 'sandvine_cloud'], max_workers=2, seed=0)
+    >>> [res_y.shape for _, res_y in results]
+    [(241,), (241,)]
+    """
+    # multiprocessing is imported only when needed, as it is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = list(zip(datasets, np.random.SeedSequence(seed).spawn(len(datasets))))
+    chunks = [tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_pipeline_chunk, pipeline, chunk) for chunk in chunks]
+
+    # results of all successful chunks are collected, so their shared memory is released
+    blocks = [block for future in futures if future.exception() is None for block in future.result()]
+    results = [_from_shared_memory(*block) for block in blocks]
+    for future in futures:
+        if future.exception() is not None:
+            raise future.exception()
+    return results
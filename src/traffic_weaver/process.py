@@ -2,7 +2,6 @@ r"""Other time series processing."""
 from typing import Callable, Tuple, Union, List
 
 import numpy as np
-from scipy.interpolate import BSpline, splrep, CubicSpline
 
 from traffic_weaver.interval import IntervalArray
 from traffic_weaver.sorted_array_utils import find_closest_lower_equal_element_indices_to_values, \
@@ -56,6 +55,7 @@ def interpolate(x, y, new_x, method='linear', **kwargs):
         The x-coordinates of the data points, must be increasing.
     y: array-like
         The y-coordinates of the data points, same length as x.
+        If 2-D, each row is interpolated separately.
     new_x: array-like
         New x-coordinates at which to evaluate the interpolated values.
     method: str, default='linear'
@@ -77,17 +77,22 @@ def interpolate(x, y, new_x, method='linear', **kwargs):
     `https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.splrep.html#scipy.interpolate.splrep
     <https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.splrep.html#scipy.interpolate.splrep>`_
     """
+    if np.ndim(y) > 1:
+        return np.stack([interpolate(x, y_row, new_x, method=method, **kwargs) for y_row in y])
     if method == 'linear':
         return np.interp(new_x, x, y, **kwargs)
     if method == 'constant':
         return _piecewise_constant_interpolate(x, y, new_x, **kwargs)
     elif method == 'cubic':
+        # scipy is imported only when needed, as it is slow to import
+        from scipy.interpolate import CubicSpline
         return CubicSpline(x, y, **kwargs)(new_x)
     elif method == 'spline':
+        from scipy.interpolate import BSpline, splrep
         return BSpline(*splrep(x, y, **kwargs))(new_x)
 
 
-def repeat(x, y, repeats: int) -> tuple[np.ndarray, np.ndarray]:
+def repeat(x, y, repeats: int, y_as_view=False) -> tuple[np.ndarray, np.ndarray]:
     """Extend time series.
 
     Independent variable is appended with the same spacing,
@@ -97,10 +102,14 @@ def repeat(x, y, repeats: int) -> tuple[np.ndarray, np.ndarray]:
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable.
     repeats: int
         How many times repeat time series.
+    y_as_view: bool, default: False
+        If true, `y` is returned as a read-only view of shape (repeats, n)
+        (or (n_series, repeats, n)) that does not copy the data.
+        It can be materialized with `y.reshape(*y.shape[:-2], -1)`.
 
     Returns
     -------
@@ -108,20 +117,34 @@ def repeat(x, y, repeats: int) -> tuple[np.ndarray, np.ndarray]:
         x, repeated independent variable.
     ndarray
         y, repeated dependent variable.
+
+    Examples
+    --------
+    >>> from traffic_weaver.process import repeat
+    >>> x, y = repeat([0, 1, 3], [1, 2, 3], 3)
+    >>> x
+    array([ 0.,  1.,  3.,  5.,  6.,  8., 10., 11., 13.])
+    >>> y
+    array([1., 2., 3., 1., 2., 3., 1., 2., 3.])
+    >>> _, y = repeat([0, 1, 3], [1, 2, 3], 3, y_as_view=True)
+    >>> y
+    array([[1., 2., 3.],
+           [1., 2., 3.],
+           [1., 2., 3.]])
     """
     x = np.asanyarray(x, dtype=float)
     y = np.asanyarray(y, dtype=float)
-    n = len(x)
-    y = np.tile(y, repeats)
-    x = np.tile(x, repeats)
-    for i in range(1, repeats):
-        previous_range_diff = x[n * i - 1] - x[0] + (x[n * i - 1] - x[n * i - 2])
-        x[n * i : n * (i + 1)] += previous_range_diff
-    return x, y
+    # range of x with the spacing of the last sample
+    period = x[-1] - x[0] + (x[-1] - x[-2] if len(x) > 1 else 0)
+    offsets = np.arange(repeats)[:, np.newaxis] * period
+    new_x = np.empty((repeats, len(x)))
+    np.add(x, offsets, out=new_x)
+    new_y = np.broadcast_to(y[..., np.newaxis, :], y.shape[:-1] + (repeats, y.shape[-1]))
+    return new_x.ravel(), new_y if y_as_view else new_y.reshape(y.shape[:-1] + (-1,))
 
 
 def trend(
-    x, y, fun: Callable[[np.ndarray], np.ndarray], normalized=False
+    x, y, fun: Callable[[np.ndarray], np.ndarray], normalized=False, vectorized=True, out=None
 ) -> Tuple[np.ndarray, np.ndarray]:
     r"""Apply long-term trend to time series data using provided function.
 
@@ -129,7 +152,7 @@ def trend(
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable.
     fun: Callable
         Long term trend applied to the data in form of a function.
@@ -138,6 +161,14 @@ def trend(
         `y_shift` is independent variable shift for that `x`.
     normalized: bool, default: False
         If true, `x` variable in `fun` is normalized to the range of [0, 1].
+    vectorized: bool, default: True
+        If true, `fun` is called once with the whole `x` array.
+        If it raises `TypeError` or `ValueError`, or does not return a value
+        for each `x`, it is called separately for each element of `x`.
+        If false, `fun` is always called for each element of `x`.
+    out: np.ndarray, optional
+        Float array to which shifted dependent variable is written. It can be `y` itself.
+        By default, a new array is created.
 
     Returns
     -------
@@ -145,16 +176,40 @@ def trend(
         x, independent variable.
     ndarray
         y, shifted dependent variable.
+
+    Examples
+    --------
+    >>> import math
+    >>> from traffic_weaver.process import trend
+    >>> x, y = trend([0, 1, 2], [1, 1, 1], lambda x: 2 * x)
+    >>> y
+    array([1., 3., 5.])
+    >>> # functions working on scalars only are called for each element
+    >>> x, y = trend([0, 1, 2], [1, 1, 1], lambda x: math.sqrt(x) if x > 0 else 0)
+    >>> y
+    array([1.        , 2.        , 2.41421356])
     """
     x = np.asarray(x, dtype=np.float64)
     y = np.asarray(y, dtype=np.float64)
+    if out is None:
+        out = y.copy()
+    elif out is not y:
+        out[...] = y
     range_x = x[-1] - x[0]
+    if vectorized:
+        try:
+            shift = np.asarray(fun(x / range_x if normalized else x))
+        except (TypeError, ValueError):
+            shift = None
+        if shift is not None and shift.shape == x.shape:
+            out += shift
+            return x, out
     for i in range(len(x)):
         if normalized:
-            y[i] += fun(x[i] / range_x)
+            out[..., i] += fun(x[i] / range_x)
         else:
-            y[i] += fun(x[i])
-    return x, y
+            out[..., i] += fun(x[i])
+    return x, out
 
 
 def linear_trend(x, y, a, normalized=False):
@@ -214,12 +269,19 @@ def spline_smooth(x: np.ndarray, y: np.ndarray, s=None):
     where :math:`m` is the number of samples and :math:`\sigma` is the estimated
     standard deviation.
     """
+    from scipy.interpolate import BSpline, splrep
+
     if s is None:
         s = len(y) * np.std(y) ** 2
     return BSpline(*splrep(x, y, s=s))
 
 
-def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0):
+def _spline_smooth_along_last_axis(x, y, s):
+    r"""Smooth each series in `y` with spline function evaluated in `x`."""
+    return np.apply_along_axis(lambda y_row: spline_smooth(x, y_row, s)(x), -1, y)
+
+
+def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0, out=None, rng=None, axis=None):
     r"""Add gaussian noise to the signal.
 
     Add noise targeting provided `snr` value. If `snr` is not specified,
@@ -228,7 +290,7 @@ def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0):
     Parameters
     ----------
     a: np.ndarray
-        Signal for which noise is inserted.
+        Signal for which noise is inserted. If 2-D, each row is a separate signal.
     snr: float | list[float] | ndarray[float], optional
         Signal-to-noise ratio; if `snr_in_db` is True, either is treated
         in decibels or linear values. It can be provided as scalar or list of floats.
@@ -239,6 +301,19 @@ def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0):
         Determines whether treat `snr` in decibels or linear.
     std: float, default=1.0
         Standard deviation of the noise. Used if `snr` is not provided.
+    out: np.ndarray, optional
+        Array to which noised signal is written. It can be `a` itself.
+    rng: np.random.Generator | np.random.SeedSequence | int | list, optional
+        Random generator, or seed to create one with :func:`numpy.random.default_rng`,
+        used to draw the noise. If None, global NumPy random state is used.
+        Independent generators for many tasks can be spawned from a single
+        :class:`numpy.random.SeedSequence`. If 2-D `a` is given with a list
+        of generators, noise of each row is drawn from the corresponding generator.
+    axis: int, optional
+        Axis along which signal power is calculated, e.g., `-1` targets `snr`
+        in each row of 2-D array separately. By default, power of the whole array is used.
+        If `snr` has one dimension less than `a`, it holds a value for each signal,
+        e.g., for each row of 2-D array when `axis` is `-1`.
 
     Returns
     -------
@@ -279,12 +354,28 @@ def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0):
     `https://en.wikipedia.org/wiki/Signal-to-noise_ratio
     <https://en.wikipedia.org/wiki/Signal-to-noise_ratio>`_
 
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from traffic_weaver.process import noise_gauss
+    >>> y = np.ones((3, 5))
+    >>> np.array_equal(noise_gauss(y, snr=10, rng=42), noise_gauss(y, snr=10, rng=np.random.default_rng(42)))
+    True
+    >>> rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(42).spawn(3)]
+    >>> ny = np.stack([noise_gauss(row, snr=10, rng=rng) for row, rng in zip(y, rngs)])
+    >>> rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(42).spawn(3)]
+    >>> np.array_equal(noise_gauss(y, snr=10, rng=rngs), ny)
+    True
+
     """
     a = np.asarray(a)
     if snr is not None:
         if not np.isscalar(snr):
             snr = np.asarray(snr)
-        sp = np.mean(a**2)  # signal power
+            if axis is not None and snr.ndim == a.ndim - 1:
+                # value for each signal, aligned with signal power kept along `axis`
+                snr = np.expand_dims(snr, axis)
+        sp = np.mean(a**2, axis=axis, keepdims=axis is not None)  # signal power
 
         if snr_in_db is True:
             std_n = (sp / (10 ** (snr / 10))) ** 0.5
@@ -293,8 +384,25 @@ def noise_gauss(a: Union[np.ndarray, List], snr=None, snr_in_db=True, std=1.0):
     else:
         std_n = std
 
-    noise = np.random.normal(loc=0, scale=std_n, size=a.shape)
-    return a + noise
+    if rng is None:
+        noise = np.random.normal(loc=0, scale=std_n, size=a.shape)
+        return np.add(a, noise, out=out)
+
+    if isinstance(rng, (list, tuple)) and (a.ndim != 2 or len(rng) != len(a)):
+        raise ValueError("List of generators requires 2-D signal with a row for each generator.")
+    # draw noise directly into `out` if it can be used as a buffer, otherwise allocate one
+    if (isinstance(out, np.ndarray) and out.dtype == np.float64 and out.shape == a.shape
+            and out.flags.c_contiguous and not np.shares_memory(out, a)):
+        noise = out
+    else:
+        noise = np.empty(a.shape, dtype=np.float64)
+    if isinstance(rng, (list, tuple)):
+        for row_noise, row_rng in zip(noise, rng):
+            np.random.default_rng(row_rng).standard_normal(out=row_noise)
+    else:
+        np.random.default_rng(rng).standard_normal(out=noise)
+    noise *= std_n
+    return np.add(a, noise, out=out)
 
 
 def average(x, y, interval):
@@ -328,7 +436,7 @@ def truncate(x, y, x_left, x_right, x_left_as_ratio=False, x_right_as_ratio=Fals
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable
     x_left: float
         Value in x array to which truncate arrays from the left.
@@ -362,10 +470,10 @@ def truncate(x, y, x_left, x_right, x_left_as_ratio=False, x_right_as_ratio=Fals
     left_id = find_closest_lower_equal_element_indices_to_values(x, [x_left], fill_not_valid=True)[0]
 
     right_id = find_closest_higher_equal_element_indices_to_values(x, [x_right], fill_not_valid=True)[0] + 1
-    return x[left_id:right_id], y[left_id:right_id]
+    return x[left_id:right_id], y[..., left_id:right_id]
 
 
-def normalize(a, min_val=0, max_val=1):
+def normalize(a, min_val=0, max_val=1, axis=None):
     """Normalize array to specific range.
 
     Parameters
@@ -376,14 +484,27 @@ def normalize(a, min_val=0, max_val=1):
         Min value to which normalize array values.
     max_val: float, default: 1
         Max value to which normalize array values.
+    axis: int, optional
+        Axis along which min and max values are found, e.g., `-1` normalizes
+        each row of 2-D array separately. By default, the whole array is normalized.
 
     Returns
     -------
     ndarray
         Normalized array.
 
+    Examples
+    --------
+    >>> from traffic_weaver.process import normalize
+    >>> normalize([[0, 1], [2, 4]])
+    array([[0.  , 0.25],
+           [0.5 , 1.  ]])
+    >>> normalize([[0, 1], [2, 4]], axis=-1)
+    array([[0., 1.],
+           [0., 1.]])
+
     """
     a = np.asarray(a)
-    a_min = a.min()
-    a_max = a.max()
+    a_min = a.min(axis=axis, keepdims=True)
+    a_max = a.max(axis=axis, keepdims=True)
     return (a - a_min) / (a_max - a_min) * (max_val - min_val) + min_val
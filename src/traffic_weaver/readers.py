@@ -0,0 +1,97 @@
+r"""Read time series from CSV files.
+
+CSV files contain float values separated with commas, without headers.
+They can be parsed with one of the backends:
+
+- 'pyarrow' -- multithreaded :func:`pyarrow.csv.read_csv`, requires `pyarrow` package,
+- 'numpy' -- :func:`numpy.loadtxt`,
+- 'pandas' -- :func:`pandas.read_csv` with the C engine, requires `pandas` package.
+
+All backends return identical float64 arrays.
+By default, the fastest available backend is used: 'pyarrow' for large files if it
+is installed, otherwise 'numpy'. 'pandas' is slower than 'numpy',
+as its C engine parses floats with correct rounding only in 'round_trip' mode.
+"""
+import os
+
+import numpy as np
+
+BACKENDS = ('pyarrow', 'numpy', 'pandas')
+
+# below this size, the cost of starting pyarrow threads outweighs faster parsing
+_PYARROW_MIN_FILE_SIZE = 2 ** 14
+
+
+def _read_csv_pyarrow(file):
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    table = pv.read_csv(file, read_options=pv.ReadOptions(autogenerate_column_names=True))
+    return np.column_stack([column.cast(pa.float64()).to_numpy() for column in table.columns])
+
+
+def _read_csv_numpy(file):
+    return np.loadtxt(file, delimiter=',', dtype=np.float64, ndmin=2)
+
+
+def _read_csv_pandas(file):
+    import pandas as pd
+
+    return pd.read_csv(file, header=None, dtype=np.float64, engine='c', float_precision='round_trip').to_numpy()
+
+
+_READERS = {'pyarrow': _read_csv_pyarrow, 'numpy': _read_csv_numpy, 'pandas': _read_csv_pandas}
+
+
+def _default_backend(file):
+    r"""Choose 'pyarrow' backend for large files if it is installed, otherwise 'numpy'."""
+    if isinstance(file, (str, os.PathLike)):
+        large = os.path.getsize(file) >= _PYARROW_MIN_FILE_SIZE
+    else:
+        large = len(file.getbuffer()) >= _PYARROW_MIN_FILE_SIZE if hasattr(file, 'getbuffer') else True
+    if large:
+        try:
+            import pyarrow.csv  # noqa: F401
+            return 'pyarrow'
+        except ImportError:
+            pass
+    return 'numpy'
+
+
+def read_csv(file, backend=None):
+    r"""Read CSV file with float values separated with commas, without header.
+
+    Parameters
+    ----------
+    file: str or file-like object
+        Path to CSV file or binary file-like object.
+    backend: {'pyarrow', 'numpy', 'pandas'}, optional
+        Backend used to parse the file. By default, the fastest available backend
+        is chosen based on the size of the file.
+
+    Returns
+    -------
+    ndarray of shape (nr_of_rows, nr_of_columns)
+        Values of the file as float64 array.
+
+    Raises
+    ------
+    ValueError
+        If `backend` is unknown or the file cannot be parsed.
+    ImportError
+        If package required by `backend` is not installed.
+
+    Examples
+    --------
+    >>> import io
+    >>> from traffic_weaver.readers import read_csv
+    >>> read_csv(io.BytesIO(b'0,1.5\n1,2.5\n2,0.5\n'))
+    array([[0. , 1.5],
+           [1. , 2.5],
+           [2. , 0.5]])
+    """
+    if backend is None:
+        backend = _default_backend(file)
+    if backend not in _READERS:
+        raise ValueError(f"Unknown backend '{backend}', available backends: {', '.join(BACKENDS)}.")
+    return _READERS[backend](file)
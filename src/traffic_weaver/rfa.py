@@ -2,14 +2,192 @@ r"""Recreate from average function with given strategy.
 
 """
 
+import copy
 from abc import ABC, abstractmethod
 
 import numpy as np
-from scipy.interpolate import CubicSpline
 
 from .funfit import lin_fit, lin_exp_xy_fit, exp_lin_fit
 from .interval import IntervalArray
-from .sorted_array_utils import (oversample_linspace, oversample_piecewise_constant, )
+from .sorted_array_utils import (oversample_linspace, oversample_piecewise_constant, extend_constant, )
+
+
+def _segment_indices(starts, stops):
+    r"""Flatten index ranges `[starts[j], stops[j])` into one array.
+
+    Ranges with `stops[j] <= starts[j]` are empty.
+
+    Parameters
+    ----------
+    starts: 1-D array of ints
+        Start index (inclusive) of each range.
+    stops: 1-D array of ints
+        Stop index (exclusive) of each range.
+
+    Returns
+    -------
+    ndarray
+        Concatenated indices of all ranges.
+    ndarray
+        Number of range to which each index belongs.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> indices, segments = _segment_indices(np.array([0, 5, 7]), np.array([3, 5, 9]))
+    >>> indices.tolist()
+    [0, 1, 2, 7, 8]
+    >>> segments.tolist()
+    [0, 0, 0, 2, 2]
+    """
+    counts = np.maximum(stops - starts, 0)
+    segments = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return starts[segments] + offsets, segments
+
+
+def _interleave(*arrays):
+    r"""Interleave broadcast arrays along the last axis and flatten them.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> _interleave(np.array([1, 2]), np.array([[3, 4], [5, 6]])).tolist()
+    [1, 3, 2, 4, 1, 5, 2, 6]
+    """
+    return np.stack(np.broadcast_arrays(*arrays), axis=-1).ravel()
+
+
+def _scalar_power(a, alpha):
+    r"""Raise each element of `a` to the power `alpha` with scalar power.
+
+    Array power may use SIMD kernels that differ from scalar power in the last bit,
+    so elements are raised one by one to give the same values as fitting points in a loop.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> _scalar_power(np.array([[1.0, 2.0], [3.0, 4.0]]), 2)
+    array([[ 1.,  4.],
+           [ 9., 16.]])
+    """
+    a = np.asarray(a, dtype=float)
+    return np.array([value ** alpha for value in a.ravel()], dtype=float).reshape(a.shape)
+
+
+def _exp_fit_array(x, xy_0, xy_1, alpha=2.0):
+    r"""Array version of :func:`~traffic_weaver.funfit.exp_fit` giving the same values as scalar one."""
+    x_0, y_0 = xy_0
+    x_1, y_1 = xy_1
+    return y_0 + (y_1 - y_0) * _scalar_power((x - x_0) / (x_1 - x_0), alpha)
+
+
+def _exp_xy_fit_array(x, xy_0, xy_1, alpha=2.0):
+    r"""Array version of :func:`~traffic_weaver.funfit.exp_xy_fit` giving the same values as scalar one."""
+    x_0, y_0 = xy_0
+    x_1, y_1 = xy_1
+    return y_0 + (y_1 - y_0) * (1 - _scalar_power((x_1 - x) / (x_1 - x_0), alpha))
+
+
+def _exp_lin_fit_array(x, xy_0, xy_1, alpha=2.0):
+    r"""Array version of :func:`~traffic_weaver.funfit.exp_lin_fit` giving the same values as scalar one."""
+    x_0, _ = xy_0
+    x_1, _ = xy_1
+    return (lin_fit(x, xy_0, xy_1) * (x - x_0) / (x_1 - x_0)
+            + _exp_fit_array(x, xy_0, xy_1, alpha) * (x_1 - x) / (x_1 - x_0))
+
+
+def _lin_exp_xy_fit_array(x, xy_0, xy_1, alpha=2.0):
+    r"""Array version of :func:`~traffic_weaver.funfit.lin_exp_xy_fit` giving the same values as scalar one."""
+    x_0, _ = xy_0
+    x_1, _ = xy_1
+    return (_exp_xy_fit_array(x, xy_0, xy_1, alpha) * (x - x_0) / (x_1 - x_0)
+            + lin_fit(x, xy_0, xy_1) * (x_1 - x) / (x_1 - x_0))
+
+
+def _fit_segments(x, z, starts, stops, xy_0, xy_1, kinds, fits):
+    r"""Fit values of `z` in many index ranges at once.
+
+    Values `z[starts[j]:stops[j]]` are fitted with function `fits[kinds[j]]` between
+    points `xy_0[j]` and `xy_1[j]`, evaluated at the corresponding `x` values.
+
+    Ranges are applied in the given order, i.e., if ranges overlap, the value from the
+    later range is kept, the same as when fitting them one by one in a loop.
+
+    `z` can hold many series sharing `x` one after another, i.e., index `i` of `z`
+    corresponds to index `i % len(x)` of `x`.
+
+    Parameters
+    ----------
+    x: 1-D array
+        Independent variable.
+    z: 1-D array
+        Dependent variable modified in place.
+    starts: 1-D array of ints
+        Start index (inclusive) of each range.
+    stops: 1-D array of ints
+        Stop index (exclusive) of each range.
+    xy_0: tuple of two 1-D arrays
+        Starting point `(x0, y0)` of each range.
+    xy_1: tuple of two 1-D arrays
+        Ending point `(x1, y1)` of each range.
+    kinds: 1-D array of ints
+        Index of fitting function in `fits` for each range.
+    fits: list of Callable
+        Fitting functions of form `f(x, xy_0, xy_1)`.
+    """
+    indices, segments = _segment_indices(starts, stops)
+    values = np.empty(len(indices))
+    kinds = kinds[segments]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for kind, fit in enumerate(fits):
+            mask = kinds == kind
+            s = segments[mask]
+            values[mask] = fit(x[indices[mask] % len(x)], (xy_0[0][s], xy_0[1][s]), (xy_1[0][s], xy_1[1][s]))
+
+    # keep the last written value for indices fitted more than once
+    if len(indices) > 1 and np.any(np.diff(indices) <= 0):
+        reversed_indices = indices[::-1]
+        _, last = np.unique(reversed_indices, return_index=True)
+        last = len(indices) - 1 - last
+        indices, values = indices[last], values[last]
+    z[indices] = values
+
+
+def _extended_closed_intervals(x, y, n):
+    r"""Extend oversampled `x` and `y` by one interval on both sides and convert them
+    to arrays of closed intervals.
+
+    Parameters
+    ----------
+    x: 1-D array
+        Oversampled independent variable.
+    y: array of shape (..., len(x))
+        Oversampled dependent variable of one or many series.
+    n: int
+        Number of samples in each interval.
+
+    Returns
+    -------
+    ndarray
+        Extended `x`.
+    ndarray
+        Extended `y`.
+    ndarray
+        Extended `x` of shape `(nr_of_intervals, n + 1)`, each row is one interval.
+    ndarray
+        Extended `y` of shape `(..., nr_of_intervals, n + 1)`, each row is one interval.
+
+    See Also
+    --------
+    :func:`~traffic_weaver.interval.IntervalArray.to_2d_array_closed_intervals`
+    """
+    x = IntervalArray(x, n)
+    x.extend_linspace(direction='both')
+    xs = x.to_2d_array_closed_intervals()
+    y = extend_constant(y, n, direction='both')
+    intervals = np.arange(xs.shape[0])[:, np.newaxis] * n + np.arange(n + 1)
+    return x.array, y, xs, y[..., intervals]
 
 
 class AbstractRFA(ABC):
@@ -34,17 +212,34 @@ class AbstractRFA(ABC):
     ----------
     x: 1-D array-like
         Independent variable in strictly increasing order.
-    y: 1-D array-like
-        Dependent variable.
+    y: 1-D array-like or 2-D array-like of shape (n_series, len(x))
+        Dependent variable. If 2-D, each row is a separate series sharing `x`, and
+        `rfa()` returns recreated `y` of shape `(n_series, len(xs))`.
     n: int
         Number of points oversampled and recreated in the function for each interval.
         Cannot be lower than 2.
     **kwargs: dict
         Arbitrary keyword arguments for concrete implementations.
 
+    Raises
+    ------
+    ValueError
+        If `n` is lower than 2 or `y` has more than 2 dimensions.
+
     See Also
     --------
     :func:`~traffic_weaver.interval.IntervalArray`
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from traffic_weaver.rfa import PiecewiseConstantRFA
+    >>> xs, ys = PiecewiseConstantRFA([0, 1, 2], [[1, 2, 3], [4, 5, 6]], 2).rfa()
+    >>> xs
+    array([0. , 0.5, 1. , 1.5, 2. ])
+    >>> ys
+    array([[1., 1., 2., 2., 3.],
+           [4., 4., 5., 5., 6.]])
     """
 
     def __init__(self, x, y, n, **kwargs):
@@ -53,6 +248,8 @@ class AbstractRFA(ABC):
         self.n = n
         if n < 2:
             raise ValueError("n cannot be lower than 2.")
+        if self.y.ndim > 2:
+            raise ValueError("y should be 1-D or 2-D array.")
 
     @abstractmethod
     def rfa(self):
@@ -67,6 +264,86 @@ class AbstractRFA(ABC):
         """
         pass
 
+    def rfa_iter(self, chunk_intervals=1024):
+        r"""Recreate function from average in consecutive chunks of intervals.
+
+        Each chunk is recreated from its intervals and a margin of neighbouring
+        intervals on both sides, so memory is bounded by the chunk size instead of
+        the length of the series. Concatenated chunks are equal to the result of
+        :func:`rfa`.
+
+        Parameters
+        ----------
+        chunk_intervals: int, default: 1024
+            Number of intervals, i.e., points of `x`, recreated in each chunk.
+
+        Yields
+        ------
+        xs: ndarray
+            Oversampled independent variable `x` of the chunk.
+        ys: ndarray
+            Oversampled dependent variable `y` of the chunk.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_intervals` is lower than 1.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from traffic_weaver.rfa import LinearFixedRFA
+        >>> rfa = LinearFixedRFA(np.arange(6), [1, 3, 2, 5, 4, 1], 4)
+        >>> chunks = list(rfa.rfa_iter(chunk_intervals=2))
+        >>> [len(xs) for xs, _ in chunks]
+        [8, 8, 5]
+        >>> np.array_equal(np.concatenate([ys for _, ys in chunks], axis=-1), rfa.rfa()[1])
+        True
+        """
+        if chunk_intervals < 1:
+            raise ValueError("chunk_intervals cannot be lower than 1.")
+        nr_of_points = len(self.x)
+        margin = self._chunk_margin()
+        for start in range(0, nr_of_points, chunk_intervals):
+            stop = min(start + chunk_intervals, nr_of_points)
+            chunk_start = max(start - margin, 0)
+            chunk = copy.copy(self)
+            chunk.x = self.x[chunk_start:min(stop + margin, nr_of_points)]
+            chunk.y = self.y[..., chunk_start:min(stop + margin, nr_of_points)]
+            xs, ys = chunk.rfa()
+            # the last point of the series is a single sample, not a full interval
+            begin = (start - chunk_start) * self.n
+            end = begin + (stop - start) * self.n - (stop == nr_of_points) * (self.n - 1)
+            yield xs[begin:end], ys[..., begin:end]
+
+    def _chunk_margin(self):
+        r"""Number of neighbouring intervals on each side that a recreated interval depends on."""
+        return 1
+
+    def _rfa_each_series(self, rfa):
+        r"""Recreate each series of `y` separately.
+
+        Parameters
+        ----------
+        rfa: Callable[[AbstractRFA], tuple]
+            Recreate method supporting only 1-D `y`, called for each series.
+
+        Returns
+        -------
+        xs: ndarray
+            Oversampled independent variable `x`.
+        ys: ndarray
+            Oversampled dependent variable `y` of the same dimension as `y`.
+        """
+        if self.y.ndim == 1:
+            return rfa(self)
+        xs, ys = self._initial_x_oversample(), []
+        series = copy.copy(self)
+        for series.y in self.y:
+            xs, series_ys = rfa(series)
+            ys.append(series_ys)
+        return xs, np.reshape(ys, (len(self.y), len(xs)))
+
     def _initial_oversample(self):
         r"""Returns initially oversampled tuple"""
         return (self._initial_x_oversample(), self._initial_y_oversample(),)
@@ -121,19 +398,57 @@ class FunctionRFA(AbstractRFA):
         and returning its corresponding value as an output.
     sampling_function_supplier_kwargs: dict, optional
         Kwargs passed to `sampling_function_supplier`.
+    vectorized: bool, default: True
+        If True, sampling function is called once with all oversampled points.
+        It is called for each point separately if it raises `TypeError` or
+        `ValueError`, or does not return a value for each point.
+        If False, sampling function is always called for each point separately.
     """
 
-    def __init__(self, x, y, n, sampling_function_supplier=None, sampling_function_supplier_kwargs=None, ):
+    def __init__(self, x, y, n, sampling_function_supplier=None, sampling_function_supplier_kwargs=None,
+                 vectorized=True):
         super().__init__(x, y, n)
         self.sampling_function_supplier = sampling_function_supplier
         self.sampling_function_supplier_kwargs = (
             sampling_function_supplier_kwargs if sampling_function_supplier_kwargs is not None else {})
+        self.vectorized = vectorized
 
     def rfa(self):
         function = self._get_sampling_function()
-        xs, ys = self._initial_oversample()
-        ys = [function(x) for x in xs]
-        return xs, ys
+        xs = self._initial_x_oversample()
+        return xs, self._sample(function, xs)
+
+    def rfa_iter(self, chunk_intervals=1024):
+        r"""Recreate function from average in consecutive chunks of intervals.
+
+        Sampling function is created once from all points and evaluated on
+        oversampled `x` of each chunk.
+
+        See Also
+        --------
+        :func:`~traffic_weaver.rfa.AbstractRFA.rfa_iter`
+        """
+        if chunk_intervals < 1:
+            raise ValueError("chunk_intervals cannot be lower than 1.")
+        function = self._get_sampling_function()
+        nr_of_points = len(self.x)
+        for start in range(0, nr_of_points, chunk_intervals):
+            stop = min(start + chunk_intervals, nr_of_points)
+            xs = oversample_linspace(self.x[start:stop + 1], num=self.n)
+            if stop < nr_of_points:
+                xs = xs[:-1]
+            yield xs, self._sample(function, xs)
+
+    def _sample(self, function, xs):
+        r"""Evaluate sampling function in oversampled points `xs`."""
+        if self.vectorized:
+            try:
+                ys = np.asarray(function(xs))
+            except (TypeError, ValueError):
+                ys = None
+            if ys is not None and ys.shape == self.y.shape[:-1] + xs.shape:
+                return ys
+        return np.stack([function(x) for x in xs], axis=-1)
 
     def _get_sampling_function(self):
         """Get sampling function.
@@ -147,11 +462,18 @@ class FunctionRFA(AbstractRFA):
             raise ValueError("Sampling function not specified")
 
 
+def _cubic_spline(x, y):
+    r"""Cubic spline through points `(x, y)`, interpolating each series along the last axis of `y`."""
+    # scipy is imported only when needed, as it is slow to import
+    from scipy.interpolate import CubicSpline
+    return CubicSpline(x, y, axis=-1)
+
+
 class CubicSplineRFA(FunctionRFA):
     r"""Recreate function using cubic spline between given points."""
 
-    def __init__(self, x, y, n, sampling_function_supplier=lambda x, y: CubicSpline(x, y), ):
-        super().__init__(x, y, n, sampling_function_supplier)
+    def __init__(self, x, y, n, sampling_function_supplier=_cubic_spline, vectorized=True):
+        super().__init__(x, y, n, sampling_function_supplier, vectorized=vectorized)
 
 
 class IntervalRFA(AbstractRFA):
@@ -184,6 +506,9 @@ class LinearFixedRFA(AbstractRFA):
     a: int, optional
         Transition window samples for moving between intervals.
         If not specified, it is equal to `alpha` * `n`. Cannot be lower than 2.
+    vectorized: bool, default: True
+        If True, all intervals are recreated at once with array operations.
+        If False, intervals are recreated one by one in a loop.
 
     Notes
     -----
@@ -237,7 +562,7 @@ class LinearFixedRFA(AbstractRFA):
     :func:`~traffic_weaver.funfit.lin_fit`
     """
 
-    def __init__(self, x, y, n, alpha=1.0, a=None):
+    def __init__(self, x, y, n, alpha=1.0, a=None, vectorized=True):
         super().__init__(x, y, n)
         if a is None:
             a = alpha * self.n
@@ -246,8 +571,61 @@ class LinearFixedRFA(AbstractRFA):
             self.a = 2
         self.a_l = int(self.a / 2)
         self.a_r = self.a_l
+        self.vectorized = vectorized
 
     def rfa(self):
+        if self.vectorized:
+            return self._rfa_vectorized()
+        return self._rfa_each_series(type(self)._rfa_iterative)
+
+    def _chunk_margin(self):
+        # windows of neighbouring intervals reach into the interval, and each of them
+        # reads samples of the next intervals up to the width of a window
+        return 2 * self._extension_periods() + 1
+
+    def _extension_periods(self):
+        # number of periods that transition windows can reach outside the interval
+        return max(1, int(np.ceil(max(self.a_l, self.a_r) / self.n)))
+
+    def _rfa_vectorized(self):
+        r"""Recreate all intervals at once.
+
+        Each interval is a row of `(nr_of_intervals, n + 1)` array and transition
+        windows are fitted for all rows at once. Gives the same result as
+        :func:`_rfa_iterative`.
+        """
+        x, y = self._initial_oversample()
+        n = self.n
+        a_r = self.a_r
+        a_l = self.a_l
+
+        # transition windows spanning more than one interval
+        if a_l > n or a_r > n:
+            return self._rfa_each_series(type(self)._rfa_iterative)
+
+        x, y, xs, ys = _extended_closed_intervals(x, y, n)
+        prev_xs, cur_xs, next_xs = xs[:-2], xs[1:-1], xs[2:]
+        prev_y, y_0, next_y = ys[..., :-2, :1], ys[..., 1:-1, :1], ys[..., 2:, :1]
+
+        # calculate transition points
+        z_0 = lin_fit(cur_xs[:, :1], (prev_xs[:, n - a_r:n - a_r + 1], prev_y), (cur_xs[:, a_l:a_l + 1], y_0))
+        z_1 = lin_fit(next_xs[:, :1], (cur_xs[:, n - a_r:n - a_r + 1], y_0), (next_xs[:, a_l:a_l + 1], next_y))
+
+        zs = ys[..., 1:-1, :].copy()
+        zs[..., :a_l] = lin_fit(cur_xs[:, :a_l], (cur_xs[:, :1], z_0), (cur_xs[:, a_l:a_l + 1], y_0))
+        zs[..., n - a_r + 1:] = lin_fit(cur_xs[:, n - a_r + 1:], (cur_xs[:, n - a_r:n - a_r + 1], y_0),
+                                        (cur_xs[:, n:], z_1))
+
+        # the last value of each interval is overwritten by the first value of the next one
+        z = y[..., n:-n].astype(float)
+        nr_of_intervals = zs.shape[-2]
+        z[..., :nr_of_intervals * n] = zs[..., :n].reshape(z.shape[:-1] + (-1,))
+        if nr_of_intervals > 0:
+            z[..., -1] = zs[..., -1, n]
+        return x[n:-n], z
+
+    def _rfa_iterative(self):
+        r"""Recreate intervals one by one in a loop."""
         x, y = self._initial_oversample()
         n = self.n
         a_r = self.a_r
@@ -260,14 +638,16 @@ class LinearFixedRFA(AbstractRFA):
         y = IntervalArray(y, n)
         z = IntervalArray(y.array, n)
 
-        # extend with one period on the left and one on the right to make
-        # calculations easier
-        x.extend_linspace(direction='both')
-        y.extend_constant(direction='both')
-        z.extend_constant(direction='both')
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+            y.extend_constant(direction='both')
+            z.extend_constant(direction='both')
 
         # move through each interval
-        for k in range(1, x.nr_of_full_intervals() - 1):
+        for k in range(periods, x.nr_of_full_intervals() - periods):
             # calculate transition points
             y_0 = y[k, 0]
             z_0 = lin_fit(x[k, 0], (x[k, -a_r], y[k - 1, 0]), (x[k, a_l], y[k, 0]), )
@@ -277,7 +657,7 @@ class LinearFixedRFA(AbstractRFA):
                 z[k, i] = lin_fit(x[k, i], (x[k, 0], z_0), (x[k, self.a_l], y_0))
             for i in range(n - self.a_r + 1, n + 1):
                 z[k, i] = lin_fit(x[k, i], (x[k, self.n - self.a_r], y_0), (x[k, self.n], z_1))
-        return x.array[n:-n], z.array[n:-n]
+        return x.array[periods * n:-periods * n], z.array[periods * n:-periods * n]
 
 
 class LinearAdaptiveRFA(AbstractRFA):
@@ -315,7 +695,9 @@ class LinearAdaptiveRFA(AbstractRFA):
     adaptive_smooth: float, default: 1.0
         Decreasing impact of `adaptive_factor` by raising it to the power
         `1/adaptive_smooth`.
-
+    vectorized: bool, default: True
+        If True, all intervals are recreated at once with array operations.
+        If False, intervals are recreated one by one in a loop.
 
     Notes
     -----
@@ -392,7 +774,7 @@ class LinearAdaptiveRFA(AbstractRFA):
     :func:`LinearFixedOversample`
     """
 
-    def __init__(self, x, y, n, alpha=1.0, a=None, adaptive_smooth=1.0):
+    def __init__(self, x, y, n, alpha=1.0, a=None, adaptive_smooth=1.0, vectorized=True):
         super().__init__(x, y, n)
         if a is None:
             a = alpha * self.n
@@ -400,6 +782,7 @@ class LinearAdaptiveRFA(AbstractRFA):
         if self.a < 2:
             self.a = 2
         self.adaptive_smooth = adaptive_smooth
+        self.vectorized = vectorized
 
     @staticmethod
     def get_adaptive_transition_points(x, y, a, adaptive_smooth):
@@ -459,7 +842,138 @@ class LinearAdaptiveRFA(AbstractRFA):
         gammas.extend([None])
         return a_ls, a_rs, gammas
 
+    @staticmethod
+    def get_adaptive_transition_points_array(x, y, a, adaptive_smooth):
+        """Calculate transition points for all intervals at once.
+
+        Array counterpart of :func:`get_adaptive_transition_points`.
+
+        Parameters
+        ----------
+        x: IntervalArray
+            independent variable
+        y: IntervalArray
+            dependent variable, its array can be of shape `(n_series, len(x))`
+            to calculate transition points of many series at once
+        a: int
+            transition window in samples
+        adaptive_smooth: float
+            smoothing of adaptive_factor
+
+        Returns
+        -------
+        ndarray of ints
+            Left transition window for each interval (and series).
+        ndarray of ints
+            Right transition window for each interval (and series).
+        ndarray of floats
+            Adaptive factor for each interval (and series), NaN if it is not defined.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from traffic_weaver.interval import IntervalArray
+        >>> x = IntervalArray(np.arange(12), 2)
+        >>> y = IntervalArray(np.array([1, 1, 1, 1, 3, 3, 6, 6, 6, 6, 6, 6]), 2)
+        >>> a_ls, a_rs, gammas = LinearAdaptiveRFA.get_adaptive_transition_points_array(x, y, 4, 1.0)
+        >>> a_ls.tolist()
+        [1, 0, 2, 2, 0, 1]
+        >>> a_rs.tolist()
+        [1, 2, 1, 0, 0, 1]
+        >>> gammas
+        array([nan, nan, 1.5, nan, nan, nan])
+        """
+        nr_of_full_intervals = x.nr_of_full_intervals()
+        y_0 = y.array[..., :nr_of_full_intervals * y.n:y.n].astype(float)
+        nom = np.abs(y_0[..., 2:] - y_0[..., 1:-1])
+        denom = np.abs(y_0[..., 1:-1] - y_0[..., :-2])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gammas = (nom / denom) ** adaptive_smooth
+            a_ls = np.clip(gammas * a / (1 + gammas), 1, a)
+            a_rs = np.clip(a / (1 + gammas), 1, a)
+
+        constant = (nom == 0) & (denom == 0)
+        left_changing = nom == 0
+        right_changing = denom == 0
+        cases = [constant, left_changing, right_changing]
+        a_ls = np.select(cases, [0, int(a / 2), 0], a_ls).astype(int)
+        a_rs = np.select(cases, [0, 0, int(a / 2)], a_rs).astype(int)
+        gammas = np.where(constant | left_changing | right_changing, np.nan, gammas)
+
+        pad = [(0, 0)] * (y_0.ndim - 1) + [(1, 1)]
+        return (np.pad(a_ls, pad, constant_values=1), np.pad(a_rs, pad, constant_values=1),
+                np.pad(gammas, pad, constant_values=np.nan))
+
     def rfa(self):
+        if self.vectorized:
+            return self._rfa_vectorized()
+        return self._rfa_each_series(type(self)._rfa_iterative)
+
+    def _chunk_margin(self):
+        # windows of neighbouring intervals reach into the interval, each of them reads samples
+        # of the next intervals up to the width of a window, and depends on their average values
+        return 2 * int(np.ceil(self.a / self.n)) + 2
+
+    def _extension_periods(self):
+        # transition windows of the first and the last interval have at most `a / 2` samples,
+        # other windows have at most `a` samples and reach one interval further
+        return max(1, int(np.ceil(self.a / self.n)) - 1)
+
+    def _rfa_vectorized(self):
+        r"""Recreate all intervals at once.
+
+        Computes transition windows, transition values and fitted segments of all
+        intervals as array operations. Gives the same result as :func:`_rfa_iterative`.
+        """
+        x, y = self._initial_oversample()
+        n = self.n
+
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        x = IntervalArray(x, n)
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+        y = IntervalArray(extend_constant(y, periods * n, direction='both'), n)
+        xa = x.array
+        # each series is a row of `z`, rows are fitted as a single flat array
+        ya = np.atleast_2d(y.array)
+        z = ya.astype(float, copy=True)
+        rows = np.arange(len(ya))[:, np.newaxis] * ya.shape[1]
+
+        a_ls, a_rs, gammas = self.get_adaptive_transition_points_array(x, y, self.a, self.adaptive_smooth)
+        a_ls, a_rs = np.atleast_2d(a_ls, a_rs)
+
+        # intervals to recreate and their starting index
+        k = np.arange(periods, x.nr_of_full_intervals() - periods)
+        s = k * n
+        a_l, a_r = a_ls[:, k], a_rs[:, k]
+        y_0 = ya[:, s]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # find transition points
+            z_0 = np.where((a_rs[:, k - 1] == 0) & (a_l == 0), ya[:, s - n],
+                           lin_fit(xa[s], (xa[s - a_rs[:, k - 1]], ya[:, s - n]), (xa[s + a_l], y_0)))
+            # no right transition window reads flat index `k + 1`, same as `y[k + 1]` in the loop
+            z_1 = np.where((a_r == 0) & (a_ls[:, k + 1] == 0), ya[:, k + 1],
+                           lin_fit(xa[s + n], (xa[s + n - a_r], y_0), (xa[s + n + a_ls[:, k + 1]], ya[:, s + n])))
+
+        # fit remaining points, left and right transition window in each interval
+        starts = _interleave(rows + s, rows + s + n - a_r + 1)
+        stops = _interleave(rows + s + a_l, rows + s + n + 1)
+        x_0 = _interleave(xa[s], xa[s + n - a_r])
+        z_l = _interleave(z_0, y_0)
+        x_1 = _interleave(xa[s + a_l], xa[s + n])
+        z_r = _interleave(y_0, z_1)
+
+        _fit_segments(xa, z.reshape(-1), starts, stops, (x_0, z_l), (x_1, z_r), np.zeros(len(starts), dtype=int),
+                      [lin_fit])
+
+        return xa[periods * n:-periods * n], z.reshape(y.array.shape)[..., periods * n:-periods * n]
+
+    def _rfa_iterative(self):
+        r"""Recreate intervals one by one in a loop."""
         x, y = self._initial_oversample()
         n = self.n
 
@@ -470,15 +984,17 @@ class LinearAdaptiveRFA(AbstractRFA):
         y = IntervalArray(y, n)
         z = IntervalArray(y.array, n)
 
-        # extend with one period on the left and one on the right to make
-        # calculations easier
-        x.extend_linspace(direction='both')
-        y.extend_constant(direction='both')
-        z.extend_constant(direction='both')
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+            y.extend_constant(direction='both')
+            z.extend_constant(direction='both')
 
         a_ls, a_rs, gammas = self.get_adaptive_transition_points(x, y, self.a, self.adaptive_smooth)
 
-        for k in range(1, x.nr_of_full_intervals() - 1):
+        for k in range(periods, x.nr_of_full_intervals() - periods):
             y_0 = y[k, 0]
 
             # find transition points
@@ -497,7 +1013,7 @@ class LinearAdaptiveRFA(AbstractRFA):
             for i in range(n - a_rs[k] + 1, n + 1):
                 z[k, i] = lin_fit(x[k, i], (x[k, n - a_rs[k]], y_0), (x[k, n], z_1))
 
-        return x.array[n:-n], z.array[n:-n]
+        return x.array[periods * n:-periods * n], z.array[periods * n:-periods * n]
 
 
 class ExpFixedRFA(AbstractRFA):
@@ -537,6 +1053,9 @@ class ExpFixedRFA(AbstractRFA):
         If not specified, it is equal to `alpha` * `n`. Cannot be lower than 2.
     exp: float, default: 2.0
         Exponent in exponential transition function.
+    vectorized: bool, default: True
+        If True, all intervals are recreated at once with array operations.
+        If False, intervals are recreated one by one in a loop.
 
     Notes
     -----
@@ -611,7 +1130,7 @@ class ExpFixedRFA(AbstractRFA):
     :func:`~traffic_weaver.funfit.exp_lin_fit`
     """
 
-    def __init__(self, x, y, n, alpha=1.0, beta=0.5, a=None, exp=2.0):
+    def __init__(self, x, y, n, alpha=1.0, beta=0.5, a=None, exp=2.0, vectorized=True):
         super().__init__(x, y, n)
         if a is None:
             a = alpha * self.n
@@ -622,8 +1141,68 @@ class ExpFixedRFA(AbstractRFA):
         self.a_r = self.a_l
         self.b = int(beta * self.a_l)
         self.exp = exp
+        self.vectorized = vectorized
 
     def rfa(self):
+        if self.vectorized:
+            return self._rfa_vectorized()
+        return self._rfa_each_series(type(self)._rfa_iterative)
+
+    def _chunk_margin(self):
+        # windows of neighbouring intervals reach into the interval, and each of them
+        # reads samples of the next intervals up to the width of a window
+        return 2 * self._extension_periods() + 1
+
+    def _extension_periods(self):
+        # number of periods that transition windows can reach outside the interval
+        return max(1, int(np.ceil(max(self.a_l, self.a_r) / self.n)))
+
+    def _rfa_vectorized(self):
+        r"""Recreate all intervals at once.
+
+        Each interval is a row of `(nr_of_intervals, n + 1)` array and transition
+        windows are fitted for all rows at once. Gives the same result as
+        :func:`_rfa_iterative`.
+        """
+        x, y = self._initial_oversample()
+        n = self.n
+        a_r = self.a_r
+        a_l = self.a_l
+        b = self.b
+        exp = self.exp
+
+        # transition windows spanning more than one interval
+        if a_l > n or a_r > n or b > n:
+            return self._rfa_each_series(type(self)._rfa_iterative)
+
+        x, y, xs, ys = _extended_closed_intervals(x, y, n)
+        prev_xs, cur_xs, next_xs = xs[:-2], xs[1:-1], xs[2:]
+        prev_y, y_0, next_y = ys[..., :-2, :1], ys[..., 1:-1, :1], ys[..., 2:, :1]
+
+        # calculate transition points
+        x_0, x_b, x_al = cur_xs[:, :1], cur_xs[:, b:b + 1], cur_xs[:, a_l:a_l + 1]
+        x_ar, x_nb, x_n = cur_xs[:, n - a_r:n - a_r + 1], cur_xs[:, n - b:n - b + 1], cur_xs[:, n:]
+        z_0 = lin_fit(x_0, (prev_xs[:, n - a_r:n - a_r + 1], prev_y), (x_al, y_0))
+        z_1 = lin_fit(next_xs[:, :1], (x_ar, y_0), (next_xs[:, a_l:a_l + 1], next_y))
+
+        z_0_lb = lin_fit(x_b, (x_0, z_0), (x_al, y_0))
+        z_0_rb = lin_fit(x_nb, (x_ar, y_0), (next_xs[:, :1], z_1))
+
+        # calculate remaining points
+        zs = ys[..., 1:-1, :].copy()
+        zs[..., :b] = lin_fit(cur_xs[:, :b], (x_0, z_0), (x_b, z_0_lb))
+        zs[..., b:a_l] = _lin_exp_xy_fit_array(cur_xs[:, b:a_l], (x_b, z_0_lb), (x_al, y_0), alpha=exp)
+        zs[..., n - a_r:n - b] = _exp_lin_fit_array(cur_xs[:, n - a_r:n - b], (x_ar, y_0), (x_nb, z_0_rb),
+                                                    alpha=exp)
+        zs[..., n - b:n] = lin_fit(cur_xs[:, n - b:n], (x_nb, z_0_rb), (x_n, z_1))
+
+        z = y[..., n:-n].astype(float)
+        nr_of_intervals = zs.shape[-2]
+        z[..., :nr_of_intervals * n] = zs[..., :n].reshape(z.shape[:-1] + (-1,))
+        return x[n:-n], z
+
+    def _rfa_iterative(self):
+        r"""Recreate intervals one by one in a loop."""
         x, y = self._initial_oversample()
         n = self.n
         a_r = self.a_r
@@ -638,14 +1217,16 @@ class ExpFixedRFA(AbstractRFA):
         y = IntervalArray(y, n)
         z = IntervalArray(y.array, n)
 
-        # extend with one period on the left and one on the right to make
-        # calculations easier
-        x.extend_linspace(direction='both')
-        y.extend_constant(direction='both')
-        z.extend_constant(direction='both')
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+            y.extend_constant(direction='both')
+            z.extend_constant(direction='both')
 
         # move through each interval
-        for k in range(1, x.nr_of_full_intervals() - 1):
+        for k in range(periods, x.nr_of_full_intervals() - periods):
             # calculate transition points
             y_0 = y[k, 0]
             z_0 = lin_fit(x[k, 0], (x[k, -a_r], y[k - 1, 0]), (x[k, a_l], y[k, 0]))
@@ -666,7 +1247,7 @@ class ExpFixedRFA(AbstractRFA):
             for i in range(n - b, n):
                 z[k, i] = lin_fit(x[k, i], (x[k, n - b], z_0_rb), (x[k, n], z_1))
 
-        return x.array[n:-n], z.array[n:-n]
+        return x.array[periods * n:-periods * n], z.array[periods * n:-periods * n]
 
 
 class ExpAdaptiveRFA(AbstractRFA):
@@ -718,6 +1299,9 @@ class ExpAdaptiveRFA(AbstractRFA):
         `1/adaptive_smooth`.
     exp: float, default: 2.0
         Exponent in exponential transition function.
+    vectorized: bool, default: True
+        If True, all intervals are recreated at once with array operations.
+        If False, intervals are recreated one by one in a loop.
 
     Notes
     -----
@@ -778,7 +1362,7 @@ class ExpAdaptiveRFA(AbstractRFA):
 
     """
 
-    def __init__(self, x, y, n, alpha=1.0, beta=0.5, a=None, adaptive_smooth=1.0, exp=2.0):
+    def __init__(self, x, y, n, alpha=1.0, beta=0.5, a=None, adaptive_smooth=1.0, exp=2.0, vectorized=True):
         super().__init__(x, y, n)
         if a is None:
             a = alpha * self.n
@@ -788,8 +1372,88 @@ class ExpAdaptiveRFA(AbstractRFA):
         self.beta = beta
         self.adaptive_smooth = adaptive_smooth
         self.exp = exp
+        self.vectorized = vectorized
 
     def rfa(self):
+        if self.vectorized:
+            return self._rfa_vectorized()
+        return self._rfa_each_series(type(self)._rfa_iterative)
+
+    def _chunk_margin(self):
+        # windows of neighbouring intervals reach into the interval, each of them reads samples
+        # of the next intervals up to the width of a window, and depends on their average values
+        return 2 * int(np.ceil(self.a / self.n)) + 2
+
+    def _extension_periods(self):
+        # transition windows of the first and the last interval have at most `a / 2` samples,
+        # other windows have at most `a` samples and reach one interval further
+        return max(1, int(np.ceil(self.a / self.n)) - 1)
+
+    def _rfa_vectorized(self):
+        r"""Recreate all intervals at once.
+
+        Computes transition windows, transition values and fitted segments of all
+        intervals as array operations. Gives the same result as :func:`_rfa_iterative`.
+        """
+        x, y = self._initial_oversample()
+        n = self.n
+        beta = self.beta
+        exp = self.exp
+
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        x = IntervalArray(x, n)
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+        y = IntervalArray(extend_constant(y, periods * n, direction='both'), n)
+        xa = x.array
+        # each series is a row of `z`, rows are fitted as a single flat array
+        ya = np.atleast_2d(y.array)
+        z = ya.astype(float, copy=True)
+        rows = np.arange(len(ya))[:, np.newaxis] * ya.shape[1]
+
+        # get adaptive factors
+        a_ls, a_rs, gammas = LinearAdaptiveRFA.get_adaptive_transition_points_array(x, y, self.a,
+                                                                                    self.adaptive_smooth)
+        a_ls, a_rs = np.atleast_2d(a_ls, a_rs)
+        b_ls = (beta * a_ls).astype(int)
+        b_rs = (beta * a_rs).astype(int)
+
+        # intervals to recreate and their starting index
+        k = np.arange(periods, x.nr_of_full_intervals() - periods)
+        s = k * n
+        a_l, a_r, b_l, b_r = a_ls[:, k], a_rs[:, k], b_ls[:, k], b_rs[:, k]
+        y_0 = ya[:, s]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # calculate transition points
+            z_0 = np.where((a_rs[:, k - 1] == 0) & (a_l == 0), ya[:, s - n],
+                           lin_fit(xa[s], (xa[s - a_rs[:, k - 1]], ya[:, s - n]), (xa[s + a_l], y_0)))
+            # no right transition window reads flat index `k + 1`, same as `y[k + 1]` in the loop
+            z_1 = np.where((a_r == 0) & (a_ls[:, k + 1] == 0), ya[:, k + 1],
+                           lin_fit(xa[s + n], (xa[s + n - a_r], y_0), (xa[s + n + a_ls[:, k + 1]], ya[:, s + n])))
+            z_0_bl = np.where(b_l == 0, z_0, lin_fit(xa[s + b_l], (xa[s], z_0), (xa[s + a_l], y_0)))
+            z_0_br = np.where(b_r == 0, z_1, lin_fit(xa[s + n - b_r], (xa[s + n - a_r], y_0), (xa[s + n], z_1)))
+
+        # remaining points, four consecutive segments in each interval
+        starts = _interleave(rows + s, rows + s + b_l, rows + s + n - a_r, rows + s + n - b_r)
+        stops = _interleave(rows + s + b_l, rows + s + a_l, rows + s + n - b_r, rows + s + n)
+        x_0 = _interleave(xa[s], xa[s + b_l], xa[s + n - a_r], xa[s + n - b_r])
+        z_l = _interleave(z_0, z_0_bl, y_0, z_0_br)
+        x_1 = _interleave(xa[s + b_l], xa[s + a_l], xa[s + n - b_r], xa[s + n])
+        z_r = _interleave(z_0_bl, y_0, z_0_br, z_1)
+        kinds = np.tile([0, 1, 2, 0], len(k) * len(ya))
+
+        _fit_segments(xa, z.reshape(-1), starts, stops, (x_0, z_l), (x_1, z_r), kinds,
+                      [lin_fit,
+                       lambda xs, xy_0, xy_1: _lin_exp_xy_fit_array(xs, xy_0, xy_1, alpha=exp),
+                       lambda xs, xy_0, xy_1: _exp_lin_fit_array(xs, xy_0, xy_1, alpha=exp)])
+
+        return xa[periods * n:-periods * n], z.reshape(y.array.shape)[..., periods * n:-periods * n]
+
+    def _rfa_iterative(self):
+        r"""Recreate intervals one by one in a loop."""
         x, y = self._initial_oversample()
         n = self.n
         beta = self.beta
@@ -802,11 +1466,13 @@ class ExpAdaptiveRFA(AbstractRFA):
         y = IntervalArray(y, n)
         z = IntervalArray(y.array, n)
 
-        # extend with one period on the left and one on the right to make
-        # calculations easier
-        x.extend_linspace(direction='both')
-        y.extend_constant(direction='both')
-        z.extend_constant(direction='both')
+        # extend with periods covering transition windows on the left and on the right
+        # to make calculations easier
+        periods = self._extension_periods()
+        for _ in range(periods):
+            x.extend_linspace(direction='both')
+            y.extend_constant(direction='both')
+            z.extend_constant(direction='both')
 
         # get adaptive factors
         a_ls, a_rs, gammas = LinearAdaptiveRFA.get_adaptive_transition_points(x, y, self.a, self.adaptive_smooth)
@@ -814,7 +1480,7 @@ class ExpAdaptiveRFA(AbstractRFA):
         b_rs = [int(beta * a_r) for a_r in a_rs]
 
         # move through each interval
-        for k in range(1, x.nr_of_full_intervals() - 1):
+        for k in range(periods, x.nr_of_full_intervals() - periods):
             # calculate transition points
             y_0 = y[k, 0]
 
@@ -848,4 +1514,4 @@ class ExpAdaptiveRFA(AbstractRFA):
             for i in range(n - b_rs[k], n):
                 z[k, i] = lin_fit(x[k, i], (x[k, n - b_rs[k]], z_0_br), (x[k, n], z_1))
 
-        return x.array[n:-n], z.array[n:-n]
+        return x.array[periods * n:-periods * n], z.array[periods * n:-periods * n]
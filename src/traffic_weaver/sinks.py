@@ -0,0 +1,162 @@
+r"""Write time series to files in chunks.
+
+Each writer takes an iterable of `(x, y)` chunks, e.g., slices of the whole series,
+:func:`~traffic_weaver.rfa.AbstractRFA.rfa_iter` or
+:func:`~traffic_weaver.match.integral_matching_reference_stretch_iter`,
+and writes them one by one, so only a single chunk is held in memory at once.
+
+Each row of the written table is one point of the time series. The first column
+is the x-variable and the next columns are the y-variables of each series.
+"""
+import numpy as np
+
+
+def _iter_chunks(x, y, chunk_size):
+    r"""Yield consecutive `(x, y)` chunks of `chunk_size` points as views."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size cannot be lower than 1.")
+    for start in range(0, len(x), chunk_size):
+        yield x[start:start + chunk_size], y[..., start:start + chunk_size]
+
+
+def _column_names(nr_of_series):
+    r"""Column names of table with x and y-variables of `nr_of_series` series or single 1-D series if None."""
+    if nr_of_series is None:
+        return ['x', 'y']
+    return ['x'] + [f'y{i}' for i in range(nr_of_series)]
+
+
+def write_csv(file_name, chunks, fmt='%.18e'):
+    r"""Write time series chunks to CSV file without header.
+
+    Written file can be read with :func:`~traffic_weaver.weaver.Weaver.from_csv`.
+
+    Parameters
+    ----------
+    file_name: str
+        Path to CSV file.
+    chunks: Iterable[tuple[ndarray, ndarray]]
+        Consecutive chunks `(x, y)`, `y` of each chunk is of shape `(len(x), )` or
+        `(n_series, len(x))`.
+    fmt: str, default: '%.18e'
+        Format of values, as in :func:`numpy.savetxt`.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> import numpy as np
+    >>> from traffic_weaver.sinks import write_csv
+    >>> x = np.arange(5)
+    >>> file_name = os.path.join(tempfile.mkdtemp(), 'series.csv')
+    >>> write_csv(file_name, [(x[:3], 2 * x[:3]), (x[3:], 2 * x[3:])], fmt='%g')
+    >>> print(open(file_name).read())
+    0,0
+    1,2
+    2,4
+    3,6
+    4,8
+    <BLANKLINE>
+    """
+    with open(file_name, 'w') as f:
+        for x, y in chunks:
+            np.savetxt(f, np.column_stack((x, np.transpose(y))), fmt=fmt, delimiter=',')
+
+
+def write_npy(file_name, chunks, nr_of_samples):
+    r"""Write time series chunks to NPY file.
+
+    Array of shape `(nr_of_samples, 1 + n_series)` is created as a memory-mapped
+    file, and chunks are written directly to its rows.
+
+    Parameters
+    ----------
+    file_name: str
+        Path to NPY file.
+    chunks: Iterable[tuple[ndarray, ndarray]]
+        Consecutive chunks `(x, y)`, `y` of each chunk is of shape `(len(x), )` or
+        `(n_series, len(x))`.
+    nr_of_samples: int
+        Total number of points in all chunks.
+
+    Raises
+    ------
+    ValueError
+        If chunks contain different number of points than `nr_of_samples`.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> import numpy as np
+    >>> from traffic_weaver.sinks import write_npy
+    >>> x = np.arange(5)
+    >>> file_name = os.path.join(tempfile.mkdtemp(), 'series.npy')
+    >>> write_npy(file_name, [(x[:3], [x[:3], 2 * x[:3]]), (x[3:], [x[3:], 2 * x[3:]])], 5)
+    >>> np.load(file_name)
+    array([[0., 0., 0.],
+           [1., 1., 2.],
+           [2., 2., 4.],
+           [3., 3., 6.],
+           [4., 4., 8.]])
+    """
+    out = None
+    start = 0
+    for x, y in chunks:
+        y = np.asarray(y)
+        if out is None:
+            nr_of_columns = 1 + (y.shape[0] if y.ndim > 1 else 1)
+            out = np.lib.format.open_memmap(file_name, mode='w+', dtype=np.float64,
+                                            shape=(nr_of_samples, nr_of_columns))
+        if start + len(x) > nr_of_samples:
+            raise ValueError("Chunks contain more points than 'nr_of_samples'.")
+        out[start:start + len(x), 0] = x
+        out[start:start + len(x), 1:] = np.transpose(y).reshape(len(x), -1)
+        start += len(x)
+    if out is None:
+        np.save(file_name, np.empty((0, 2)))
+    else:
+        out.flush()
+        del out
+    if start != nr_of_samples:
+        raise ValueError("Chunks contain fewer points than 'nr_of_samples'.")
+
+
+def write_parquet(file_name, chunks, **kwargs):
+    r"""Write time series chunks to Parquet file, each chunk as a separate row group.
+
+    Columns are named 'x' and 'y' for a single series, or 'x', 'y0', 'y1', ...
+    for many series. Requires `pyarrow` package.
+
+    Parameters
+    ----------
+    file_name: str
+        Path to Parquet file.
+    chunks: Iterable[tuple[ndarray, ndarray]]
+        Consecutive chunks `(x, y)`, `y` of each chunk is of shape `(len(x), )` or
+        `(n_series, len(x))`.
+    **kwargs
+        Parameters passed to :class:`pyarrow.parquet.ParquetWriter`.
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Writing Parquet files requires 'pyarrow' package.") from e
+
+    writer = None
+    try:
+        for x, y in chunks:
+            y = np.asarray(y)
+            names = _column_names(y.shape[0] if y.ndim > 1 else None)
+            columns = [np.asarray(x, dtype=np.float64)] + list(np.atleast_2d(y).astype(np.float64, copy=False))
+            table = pa.Table.from_arrays([pa.array(column) for column in columns], names=names)
+            if writer is None:
+                writer = pq.ParquetWriter(file_name, table.schema, **kwargs)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -18,7 +18,7 @@ def append_one_sample(x: Union[np.ndarray, List], y: Union[np.ndarray, List], ma
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
+    y: array-like of shape (n, ) or (n_series, n)
         Dependent variable.
     make_periodic: bool, default: False
         If false, append the last `y` point to `y` array.
@@ -48,9 +48,9 @@ def append_one_sample(x: Union[np.ndarray, List], y: Union[np.ndarray, List], ma
 
     x = np.append(x, 2 * x[-1] - x[-2])
     if not make_periodic:
-        y = np.append(y, y[-1])
+        y = np.concatenate([y, y[..., -1:]], axis=-1)
     else:
-        y = np.append(y, y[0])
+        y = np.concatenate([y, y[..., :1]], axis=-1)
     return x, y
 
 
@@ -101,9 +101,11 @@ def oversample_piecewise_constant(a: np.ndarray, num: int):
 
     If `n` is lower than 2, the original array is returned.
 
+    If the array has more than one dimension, it is oversampled along the last axis.
+
     Parameters
     ----------
-    a: 1-D array
+    a: array
         Input array to oversample.
     num: int
         Number of elements inserted between each pair of array elements. Larger or
@@ -112,7 +114,7 @@ def oversample_piecewise_constant(a: np.ndarray, num: int):
     Returns
     -------
     ndarray
-        1-D array containing `num` elements between each array elements' pair.
+        Array containing `num` elements between each array elements' pair.
         Its length is equal to `(len(a) - 1) * num + 1`
 
     Examples
@@ -121,12 +123,14 @@ def oversample_piecewise_constant(a: np.ndarray, num: int):
     >>> from traffic_weaver.sorted_array_utils import oversample_piecewise_constant
     >>> oversample_piecewise_constant(np.asarray([1.0, 2.0, 3.0]), 4).tolist()
     [1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 2.0, 3.0]
+    >>> oversample_piecewise_constant(np.asarray([[1, 2], [3, 4]]), 2).tolist()
+    [[1, 1, 2], [3, 3, 4]]
 
     """
     if num < 2:
         return a
     a = np.asarray(a)
-    return a.repeat(num)[: -num + 1]
+    return a.repeat(num, axis=-1)[..., : -num + 1]
 
 
 def extend_linspace(a: np.ndarray, n: int, direction="both", lstart: float = None, rstop: float = None):
@@ -203,9 +207,11 @@ def extend_constant(a: np.ndarray, n: int, direction="both"):
     `direction` determines whether to extend to `both`, `left` or `right`.
     By default, it is 'both'.
 
+    If the array has more than one dimension, it is extended along the last axis.
+
     Parameters
     ----------
-    a: 1-D array
+    a: array
     n: int
         Number of elements to extend
     direction: 'both', 'left' or 'right', optional: 'both'
@@ -214,7 +220,7 @@ def extend_constant(a: np.ndarray, n: int, direction="both"):
     Returns
     -------
     ndarray
-        1-D extended array.
+        Extended array.
 
     Examples
     --------
@@ -223,13 +229,15 @@ def extend_constant(a: np.ndarray, n: int, direction="both"):
     >>> a = np.array([1, 2, 3])
     >>> extend_constant(a, 2, direction='both').tolist()
     [1, 1, 1, 2, 3, 3, 3]
+    >>> extend_constant(np.array([[1, 2], [3, 4]]), 1, direction='both').tolist()
+    [[1, 1, 2, 2], [3, 3, 4, 4]]
 
     """
     a = np.asarray(a)
     if direction == "both" or direction == "left":
-        a = np.insert(a, 0, [a[0]] * n)
+        a = np.concatenate([np.repeat(a[..., :1], n, axis=-1), a], axis=-1)
     if direction == "both" or direction == "right":
-        a = np.insert(a, len(a), [a[-1]] * n)
+        a = np.concatenate([a, np.repeat(a[..., -1:], n, axis=-1)], axis=-1)
     return a
 
 
@@ -243,12 +251,12 @@ def rectangle_integral(x, y):
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
-        Dependent variable.
+    y: array-like of shape (..., n)
+        Dependent variable, integrated along the last axis.
 
     Returns
     -------
-    1-D array-like of size n-1
+    array-like of shape (..., n-1)
         Values of the integral.
 
     Examples
@@ -260,8 +268,9 @@ def rectangle_integral(x, y):
     array([ 2.,  6.,  4.,  8., 10.])
 
     """
+    y = np.asarray(y)
     d = np.diff(x)
-    return y[:-1] * d
+    return y[..., :-1] * d
 
 
 def trapezoid_integral(x, y):
@@ -271,12 +280,12 @@ def trapezoid_integral(x, y):
     ----------
     x: 1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
-        Dependent variable.
+    y: array-like of shape (..., n)
+        Dependent variable, integrated along the last axis.
 
     Returns
     -------
-    1-D array-like of size n-1
+    array-like of shape (..., n-1)
         Values of the integral.
 
     Examples
@@ -288,7 +297,8 @@ def trapezoid_integral(x, y):
     array([ 4.,  5.,  6.,  9., 11.])
 
     """
-    return (y[:-1] + y[1:]) / 2 * np.diff(x)
+    y = np.asarray(y)
+    return (y[..., :-1] + y[..., 1:]) / 2 * np.diff(x)
 
 
 def integral(x, y, method: str = 'trapezoid'):
@@ -298,14 +308,14 @@ def integral(x, y, method: str = 'trapezoid'):
     ----------
     1-D array-like of size n
         Independent variable in strictly increasing order.
-    y: 1-D array-like of size n
-        Dependent variable.
+    y: array-like of shape (..., n)
+        Dependent variable, integrated along the last axis.
     method: str, default: 'trapezoid'
         Method to calculate integral of target function.
         Available options: 'trapezoid', 'rectangle'
     Returns
     -------
-    1-D array-like of size n-1
+    array-like of shape (..., n-1)
         Values of the integral.
     """
     if method == 'trapezoid':
@@ -344,37 +354,11 @@ def find_closest_lower_equal_element_indices_to_values(x: Union[np.ndarray, list
     array([ 0,  1,  3,  9, 10])
 
     """
-    indices = np.zeros(len(lookup), dtype=np.int64)
-
-    x_it = iter(x)
-    x_val = next(x_it)
-    x_next_val = next(x_it, None)
-    x_idx = 0
-
-    lookup_it = iter(lookup)
-    lookup_val = next(lookup_it)
-    lookup_idx = 0
-
-    # lookup value lower than x
-    # shift lookup until it is higher equal than the first element in x
-    while lookup_val is not None and lookup_val < x_val:
-        indices[lookup_idx] = x_idx if fill_not_valid else -1
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
-
-    # lookup value is higher than the first element in x
-    while lookup_val is not None:
-        # if lookup is higher than the next x
-        # move x to the right
-        while x_next_val is not None and x_next_val <= lookup_val:
-            x_next_val = next(x_it, None)
-            x_idx += 1
-            if x_next_val is None:
-                break
-        # lookup value is higher than the current x and lower than the next x
-        indices[lookup_idx] = x_idx
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
+    x = np.asarray(x)
+    lookup = np.asarray(lookup)
+    indices = np.searchsorted(x, lookup, side='right').astype(np.int64) - 1
+    # lookup value lower than the first element in x
+    indices[indices < 0] = 0 if fill_not_valid else -1
     return indices
 
 
@@ -407,40 +391,12 @@ def find_closest_higher_equal_element_indices_to_values(x: Union[np.ndarray, lis
     array([ 0,  2,  4,  9, 10])
 
     """
-    indices = np.zeros(len(lookup), dtype=np.int64)
-
-    x_it = iter(x)
-    x_val = next(x_it)
-    x_next_val = next(x_it, None)
-    x_idx = 0
-
-    lookup_it = iter(lookup)
-    lookup_val = next(lookup_it)
-    lookup_idx = 0
-
-    # lookup value lower than x
-    # shift lookup until it is higher than the first element in x
-    while lookup_val is not None and lookup_val <= x_val:
-        indices[lookup_idx] = x_idx
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
-
-    # lookup value is higher than the first element in x
-    while lookup_val is not None:
-        # if lookup is higher than the next x
-        # move x to the right
-        while x_next_val is not None and x_next_val < lookup_val:
-            x_next_val = next(x_it, None)
-            x_idx += 1
-            if x_next_val is None:
-                break
-        # lookup value is higher than the current x and lower than the next x
-        if x_next_val is None:
-            indices[lookup_idx] = x_idx if fill_not_valid else len(x)
-        else:
-            indices[lookup_idx] = x_idx + 1
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
+    x = np.asarray(x)
+    lookup = np.asarray(lookup)
+    indices = np.searchsorted(x, lookup, side='left').astype(np.int64)
+    # lookup value higher than the last element in x
+    if fill_not_valid:
+        indices[indices == len(x)] = len(x) - 1
     return indices
 
 
@@ -468,46 +424,17 @@ def find_closest_lower_or_higher_element_indices_to_values(x: Union[np.ndarray,
     array([ 0,  1,  2,  2,  9, 10])
 
     """
-    indices = np.zeros(len(lookup), dtype=np.int64)
-
-    x_it = iter(x)
-    x_val = next(x_it)
-    x_next_val = next(x_it, None)
-    x_idx = 0
-
-    lookup_it = iter(lookup)
-    lookup_val = next(lookup_it)
-    lookup_idx = 0
-
-    # lookup value lower than x
-    # shift lookup until it is higher than the first element in x
-    while lookup_val is not None and lookup_val <= x_val:
-        indices[lookup_idx] = x_idx
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
-
-    # lookup value is higher than the first element in x
-    while lookup_val is not None:
-        # if lookup is higher than the next x
-        # move x to the right
-        while x_next_val is not None and x_next_val < lookup_val:
-            x_val = x_next_val
-            x_next_val = next(x_it, None)
-            x_idx += 1
-            if x_next_val is None:
-                break
-        # lookup value is higher than the last element in x
-        if x_next_val is None:
-            indices[lookup_idx] = x_idx
-        else:
-            # lookup value is higher than the current x and lower than the next x
-            # check which one is closer
-            if lookup_val - x_val <= x_next_val - lookup_val:
-                indices[lookup_idx] = x_idx
-            else:
-                indices[lookup_idx] = x_idx + 1
-        lookup_val = next(lookup_it, None)
-        lookup_idx += 1
+    x = np.asarray(x)
+    lookup = np.asarray(lookup)
+    higher = np.searchsorted(x, lookup, side='left').astype(np.int64)
+    # lookup value lower equal than the first or higher than the last element in x
+    indices = np.minimum(higher, len(x) - 1)
+
+    # lookup value is higher than the lower x and lower equal than the higher x
+    # choose the lower one if it is closer or equally close
+    between = (higher > 0) & (higher < len(x))
+    higher, lookup = higher[between], lookup[between]
+    indices[between] = np.where(lookup - x[higher - 1] <= x[higher] - lookup, higher - 1, higher)
     return indices
 
 
@@ -555,9 +482,10 @@ def sum_over_indices(a, indices):
     Parameters
     ----------
     a: array-like
-        Array of values.
+        Array of values, summed along the last axis.
     indices: array-like of int
         Array of indices defining ranges over which to sum values.
+        Range between equal indices is empty and its sum is 0.
     Returns
     -------
     Array of sums of values over ranges defined by `indices`.
@@ -569,8 +497,22 @@ def sum_over_indices(a, indices):
     >>> indices = np.array([0, 3, 6, 10])
     >>> sum_over_indices(x, indices)
     array([ 3., 12., 30.])
+    >>> sum_over_indices([x, 2 * x], [0, 3, 3, 11])
+    array([[  3.,   0.,  52.],
+           [  6.,   0., 104.]])
 
     """
     a = np.asarray(a)
-    indices = np.asarray(indices)
-    return np.array([a[start:stop].sum() for start, stop in zip(indices[:-1], indices[1:])])
+    indices = np.clip(np.asarray(indices, dtype=np.int64), 0, a.shape[-1])
+    starts, stops = indices[:-1], indices[1:]
+    lengths = np.maximum(stops - starts, 0)
+    sums = np.zeros(a.shape[:-1] + (len(starts),), dtype=np.sum(a[..., :0], axis=-1).dtype)
+
+    # ranges of the same length are gathered into contiguous rows and summed at once,
+    # so each of them is summed in the same (pairwise) order as `a[start:stop].sum()`
+    order = np.argsort(lengths, kind='stable')
+    for ranges in np.split(order, np.flatnonzero(np.diff(lengths[order])) + 1):
+        if len(ranges) > 0 and lengths[ranges[0]] > 0:
+            range_indices = starts[ranges, np.newaxis] + np.arange(lengths[ranges[0]])
+            sums[..., ranges] = np.take(a, range_indices, axis=-1).sum(axis=-1)
+    return sums
@@ -1,11 +1,45 @@
+import functools
+import inspect
+import itertools
+
 import numpy as np
 
 from .match import integral_matching_reference_stretch
 from .process import repeat, trend, spline_smooth, noise_gauss, interpolate, truncate, normalize
+from .readers import read_csv
 from .rfa import AbstractRFA, ExpAdaptiveRFA
+from .sinks import _iter_chunks, write_csv, write_npy, write_parquet
 from .sorted_array_utils import append_one_sample
 
 
+# element-wise operations on `y` that are fused in lazy mode
+_ELEMENTWISE_Y_OPERATIONS = ('scale_y', 'shift_y', 'trend', 'noise')
+
+
+def _deferred(method):
+    r"""Record operation for later execution if Weaver is lazy."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.lazy:
+            self._operations.append((method, args, kwargs))
+            return self
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _executed(method):
+    r"""Execute recorded operations before accessing the time series."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._execute()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class Weaver:
     r"""Interface for recreating time series.
 
@@ -13,9 +47,16 @@ class Weaver:
     ----------
     x: 1-D array-like of size n, optional
         Independent variable in strictly increasing order.
-        If x is None, then x is a set of integers from 0 to `len(y) - 1`
-    y: 1-D array-like of size n
-        Dependent variable.
+        If x is None, then x is a set of integers from 0 to `n - 1`
+    y: array-like of shape (n, ) or (n_series, n)
+        Dependent variable. If 2-D, each row is a separate time series
+        sharing `x`, and all of them are processed at once.
+    lazy: bool, default: False
+        If true, chained operations are recorded and executed only when the time
+        series is accessed, e.g., with :func:`get` or :func:`to_2d_array`.
+        Consecutive element-wise operations on `y` (:func:`scale_y`, :func:`shift_y`,
+        :func:`trend` and :func:`noise`) are then fused and applied in place
+        on a single copy of `y`.
 
     Raises
     ------
@@ -28,6 +69,7 @@ class Weaver:
     `original_x` and `original_y` fields corresponds to originally passed values.
     `reference_x` and `reference_y` fields corresponds to processed fields used as a reference
     for integral matching.
+    In lazy mode, fields are up-to-date only after the time series is accessed.
 
     Examples
     --------
@@ -60,12 +102,20 @@ class Weaver:
     >>> y = 2 * x
     >>> wv = Weaver(x, y)
 
+    Deferring processing until the result is needed
+
+    >>> wv = Weaver(x, y, lazy=True)
+    >>> _ = wv.scale_y(2).shift_y(1).trend(lambda x: 0.5 * x)
+    >>> res_x, res_y = wv.get()
+    >>> res_y
+    array([23.5, 28. , 32.5, 37. , 41.5, 46. , 50.5, 55. , 59.5, 64. , 68.5])
+
     """
-    def __init__(self, x, y):
-        if x is not None and len(x) != len(y):
+    def __init__(self, x, y, lazy=False):
+        if x is not None and len(x) != np.shape(y)[-1]:
             raise ValueError("x and y should be of the same length")
         if x is None:
-            self.x = np.arange(stop=len(y))
+            self.x = np.arange(stop=np.shape(y)[-1])
         else:
             self.x = np.asarray(x)
         self.y = np.asarray(y)
@@ -78,6 +128,50 @@ class Weaver:
         self.x_scale = 1
         self.y_scale = 1
 
+        self.lazy = lazy
+        self._operations = []
+
+    def _execute(self):
+        r"""Execute recorded operations, fusing consecutive element-wise operations on `y`."""
+        operations, self._operations = self._operations, []
+        for elementwise, group in itertools.groupby(
+                operations, key=lambda operation: operation[0].__name__ in _ELEMENTWISE_Y_OPERATIONS):
+            group = list(group)
+            if elementwise and len(group) > 1:
+                self._apply_elementwise_y(group)
+            else:
+                for method, args, kwargs in group:
+                    method(self, *args, **kwargs)
+
+    def _apply_elementwise_y(self, operations):
+        r"""Apply element-wise operations on `y` in place on a single copy of `y`."""
+        bound_operations = []
+        for method, args, kwargs in operations:
+            arguments = inspect.signature(method).bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            bound_operations.append((method.__name__, arguments.arguments))
+
+        # result type is the same as if operations were applied one by one
+        values = [arguments[name] for operation, arguments in bound_operations for name in ['scale', 'shift']
+                  if name in arguments]
+        if any(operation in ['trend', 'noise'] for operation, _ in bound_operations):
+            values.append(np.float64)
+        y = np.array(self.y, dtype=np.result_type(self.y, *values))
+
+        for operation, arguments in bound_operations:
+            if operation == 'scale_y':
+                self.y_scale = self.y_scale * arguments['scale']
+                np.multiply(y, arguments['scale'], out=y)
+                self.reference_y = self.reference_y * arguments['scale']
+            elif operation == 'shift_y':
+                np.add(y, arguments['shift'], out=y)
+                self.reference_y = self.reference_y + arguments['shift']
+            elif operation == 'trend':
+                self.x, y = trend(self.x, y, fun=arguments['trend_func'], normalized=arguments['normalized'], out=y)
+            elif operation == 'noise':
+                y = noise_gauss(y, snr=arguments['snr'], out=y, **{'axis': -1, **arguments['kwargs']})
+        self.y = y
+
     @staticmethod
     def from_2d_array(xy: np.ndarray):
         """Create Weaver object from 2D array.
@@ -143,7 +237,7 @@ class Weaver:
         return Weaver(df[x_col].values, df[y_col].values)
 
     @staticmethod
-    def from_csv(file_name: str):
+    def from_csv(file_name: str, backend=None):
         """Create Weaver object from CSV file.
 
         CSV has to contain two columns without headers.
@@ -154,13 +248,17 @@ class Weaver:
         ----------
         file_name: str
             Path to CSV file.
+        backend: {'pyarrow', 'numpy', 'pandas'}, optional
+            Backend used to parse the file, see :func:`~traffic_weaver.readers.read_csv`.
+            By default, the fastest available backend is used.
         Returns
         -------
         Weaver
             Weaver object from CSV file.
         """
-        return Weaver.from_2d_array(np.loadtxt(file_name, delimiter=',', dtype=np.float64))
+        return Weaver.from_2d_array(read_csv(file_name, backend=backend))
 
+    @_executed
     def get(self):
         r"""Return function x, y tuple after performed processing.
 
@@ -180,6 +278,7 @@ class Weaver:
         """
         return self.x, self.y
 
+    @_executed
     def get_original(self):
         r"""Return the original function x, y tuple provided for the class.
 
@@ -199,6 +298,7 @@ class Weaver:
         """
         return self.original_x, self.original_y
 
+    @_executed
     def get_reference(self):
         r"""Return the reference function x,y tuple.
 
@@ -208,6 +308,7 @@ class Weaver:
         """
         return self.reference_x, self.reference_y
 
+    @_deferred
     def restore_original(self):
         r"""Restore original function passed before processing.
 
@@ -229,6 +330,7 @@ class Weaver:
         self.y = self.original_y.copy()
         return self
 
+    @_deferred
     def append_one_sample(self, make_periodic=False):
         """Add one sample to the end of time series.
 
@@ -275,6 +377,7 @@ class Weaver:
                                                                make_periodic=make_periodic)
         return self
 
+    @_executed
     def slice_by_index(self, start=0, stop=None, step=1):
         """Get view of function sliced by index.
 
@@ -312,8 +415,9 @@ class Weaver:
             raise ValueError("Start index should be non-negative")
         if stop > len(self.x):
             raise ValueError("Stop index should be less than length of x")
-        return self.x[start:stop:step], self.y[start:stop:step]
+        return self.x[start:stop:step], self.y[..., start:stop:step]
 
+    @_executed
     def slice_by_value(self, start=None, stop=None, step=1):
         """Get view of function sliced by its value.
 
@@ -359,6 +463,7 @@ class Weaver:
             raise ValueError("Stop value not found in x")
         return self.slice_by_index(start_idx, stop_idx, step)
 
+    @_deferred
     def interpolate(self, n: int = None, new_x=None, method='linear', **kwargs):
         """ Interpolate function.
 
@@ -421,6 +526,7 @@ class Weaver:
         self.x = new_x
         return self
 
+    @_deferred
     def recreate_from_average(self, n: int, rfa_class: type[AbstractRFA] = ExpAdaptiveRFA, **kwargs, ):
         r"""Recreate function from average function using provided strategy.
 
@@ -467,6 +573,7 @@ class Weaver:
         self.x, self.y = rfa_class(self.x, self.y, n, **kwargs).rfa()
         return self
 
+    @_deferred
     def integral_match(self, target_function_integral_method='trapezoid',
                        reference_function_integral_method='rectangle', **kwargs):
         r"""Match function integral to approximated integral of the original function.
@@ -513,6 +620,7 @@ class Weaver:
                                                      **kwargs)
         return self
 
+    @_deferred
     def noise(self, snr, **kwargs):
         r"""Add noise to function.
 
@@ -520,8 +628,9 @@ class Weaver:
         ----------
         snr: scalar or array-like
             Target signal-to-noise ratio for a function.
+            If there are many series, it is targeted in each of them.
         **kwargs
-            Parameters passed to noise creation.
+            Parameters passed to noise creation, e.g., `rng` with random generator or seed.
 
         Returns
         -------
@@ -539,12 +648,14 @@ class Weaver:
         >>> y = 2 * x
         >>> wv = Weaver(x, y)
         >>> res_x, res_y = wv.noise(10).get()
+        >>> res_x, res_y = wv.noise(10, rng=np.random.default_rng(42)).get()
 
         """
 
-        self.y = noise_gauss(self.y, snr=snr, **kwargs)
+        self.y = noise_gauss(self.y, snr=snr, **{'axis': -1, **kwargs})
         return self
 
+    @_deferred
     def repeat(self, n):
         r"""Repeat function.
 
@@ -581,6 +692,7 @@ class Weaver:
         self.reference_x, self.reference_y = repeat(self.reference_x, self.reference_y, repeats=n)
         return self
 
+    @_deferred
     def trend(self, trend_func: lambda x: x, normalized=False):
         r"""Apply trend to function.
 
@@ -591,6 +703,7 @@ class Weaver:
             Callable signature is `(x) -> y_shift` where
             `x` independent variable axis and
             `y_shift` is independent variable shift for that `x`.
+            If possible, it is called once with the whole `x` array.
         normalized: bool, default: False
                 If true, `x` variable in `fun` is normalized to the range of [0, 1].
 
@@ -623,6 +736,7 @@ class Weaver:
         self.x, self.y = trend(self.x, self.y, fun=trend_func, normalized=normalized)
         return self
 
+    @_deferred
     def smooth(self, s):
         r"""Smoothen the function.
 
@@ -652,9 +766,10 @@ class Weaver:
                9.21531047, 8.95969893, 8.27226261, 7.27209891, 6.07830526,
                4.80997905])
         """
-        self.y = spline_smooth(self.x, self.y, s=s)(self.x)
+        self.y = np.apply_along_axis(lambda y: spline_smooth(self.x, y, s=s)(self.x), -1, self.y)
         return self
 
+    @_executed
     def to_function(self, s=0):
         r"""Create spline function.
 
@@ -694,6 +809,7 @@ class Weaver:
         """
         return spline_smooth(self.x, self.y, s=s)
 
+    @_executed
     def to_2d_array(self):
         """Return time series as 2D array.
 
@@ -702,6 +818,7 @@ class Weaver:
         xy: np.ndarray of shape (nr_of_samples, 2)
             2D array with each row representing one point in time series.
             The first column is the x-variable and the second column is the y-variable.
+            If there are many series, each of them is in a separate column after the x-variable.
 
         Examples
         --------
@@ -724,8 +841,95 @@ class Weaver:
                [15., 30.]])
 
         """
-        return np.column_stack((self.x, self.y))
+        return np.column_stack((self.x, self.y.T))
+
+    @_executed
+    def to_csv(self, file_name: str, chunk_size: int = 65536, fmt: str = '%.18e'):
+        """Write time series to CSV file in chunks.
+
+        Rows are the same as in :func:`to_2d_array`, but they are created and written
+        for `chunk_size` points at once. Written file can be read with :func:`from_csv`.
+
+        Parameters
+        ----------
+        file_name: str
+            Path to CSV file.
+        chunk_size: int, default: 65536
+            Number of points written at once.
+        fmt: str, default: '%.18e'
+            Format of values, as in :func:`numpy.savetxt`.
+
+        See Also
+        --------
+        :func:`~traffic_weaver.sinks.write_csv`
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> import numpy as np
+        >>> from traffic_weaver.weaver import Weaver
+        >>> file_name = os.path.join(tempfile.mkdtemp(), 'series.csv')
+        >>> Weaver(np.arange(5), np.arange(5) * 2).to_csv(file_name)
+        >>> Weaver.from_csv(file_name).get()[1]
+        array([0., 2., 4., 6., 8.])
+        """
+        write_csv(file_name, _iter_chunks(self.x, self.y, chunk_size), fmt=fmt)
+
+    @_executed
+    def to_npy(self, file_name: str, chunk_size: int = 65536):
+        """Write time series to NPY file in chunks.
+
+        Array of the same shape as :func:`to_2d_array` is created as a memory-mapped file,
+        and `chunk_size` points are copied to it at once.
+
+        Parameters
+        ----------
+        file_name: str
+            Path to NPY file.
+        chunk_size: int, default: 65536
+            Number of points written at once.
+
+        See Also
+        --------
+        :func:`~traffic_weaver.sinks.write_npy`
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> import numpy as np
+        >>> from traffic_weaver.weaver import Weaver
+        >>> file_name = os.path.join(tempfile.mkdtemp(), 'series.npy')
+        >>> Weaver(np.arange(3), np.arange(3) * 2).to_npy(file_name)
+        >>> np.load(file_name)
+        array([[0., 0.],
+               [1., 2.],
+               [2., 4.]])
+        """
+        write_npy(file_name, _iter_chunks(self.x, self.y, chunk_size), len(self.x))
+
+    @_executed
+    def to_parquet(self, file_name: str, chunk_size: int = 65536, **kwargs):
+        """Write time series to Parquet file in chunks.
+
+        Each chunk of `chunk_size` points is written as a separate row group.
+        Requires `pyarrow` package.
+
+        Parameters
+        ----------
+        file_name: str
+            Path to Parquet file.
+        chunk_size: int, default: 65536
+            Number of points written at once.
+        **kwargs
+            Parameters passed to :class:`pyarrow.parquet.ParquetWriter`.
+
+        See Also
+        --------
+        :func:`~traffic_weaver.sinks.write_parquet`
+        """
+        write_parquet(file_name, _iter_chunks(self.x, self.y, chunk_size), **kwargs)
 
+    @_deferred
     def scale_x(self, scale):
         """Scale x-axis.
 
@@ -755,6 +959,7 @@ class Weaver:
         self.reference_x = self.reference_x * scale
         return self
 
+    @_deferred
     def scale_y(self, scale):
         """Scale y-axis.
 
@@ -780,6 +985,7 @@ class Weaver:
         self.reference_y = self.reference_y * scale
         return self
 
+    @_deferred
     def shift_x(self, shift):
         """Shift x-axis
 
@@ -808,6 +1014,7 @@ class Weaver:
         self.reference_x = self.reference_x + shift
         return self
 
+    @_deferred
     def shift_y(self, shift):
         """Shift y-axis.
 
@@ -836,6 +1043,7 @@ class Weaver:
         self.reference_y = self.reference_y + shift
         return self
 
+    @_deferred
     def normalize_x(self, min_val, max_val):
         """Normalize x values.
 
@@ -868,6 +1076,7 @@ class Weaver:
         self.reference_x = normalize(self.reference_x, min_val, max_val)
         return self
 
+    @_deferred
     def normalize_y(self, min_val, max_val):
         """Normalize y values.
 
@@ -895,15 +1104,18 @@ class Weaver:
         array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9., 10.])
 
         """
-        self.y = normalize(self.y, min_val, max_val)
-        self.original_y = normalize(self.original_y, min_val, max_val)
-        self.reference_y = normalize(self.reference_y, min_val, max_val)
+        # each series is normalized separately
+        self.y = normalize(self.y, min_val, max_val, axis=-1)
+        self.original_y = normalize(self.original_y, min_val, max_val, axis=-1)
+        self.reference_y = normalize(self.reference_y, min_val, max_val, axis=-1)
         return self
 
+    @_executed
     def __len__(self):
         """Length of the time series"""
         return len(self.x)
 
+    @_deferred
     def truncate_by_value(self, x_left, x_right, x_left_as_ratio=False, x_right_as_ratio=False):
         """Truncate to specific value range or ratio of the range.
 
@@ -947,6 +1159,7 @@ class Weaver:
                                                       x_right_as_ratio=x_right_as_ratio)
         return self
 
+    @_deferred
     def truncate_by_index(self, start=0, stop=None):
         """Truncate to specific index of the range.
 
@@ -982,7 +1195,136 @@ class Weaver:
         if stop > len(self.x):
             raise ValueError("Stop index should be less than length of x")
         self.x = self.x[start:stop]
-        self.y = self.y[start:stop]
+        self.y = self.y[..., start:stop]
         self.reference_x = self.reference_x[start:stop]
-        self.reference_y = self.reference_y[start:stop]
+        self.reference_y = self.reference_y[..., start:stop]
         return self
+
+
+# Weaver operations that can be recorded in a pipeline
+_PIPELINE_STEPS = ('append_one_sample', 'interpolate', 'recreate_from_average', 'integral_match', 'noise', 'repeat',
+                   'trend', 'smooth', 'scale_x', 'scale_y', 'shift_x', 'shift_y', 'normalize_x', 'normalize_y',
+                   'truncate_by_value', 'truncate_by_index')
+
+
+class WeaverPipeline:
+    r"""Recipe of :class:`Weaver` operations applied to many time series.
+
+    Operations are recorded once by chaining the same methods as in :class:`Weaver`
+    and executed for each input time series with :func:`run` or :func:`run_many`.
+    Time series sharing the same `x` are processed at once as rows of a 2-D array,
+    so the work that depends only on `x` (e.g., oversampled `x`, transition windows,
+    fixed points and integral matching weights) is done once for all of them.
+    That work is not cached, it is repeated for each call of :func:`run` and for each
+    group of time series with different `x` in :func:`run_many`.
+
+    Parameters
+    ----------
+    lazy: bool, default: True
+        Whether operations are executed by a lazy :class:`Weaver`,
+        which fuses consecutive element-wise operations on `y`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from traffic_weaver import WeaverPipeline
+    >>> from traffic_weaver.rfa import LinearFixedRFA
+    >>> pipeline = (WeaverPipeline()
+    ...             .append_one_sample(make_periodic=True)
+    ...             .recreate_from_average(2, rfa_class=LinearFixedRFA)
+    ...             .integral_match())
+    >>> res_x, res_y = pipeline.run([0, 1, 2], [1, 3, 2])
+    >>> res_x
+    array([0. , 0.5, 1. , 1.5, 2. , 2.5, 3. ])
+    >>> results = pipeline.run_many([([0, 1, 2], [1, 3, 2]), ([0, 1, 2], [2, 2, 2]), ([0, 2, 4], [1, 2, 3])])
+    >>> [res_y.shape for _, res_y in results]
+    [(7,), (7,), (7,)]
+
+    """
+
+    def __init__(self, lazy=True):
+        self.lazy = lazy
+        self.steps = []
+
+    def run(self, x, y):
+        r"""Execute recorded operations on time series.
+
+        Parameters
+        ----------
+        x: 1-D array-like of size n, optional
+            Independent variable in strictly increasing order.
+        y: array-like of shape (n, ) or (n_series, n)
+            Dependent variable.
+
+        Returns
+        -------
+        ndarray
+            x, processed independent variable.
+        ndarray
+            y, processed dependent variable.
+        """
+        return self._run(x, y, self.steps)
+
+    def _run(self, x, y, steps):
+        weaver = Weaver(x, y, lazy=self.lazy)
+        for name, args, kwargs in steps:
+            getattr(weaver, name)(*args, **kwargs)
+        return weaver.get()
+
+    def run_many(self, series):
+        r"""Execute recorded operations on many time series.
+
+        Time series with the same `x`, i.e., with equal dtype and values, are processed
+        together, and the work depending only on `x` is done once for each such group.
+        Random generator `rng` recorded in operations, e.g., in :func:`noise`,
+        is used to spawn an independent generator for each time series, so the result
+        of a time series does not depend on the other ones processed with it.
+
+        Parameters
+        ----------
+        series: Iterable[tuple[array-like, array-like]]
+            Pairs of `x` and `y` of each time series. `x` can be None,
+            then it is a set of integers from 0 to `len(y) - 1`.
+
+        Returns
+        -------
+        list[tuple[ndarray, ndarray]]
+            Processed `x` and `y` of each time series, in the same order as in `series`.
+        """
+        series = [(np.arange(len(y)) if x is None else np.asarray(x), np.asarray(y)) for x, y in series]
+
+        groups = {}
+        for i, (x, _) in enumerate(series):
+            groups.setdefault((x.dtype.str, x.tobytes()), []).append(i)
+
+        # generators of each time series, spawned for each operation with recorded `rng`
+        rngs = {step: np.random.default_rng(kwargs['rng']).spawn(len(series))
+                for step, (_, _, kwargs) in enumerate(self.steps) if kwargs.get('rng') is not None}
+
+        results = [None] * len(series)
+        for indices in groups.values():
+            steps = [(name, args, dict(kwargs, rng=[rngs[step][i] for i in indices]) if step in rngs else kwargs)
+                     for step, (name, args, kwargs) in enumerate(self.steps)]
+            res_x, res_ys = self._run(series[indices[0]][0], np.stack([series[i][1] for i in indices]), steps)
+            for i, res_y in zip(indices, res_ys):
+                results[i] = (res_x, res_y)
+        return results
+
+
+def _pipeline_step(name):
+    r"""Create method recording :class:`Weaver` operation in the pipeline.
+
+    The method has the docstring and the signature of the recorded :class:`Weaver` method.
+    """
+
+    @functools.wraps(getattr(Weaver, name))
+    def step(self, *args, **kwargs):
+        self.steps.append((name, args, kwargs))
+        return self
+
+    step.__qualname__ = f"WeaverPipeline.{name}"
+    return step
+
+
+for _name in _PIPELINE_STEPS:
+    setattr(WeaverPipeline, _name, _pipeline_step(_name))
@@ -101,7 +101,7 @@ def test_ams_ix():
             load_dataset(dataset)
 
 
-def text_ix_br():
+def test_ix_br():
     datasets = """
         ix-br-aggregated_daily
         ix-br-aggregated_weekly
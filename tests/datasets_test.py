@@ -0,0 +1,405 @@
+import gzip
+import hashlib
+import io
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from traffic_weaver.datasets import load_dataset, prefetch, clear_dataset_cache, set_dataset_cache_max_bytes
+from traffic_weaver.datasets import _datasets
+from traffic_weaver.datasets._base import (RemoteFileMetadata, load_csv_dataset_from_remote, _dataset_cache,
+                                           _fetch_remote, _CsvStreamParser, _get_dataset_loader)
+from traffic_weaver.datasets._registry import DATASETS
+from traffic_weaver.readers import read_csv
+
+REMOTE = RemoteFileMetadata(filename="dataset.csv", url="https://example.com/dataset.csv", checksum="")
+
+
+@pytest.fixture(autouse=True)
+def empty_dataset_cache():
+    max_bytes = _dataset_cache.max_bytes
+    clear_dataset_cache()
+    yield
+    set_dataset_cache_max_bytes(max_bytes)
+    clear_dataset_cache()
+
+
+@pytest.fixture
+def dataset():
+    return np.column_stack((np.arange(5, dtype=float), np.array([1, 3, 4, 1, 2], dtype=float)))
+
+
+@pytest.fixture
+def mock_fetch_remote(mocker, dataset):
+    def fetch_remote(remote, dirname=None, parser=None, **kwargs):
+        file_path = os.path.join(dirname, remote.filename)
+        np.savetxt(file_path, dataset, delimiter=',')
+        with open(file_path, 'rb') as f:
+            parser.update(f.read())
+        return file_path
+
+    return mocker.patch("traffic_weaver.datasets._base._fetch_remote", side_effect=fetch_remote)
+
+
+def load(data_home, **kwargs):
+    return load_csv_dataset_from_remote(REMOTE, "dataset", "folder", data_home=str(data_home), **kwargs)
+
+
+def test_load_csv_dataset_from_remote_caches_npy(tmp_path, dataset, mock_fetch_remote):
+    assert_array_equal(load(tmp_path), dataset)
+    assert os.listdir(tmp_path / "folder") == ["dataset.npy"]
+
+    assert_array_equal(load(tmp_path), dataset)
+    assert mock_fetch_remote.call_count == 1
+
+
+@pytest.mark.parametrize("unpack_dataset_columns", [False, True])
+def test_load_csv_dataset_from_remote_with_mmap(tmp_path, dataset, mock_fetch_remote, unpack_dataset_columns):
+    load(tmp_path)
+    loaded = load(tmp_path, mmap_mode='r', unpack_dataset_columns=unpack_dataset_columns)
+
+    if unpack_dataset_columns:
+        assert all(isinstance(column, np.memmap) for column in loaded)
+        assert_array_equal(loaded[0], dataset[:, 0])
+        assert_array_equal(loaded[1], dataset[:, 1])
+    else:
+        assert isinstance(loaded, np.memmap)
+        assert_array_equal(loaded, dataset)
+
+
+def test_load_csv_dataset_from_remote_converts_pickle_cache(tmp_path, dataset, mock_fetch_remote):
+    os.makedirs(tmp_path / "folder")
+    with open(tmp_path / "folder" / "dataset", "wb") as f:
+        pickle.dump(dataset, f)
+
+    assert_array_equal(load(tmp_path, download_if_missing=False), dataset)
+    assert os.listdir(tmp_path / "folder") == ["dataset.npy"]
+    mock_fetch_remote.assert_not_called()
+
+
+def test_fail_load_csv_dataset_from_remote_if_missing(tmp_path):
+    with pytest.raises(OSError):
+        load(tmp_path, download_if_missing=False)
+
+
+def test_load_dataset_from_cache(mocker):
+    loader = mocker.patch("traffic_weaver.datasets._base.read_csv", wraps=read_csv)
+    data = load_dataset('sandvine_audio')
+    x, y = load_dataset('sandvine_audio', unpack_dataset_columns=True)
+
+    assert loader.call_count == 1
+    assert load_dataset('sandvine_audio') is data
+    assert_array_equal(x, data[:, 0])
+    assert_array_equal(y, data[:, 1])
+    for array in [data, x, y]:
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[0] = 0
+
+
+def test_load_dataset_without_cache():
+    data = load_dataset('sandvine_audio', use_cache=False)
+    assert data.flags.writeable
+    assert load_dataset('sandvine_audio', use_cache=False) is not data
+    assert load_dataset('sandvine_audio') is not data
+    assert _dataset_cache.nbytes == data.nbytes
+
+
+def test_clear_dataset_cache():
+    audio, cloud = load_dataset('sandvine_audio'), load_dataset('sandvine_cloud')
+
+    clear_dataset_cache('sandvine_audio')
+    assert load_dataset('sandvine_audio') is not audio
+    assert load_dataset('sandvine_cloud') is cloud
+
+    clear_dataset_cache()
+    assert _dataset_cache.nbytes == 0
+    assert load_dataset('sandvine_cloud') is not cloud
+
+
+def test_dataset_cache_evicts_least_recently_used():
+    audio = load_dataset('sandvine_audio')
+    set_dataset_cache_max_bytes(2 * audio.nbytes)
+    cloud = load_dataset('sandvine_cloud')
+    assert load_dataset('sandvine_audio') is audio
+    load_dataset('sandvine_web')
+
+    assert _dataset_cache.nbytes <= 2 * audio.nbytes
+    assert load_dataset('sandvine_audio') is audio
+    assert load_dataset('sandvine_cloud') is not cloud
+
+    set_dataset_cache_max_bytes(0)
+    assert _dataset_cache.nbytes == 0
+    assert load_dataset('sandvine_audio') is not load_dataset('sandvine_audio')
+
+
+def test_registry_of_bundled_datasets():
+    from importlib import resources
+
+    from traffic_weaver.datasets._base import RESOURCES_DATASETS
+
+    for dataset, metadata in DATASETS.items():
+        assert dataset == dataset.lower().replace('-', '_')
+        if metadata.source == 'resources':
+            assert (resources.files(RESOURCES_DATASETS) / metadata.folder / metadata.filename).is_file()
+        else:
+            assert metadata.source == 'remote'
+            assert metadata.url.startswith('https://') and len(metadata.checksum) == 64
+
+
+@pytest.mark.parametrize("dataset", ['ams-ix_daily', 'ams_ix_daily'])
+def test_get_dataset_loader_of_remote_dataset(dataset):
+    loader = _get_dataset_loader(dataset)
+    assert loader.func is load_csv_dataset_from_remote
+    assert loader.keywords['remote'].url == DATASETS['ams_ix_daily'].url
+    assert loader.keywords['remote'].checksum == DATASETS['ams_ix_daily'].checksum
+    assert loader.keywords['dataset_filename'] == 'ams-ix_daily'
+    assert loader.keywords['dataset_folder'] == 'ams-ix'
+
+
+def test_loading_functions_of_previous_versions():
+    assert_array_equal(_datasets.load_sandvine_audio(), load_dataset('sandvine_audio'))
+    assert _datasets.fetch_ams_ix_daily.keywords == _get_dataset_loader('ams_ix_daily').keywords
+    assert {'load_sandvine_audio', 'fetch_ams_ix_daily'} <= set(dir(_datasets))
+    for name in ['fetch_sandvine_audio', 'load_ams_ix_daily', 'fetch_no_such_dataset']:
+        with pytest.raises(AttributeError):
+            getattr(_datasets, name)
+
+
+def test_fail_load_missing_dataset():
+    with pytest.raises(ValueError):
+        load_dataset('no_such_dataset')
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    r"""Serves `content` for any path, optionally with Range support and failing the first response."""
+    content = b''
+    support_range = True
+    fail_after = None
+    write_delay = 0
+    range_headers = []
+
+    def do_GET(self):
+        range_header = self.headers.get('Range')
+        type(self).range_headers.append(range_header)
+        start = int(range_header[len('bytes='):-1]) if range_header and self.support_range else 0
+        if start >= len(self.content) > 0:
+            self.send_response(416)
+            self.end_headers()
+            return
+        body = self.content[start:]
+        self.send_response(206 if start > 0 else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.fail_after is not None:
+            # send only part of the body and close the connection
+            self.wfile.write(body[:self.fail_after])
+            type(self).fail_after = None
+            self.close_connection = True
+            return
+        for start in range(0, len(body), 1000):
+            # slow responses overlap with each other
+            time.sleep(self.write_delay)
+            self.wfile.write(body[start:start + 1000])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(dataset):
+    content = ''.join(f'{x},{y}\n' for x, y in dataset).encode() * 1000
+    handler = type('Handler', (_RangeRequestHandler,), {'content': content, 'range_headers': []})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    yield handler, f'http://127.0.0.1:{httpd.server_address[1]}/'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def remote_on(server, filename='dataset.csv'):
+    handler, url = server
+    checksum = hashlib.sha256(handler.content).hexdigest()
+    return RemoteFileMetadata(filename=filename, url=url + filename, checksum=checksum)
+
+
+def test_fetch_remote(tmp_path, server):
+    file_path = _fetch_remote(remote_on(server), dirname=tmp_path)
+    assert open(file_path, 'rb').read() == server[0].content
+    assert os.listdir(tmp_path) == ['dataset.csv']
+
+
+@pytest.mark.parametrize("support_range", [True, False])
+def test_fetch_remote_resumes_partial_file(tmp_path, server, support_range):
+    handler = server[0]
+    handler.support_range = support_range
+    with open(tmp_path / 'dataset.csv.part', 'wb') as f:
+        f.write(handler.content[:100] if support_range else b'corrupted')
+
+    file_path = _fetch_remote(remote_on(server), dirname=tmp_path)
+    assert open(file_path, 'rb').read() == handler.content
+    assert handler.range_headers == ['bytes=100-' if support_range else 'bytes=9-']
+
+
+def test_fetch_remote_resumes_after_failure(tmp_path, server):
+    handler = server[0]
+    handler.fail_after = 1000
+
+    with pytest.warns(UserWarning, match="Retry"):
+        file_path = _fetch_remote(remote_on(server), dirname=tmp_path, delay=0)
+    assert open(file_path, 'rb').read() == handler.content
+    assert handler.range_headers == [None, 'bytes=1000-']
+
+
+def test_concurrent_fetch_remote(tmp_path, server):
+    handler = server[0]
+    handler.write_delay = 0.001
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(_fetch_remote, remote_on(server), dirname=tmp_path) for _ in range(2)]
+
+    for future in futures:
+        assert open(future.result(), 'rb').read() == handler.content
+    assert os.listdir(tmp_path) == ['dataset.csv']
+
+
+def test_concurrent_fetch_remote_downloads_once(tmp_path, server):
+    handler = server[0]
+    handler.write_delay = 0.001
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(_fetch_remote, remote_on(server), dirname=tmp_path) for _ in range(3)]
+
+    for future in futures:
+        assert open(future.result(), 'rb').read() == handler.content
+    assert handler.range_headers == [None]
+
+
+def test_fetch_remote_downloads_again_if_local_file_is_corrupted(tmp_path, server):
+    handler = server[0]
+    (tmp_path / 'dataset.csv').write_bytes(b'corrupted')
+
+    file_path = _fetch_remote(remote_on(server), dirname=tmp_path)
+    assert open(file_path, 'rb').read() == handler.content
+    assert handler.range_headers == [None]
+
+
+def test_fetch_remote_parses_local_file(tmp_path, server, dataset):
+    handler = server[0]
+    (tmp_path / 'dataset.csv').write_bytes(handler.content)
+
+    parser = _CsvStreamParser()
+    _fetch_remote(remote_on(server), dirname=tmp_path, parser=parser)
+    assert_array_equal(parser.result(), np.tile(dataset, (1000, 1)))
+    assert handler.range_headers == []
+
+
+def test_fail_fetch_remote_with_wrong_checksum(tmp_path, server):
+    with pytest.raises(OSError):
+        _fetch_remote(remote_on(server)._replace(checksum='0'), dirname=tmp_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_load_csv_dataset_from_remote_parses_while_downloading(mocker, tmp_path, server, dataset):
+    reader = mocker.patch("traffic_weaver.datasets._base.read_csv", wraps=read_csv)
+    remote = remote_on(server)
+    loaded = load_csv_dataset_from_remote(remote, "dataset", "folder", data_home=str(tmp_path))
+
+    assert_array_equal(loaded, np.tile(dataset, (1000, 1)))
+    assert os.listdir(tmp_path / "folder") == ["dataset.npy"]
+    # downloaded file is not read again
+    assert all(isinstance(call.args[0], io.BytesIO) for call in reader.call_args_list)
+
+
+def test_load_gzip_csv_dataset_from_remote_after_failure(tmp_path, server, dataset):
+    handler = server[0]
+    handler.content = gzip.compress(handler.content)
+    handler.fail_after = len(handler.content) // 2
+
+    with pytest.warns(UserWarning, match="Retry"):
+        loaded = load_csv_dataset_from_remote(remote_on(server), "dataset", "folder", data_home=str(tmp_path),
+                                              delay=0, gzip=True)
+    assert_array_equal(loaded, np.tile(dataset, (1000, 1)))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 10 ** 6])
+def test_csv_stream_parser(compress, chunk_size):
+    content = ''.join(f'{x / 3!r},{np.sqrt(x)!r}\n' for x in range(1000)).encode()
+    expected = np.loadtxt(content.decode().splitlines(), delimiter=',', dtype=np.float64)
+    if compress:
+        # file of many gzip members
+        content = gzip.compress(content[:5000]) + gzip.compress(content[5000:])
+
+    parser = _CsvStreamParser(gzip=compress, block_size=100)
+    for start in range(0, len(content), chunk_size):
+        parser.update(content[start:start + chunk_size])
+    assert_array_equal(parser.result(), expected)
+
+
+def test_csv_stream_parser_reset():
+    parser = _CsvStreamParser(block_size=1)
+    parser.update(b'1,2\n3,')
+    parser.reset()
+    parser.update(b'5,6\n7,8')
+    assert_array_equal(parser.result(), [[5, 6], [7, 8]])
+
+
+def test_fail_csv_stream_parser_with_truncated_gzip():
+    parser = _CsvStreamParser(gzip=True)
+    parser.update(gzip.compress(b'1,2\n3,4\n')[:-4])
+    with pytest.raises(EOFError):
+        parser.result()
+
+
+def test_prefetch(mocker, tmp_path, server):
+    fetch_remote = mocker.patch("traffic_weaver.datasets._base._fetch_remote",
+                                side_effect=lambda remote, **kwargs: _fetch_remote(
+                                    remote_on(server, remote.filename), **kwargs))
+
+    prefetch(['ams-ix_daily', 'mix-it-milan_weekly', 'sandvine_audio', 'ams-ix_daily'], data_home=str(tmp_path),
+             max_workers=2)
+    assert fetch_remote.call_count == 2
+    assert_array_equal(load_dataset('ams-ix_daily', data_home=str(tmp_path), download_if_missing=False),
+                       np.loadtxt(server[0].content.splitlines(), delimiter=','))
+
+    # cached datasets are not downloaded again
+    prefetch('ams-ix_daily', data_home=str(tmp_path))
+    assert fetch_remote.call_count == 2
+
+
+def test_load_dataset_downloaded_again_skips_cache(mocker, tmp_path, server):
+    fetch_remote = mocker.patch("traffic_weaver.datasets._base._fetch_remote",
+                                side_effect=lambda remote, **kwargs: _fetch_remote(
+                                    remote_on(server, remote.filename), **kwargs))
+
+    data = load_dataset('ams-ix_daily', data_home=str(tmp_path))
+    assert load_dataset('ams-ix_daily', data_home=str(tmp_path)) is data
+    assert fetch_remote.call_count == 1
+
+    refreshed = load_dataset('ams-ix_daily', data_home=str(tmp_path), download_even_if_available=True)
+    assert fetch_remote.call_count == 2
+    assert refreshed is not data
+    assert_array_equal(refreshed, data)
+    # downloaded dataset replaces the cached one
+    assert load_dataset('ams-ix_daily', data_home=str(tmp_path)) is refreshed
+    assert _dataset_cache.nbytes == refreshed.nbytes
+
+
+def test_prefetch_all(mocker, tmp_path):
+    loader = mocker.patch("traffic_weaver.datasets._base._get_dataset_loader")
+    prefetch(data_home=str(tmp_path))
+    names = [call.args[0] for call in loader.call_args_list]
+    assert {'ams_ix_daily', 'ix_br_aggregated_daily', 'mix_it_milan_weekly'} <= set(names)
+    assert not any(name.startswith('sandvine') for name in names)
+
+
+def test_fail_prefetch_missing_dataset():
+    with pytest.raises(ValueError):
+        prefetch(['ams-ix_daily', 'no_such_dataset'])
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import traffic_weaver
+
+# cumulative import time of traffic_weaver package, excluding its third-party dependencies
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(traffic_weaver.__file__)))
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def import_time_us(module, code):
+    r"""Cumulative import time of `module` in microseconds reported by `python -X importtime -c code`."""
+    for line in run_python('-X', 'importtime', '-c', code).stderr.splitlines():
+        if line.startswith('import time:') and line.split('|')[2].strip() == module:
+            return int(line.split('|')[1])
+    raise ValueError(f"{module} was not imported")
+
+
+def test_import_time_budget():
+    # the best of a few runs, so the test is not affected by other processes
+    best = min(import_time_us('traffic_weaver', "import numpy; import traffic_weaver") for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize("module", ['traffic_weaver.datasets._base', 'traffic_weaver.datasets._registry',
+                                    'urllib.request', 'http.client', 'multiprocessing', 'scipy'])
+def test_import_does_not_import_module(module):
+    code = f"import sys, traffic_weaver; print({module!r} in sys.modules)"
+    assert run_python('-c', code).stdout.strip() == 'False'
+
+
+@pytest.mark.parametrize("code", [
+    "traffic_weaver.process.interpolate([0, 1, 2], [0, 1, 0], [0.5], method='cubic')",
+    "traffic_weaver.process.spline_smooth([0, 1, 2, 3], [0, 1, 0, 1])",
+    "traffic_weaver.rfa.CubicSplineRFA([0, 1, 2], [0, 1, 0], 4).rfa()",
+])
+def test_scipy_is_imported_when_needed(code):
+    code = f"import sys, traffic_weaver; {code}; print('scipy.interpolate' in sys.modules)"
+    assert run_python('-c', code).stdout.strip() == 'True'
@@ -5,8 +5,10 @@ from pytest import approx
 
 from traffic_weaver.match import (_integral_matching_stretch,
                                   _interval_integral_matching_stretch,
-                                  integral_matching_reference_stretch, )
-from traffic_weaver.sorted_array_utils import rectangle_integral
+                                  integral_matching_reference_stretch,
+                                  integral_matching_reference_stretch_iter, )
+from traffic_weaver.rfa import ExpAdaptiveRFA
+from traffic_weaver.sorted_array_utils import integral, rectangle_integral
 
 
 @pytest.fixture
@@ -204,3 +206,158 @@ def test_integral_matching_reference_stretch_with_fixed_points_indices_in_x(x, y
     y2 = integral_matching_reference_stretch(x, y, x_ref, y_ref, fixed_points_indices_in_x=fixed_indices_in_x,
                                              reference_function_integral_method='rectangle')
     assert_array_almost_equal(y2, expected_y, decimal=2)
+
+
+@pytest.mark.parametrize("target_method, reference_method", [('trapezoid', 'rectangle'), ('rectangle', 'trapezoid')])
+@pytest.mark.parametrize("s", [None, 1.0])
+def test_integral_matching_reference_stretch_many_series(x, y, target_method, reference_method, s):
+    ys = np.array([y, np.multiply(y, 2), np.add(y, 1)])
+    x_ref = x[::2]
+    ys_ref = np.array([[1, 2.1, 6, 2, 3, 6], [0, 1, 2, 3, 4, 5], [6, 5, 4, 3, 2, 1]])
+
+    ys2 = integral_matching_reference_stretch(x, ys, x_ref, ys_ref, target_function_integral_method=target_method,
+                                              reference_function_integral_method=reference_method, s=s)
+
+    assert ys2.shape == ys.shape
+    for y_row, y_ref_row, y2_row in zip(ys, ys_ref, ys2):
+        expected_y = integral_matching_reference_stretch(x, y_row, x_ref, y_ref_row,
+                                                         target_function_integral_method=target_method,
+                                                         reference_function_integral_method=reference_method, s=s)
+        np.testing.assert_array_equal(y2_row, expected_y)
+
+
+@pytest.mark.parametrize("integral_method", ['trapezoid', 'rectangle'])
+@pytest.mark.parametrize("alpha", [0.5, 1.0, 2.0])
+@pytest.mark.parametrize("interval_points", [[0, 3, 6, 9], [0, 1, 2, 5, 6, 10], [1, 2, 3, 4], [0, 4, 5, 10]])
+def test_interval_integral_matching_stretch_same_as_stretching_each_interval(x, y, integral_method, alpha,
+                                                                             interval_points):
+    x = np.asarray(x, dtype=float) * 0.3
+    expected_integrals = np.linspace(-3, 7, len(interval_points) - 1)
+
+    expected_y = np.array(y, dtype=float)
+    for integral_value, start, end in zip(expected_integrals, interval_points[:-1], interval_points[1:]):
+        expected_y[start:end + 1] = _integral_matching_stretch(x[start:end + 1], expected_y[start:end + 1],
+                                                               integral_value=integral_value,
+                                                               integral_method=integral_method, alpha=alpha)
+
+    y2 = _interval_integral_matching_stretch(x, y, integral_values=expected_integrals,
+                                             fixed_points_indices_in_x=interval_points,
+                                             integral_method=integral_method, alpha=alpha)
+
+    np.testing.assert_array_equal(y2, expected_y)
+
+
+# original implementation stretching intervals one by one, results have to be exactly the same
+def _loop_integral_matching_stretch(x, y, integral_value=0, integral_method='trapezoid', alpha=1.0):
+    current_integral = integral(x, y, method=integral_method).sum()
+
+    delta_p = integral_value - current_integral
+    x_n2 = (x[-1] + x[0]) / 2
+
+    delta_x = x[-1] - x[0]
+    delta_xi = np.diff(x)
+
+    # if there are only two points - set weights to 1
+    if len(x) == 2:
+        w = np.array([1., 1.])
+    else:
+        w = 1 - (2 * np.abs(x_n2 - x) / delta_x) ** alpha
+
+    y_hat = 0
+    if integral_method == 'trapezoid':
+        y_hat = 2 * delta_p / np.sum((w[1:] + w[:-1]) * delta_xi)
+    elif integral_method == 'rectangle':
+        y_hat = delta_p / np.sum(w[:-1] * delta_xi)
+
+    return y + y_hat * w
+
+
+def _loop_interval_integral_matching_stretch(x, y, integral_values, fixed_points_indices_in_x,
+                                             integral_method='trapezoid', alpha=1.0):
+    y = np.array(y, dtype=float)
+
+    for integral_value, start, end in zip(integral_values, fixed_points_indices_in_x[:-1],
+                                          fixed_points_indices_in_x[1:]):
+        end = end + 1
+        y[start:end] = _loop_integral_matching_stretch(x[start:end], y[start:end], integral_value=integral_value,
+                                                       integral_method=integral_method, alpha=alpha)
+    return y
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("integral_method", ['trapezoid', 'rectangle'])
+@pytest.mark.parametrize("step", [1, 2, 12])
+def test_interval_integral_matching_stretch_same_as_loop(seed, integral_method, step):
+    rng = np.random.default_rng(seed)
+    x = [np.arange(8761) * 3600 / 7, np.cumsum(rng.uniform(0.01, 1, 8761)), np.arange(8761.0),
+         np.linspace(0, 1, 8761)][seed]
+    y = rng.uniform(0, 5, 8761)
+    fixed_points = np.arange(0, 8761, step)
+    integral_values = rng.uniform(0, 5, len(fixed_points) - 1) * np.diff(x[fixed_points])
+
+    expected_y = _loop_interval_integral_matching_stretch(x, y, integral_values, fixed_points,
+                                                          integral_method=integral_method)
+    res_y = _interval_integral_matching_stretch(x, y, integral_values=integral_values,
+                                                fixed_points_indices_in_x=fixed_points,
+                                                integral_method=integral_method)
+    np.testing.assert_array_equal(res_y, expected_y)
+
+    # each series is stretched the same as alone
+    ys = np.stack([y, np.flip(y)])
+    ys_integral_values = np.stack([integral_values, np.flip(integral_values)])
+    res_ys = _interval_integral_matching_stretch(x, ys, integral_values=ys_integral_values,
+                                                 fixed_points_indices_in_x=fixed_points,
+                                                 integral_method=integral_method)
+    np.testing.assert_array_equal(res_ys[0], res_y)
+    np.testing.assert_array_equal(res_ys[1], _loop_interval_integral_matching_stretch(
+        x, ys[1], ys_integral_values[1], fixed_points, integral_method=integral_method))
+
+
+@pytest.mark.parametrize("y", [np.sin(np.arange(8761) / 24) + 2, np.stack([np.sin(np.arange(8761) / 24) + 2,
+                                                                           np.cos(np.arange(8761) / 12) + 3])])
+def test_integral_matching_reference_stretch_with_rectangle_on_the_same_points(y):
+    # each interval contains two points, so each of them moves the start of the next interval
+    x = np.arange(8761, dtype=float)
+    y_ref = np.flip(y, axis=-1)
+
+    y2 = integral_matching_reference_stretch(x, y, x, y_ref, target_function_integral_method='rectangle',
+                                             reference_function_integral_method='rectangle')
+
+    expected_y = np.array(y, dtype=float)
+    for i in range(len(x) - 1):
+        expected_y[..., i:i + 2] = _integral_matching_stretch(x[i:i + 2], expected_y[..., i:i + 2],
+                                                              integral_value=y_ref[..., i],
+                                                              integral_method='rectangle')
+    np.testing.assert_array_equal(y2, expected_y)
+
+
+@pytest.mark.parametrize("chunk_intervals", [1, 2, 5, 100])
+@pytest.mark.parametrize("strategy", ['closest', 'lower', 'higher'])
+@pytest.mark.parametrize("target_method, reference_method", [('trapezoid', 'rectangle'), ('rectangle', 'trapezoid')])
+@pytest.mark.parametrize("y_ref", [[1, 3, 4, 1, 2, 5, 6, 2, 2, 1],
+                                   [[1, 3, 4, 1, 2, 5, 6, 2, 2, 1], [2, 2, 2, 1, 1, 0, 4, 4, 3, 2]]])
+def test_integral_matching_reference_stretch_iter_same_as_reference_stretch(chunk_intervals, strategy, target_method,
+                                                                            reference_method, y_ref):
+    x_ref = np.cumsum(np.linspace(0.5, 1.5, np.shape(y_ref)[-1]))
+    rfa = ExpAdaptiveRFA(x_ref, y_ref, 5)
+    x, y = rfa.rfa()
+    kwargs = dict(fixed_points_finding_strategy=strategy, target_function_integral_method=target_method,
+                  reference_function_integral_method=reference_method)
+    expected_y = integral_matching_reference_stretch(x, y, x_ref, y_ref, **kwargs)
+
+    chunks = list(integral_matching_reference_stretch_iter(rfa.rfa_iter(chunk_intervals), x_ref, y_ref, **kwargs))
+    np.testing.assert_array_equal(np.concatenate([chunk_x for chunk_x, _ in chunks]), x)
+    np.testing.assert_array_equal(np.concatenate([chunk_y for _, chunk_y in chunks], axis=-1), expected_y)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 100])
+def test_integral_matching_reference_stretch_iter_with_points_outside_reference(x, y, chunk_size):
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x_ref, y_ref = [0, 4, 8], [1, 2, 3]
+    expected_y = integral_matching_reference_stretch(x, y, x_ref, y_ref)
+
+    chunks = [(x[i:i + chunk_size], y[i:i + chunk_size]) for i in range(0, len(x), chunk_size)]
+    res_y = np.concatenate([chunk_y for _, chunk_y in integral_matching_reference_stretch_iter(chunks, x_ref, y_ref)])
+    np.testing.assert_array_equal(res_y, expected_y)
+    # points outside of reference are not moved
+    np.testing.assert_array_equal(res_y[x > 8], y[x > 8])
@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from traffic_weaver import WeaverPipeline
+from traffic_weaver.datasets import load_dataset
+from traffic_weaver.parallel import run_pipeline_on_datasets
+
+DATASETS = ['sandvine_audio', 'sandvine_cloud', 'sandvine_gaming']
+
+
+@pytest.fixture
+def pipeline():
+    return WeaverPipeline().append_one_sample(make_periodic=True).recreate_from_average(4).integral_match()
+
+
+def test_run_pipeline_on_datasets_same_as_run(pipeline):
+    results = run_pipeline_on_datasets(pipeline, DATASETS, max_workers=2, chunksize=2)
+
+    assert len(results) == len(DATASETS)
+    for dataset, (res_x, res_y) in zip(DATASETS, results):
+        expected_x, expected_y = pipeline.run(*load_dataset(dataset, unpack_dataset_columns=True))
+        assert_array_equal(res_x, expected_x)
+        assert_array_equal(res_y, expected_y)
+
+
+def test_run_pipeline_on_datasets_noise_is_deterministic(pipeline):
+    pipeline.noise(20)
+    results = run_pipeline_on_datasets(pipeline, DATASETS, max_workers=2, chunksize=1, seed=7)
+    same_seed_results = run_pipeline_on_datasets(pipeline, DATASETS, max_workers=1, chunksize=3, seed=7)
+    other_seed_results = run_pipeline_on_datasets(pipeline, DATASETS, max_workers=2, seed=8)
+
+    for (_, res_y), (_, same_seed_y), (_, other_seed_y) in zip(results, same_seed_results, other_seed_results):
+        assert_array_equal(res_y, same_seed_y)
+        assert not np.array_equal(res_y, other_seed_y)
+
+
+@pytest.mark.parametrize("rng", [3, np.random.default_rng(3)])
+def test_run_pipeline_on_datasets_with_recorded_rng(pipeline, rng):
+    pipeline.noise(20, rng=rng)
+    results = run_pipeline_on_datasets(pipeline, DATASETS[:2] * 2, max_workers=2, seed=7)
+    other_seed_results = run_pipeline_on_datasets(pipeline, DATASETS[:2] * 2, max_workers=2, seed=8)
+
+    # the same dataset processed twice gets different noise
+    assert not np.array_equal(results[0][1], results[2][1])
+    assert not np.array_equal(results[1][1], results[3][1])
+    for (_, res_y), (_, other_seed_y) in zip(results, other_seed_results):
+        assert not np.array_equal(res_y, other_seed_y)
+
+
+def test_run_pipeline_on_datasets_noise_drawn_from_generator_of_dataset(pipeline):
+    results = run_pipeline_on_datasets(pipeline.noise(20), DATASETS, max_workers=2, seed=7)
+
+    for dataset, seed_sequence, (_, res_y) in zip(DATASETS, np.random.SeedSequence(7).spawn(len(DATASETS)), results):
+        expected_pipeline = WeaverPipeline().append_one_sample(make_periodic=True).recreate_from_average(4)
+        expected_pipeline.integral_match().noise(20, rng=np.random.default_rng(seed_sequence))
+        _, expected_y = expected_pipeline.run(*load_dataset(dataset, unpack_dataset_columns=True))
+        assert_array_equal(res_y, expected_y)
+
+
+def test_run_pipeline_on_missing_dataset(pipeline):
+    with pytest.raises(ValueError):
+        run_pipeline_on_datasets(pipeline, ['sandvine_audio', 'no_such_dataset'], max_workers=2)
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason="shared memory blocks are not listed in /dev/shm")
+@pytest.mark.parametrize("chunksize", [1, 2, 3])
+def test_run_pipeline_on_missing_dataset_releases_shared_memory(pipeline, chunksize):
+    blocks = set(os.listdir('/dev/shm'))
+    with pytest.raises(ValueError):
+        run_pipeline_on_datasets(pipeline, ['sandvine_audio', 'no_such_dataset', 'sandvine_cloud'], max_workers=2,
+                                 chunksize=chunksize)
+    assert set(os.listdir('/dev/shm')) <= blocks
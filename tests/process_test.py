@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 from numpy.ma.testutils import assert_array_equal, assert_array_almost_equal
 
-from traffic_weaver.process import (repeat, trend, linear_trend, noise_gauss, average, truncate, interpolate, )
+from traffic_weaver.process import (repeat, trend, linear_trend, noise_gauss, average, truncate, interpolate,
+                                    normalize, )
 
 
 @pytest.fixture
@@ -16,6 +17,21 @@ def test_repeat(xy):
     assert_array_equal(nx, np.arange(15))
 
 
+def test_repeat_with_uneven_spacing():
+    nx, ny = repeat([0.5, 1.0, 2.0], [1, 2, 3], 3)
+    assert_array_equal(nx, [0.5, 1.0, 2.0, 3.0, 3.5, 4.5, 5.5, 6.0, 7.0])
+    assert_array_equal(ny, [1, 2, 3] * 3)
+
+
+def test_repeat_y_as_view(xy):
+    y = np.asarray(xy[1], dtype=float)
+    nx, ny = repeat(xy[0], y, 3, y_as_view=True)
+    assert_array_equal(nx, np.arange(15))
+    assert ny.shape == (3, len(y))
+    assert np.shares_memory(ny, y)
+    assert_array_equal(ny.ravel(), list(xy[1]) * 3)
+
+
 def test_trend(xy):
     shift = [0, 1 / 16, 1 / 4, 9 / 16, 1]
     nx, ny = trend(xy[0], xy[1], lambda x: x ** 2, normalized=True)
@@ -23,6 +39,30 @@ def test_trend(xy):
     assert_array_equal(ny, xy[1] + shift)
 
 
+@pytest.mark.parametrize("fun", [lambda x: x ** 2, lambda x: max(x, 0.5) ** 2, lambda x: np.max(x) * 0.5,
+                                 lambda x: 0.25])
+@pytest.mark.parametrize("normalized", [True, False])
+def test_trend_vectorized_same_as_element_wise(xy, fun, normalized):
+    expected_x, expected_y = trend(xy[0], xy[1], fun, normalized=normalized, vectorized=False)
+    nx, ny = trend(xy[0], xy[1], fun, normalized=normalized)
+    assert_array_equal(nx, expected_x)
+    assert_array_equal(ny, expected_y)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_trend_does_not_modify_input(vectorized):
+    y = np.array([1, 3, 4, 1, 2], dtype=float)
+    y.setflags(write=False)
+    _, ny = trend(np.arange(5), y, lambda x: 2 * x, vectorized=vectorized)
+    assert_array_equal(ny, [1, 5, 8, 7, 10])
+    assert_array_equal(y, [1, 3, 4, 1, 2])
+
+    out = np.empty(5)
+    _, ny = trend(np.arange(5), y, lambda x: 2 * x, vectorized=vectorized, out=out)
+    assert ny is out
+    assert_array_equal(out, [1, 5, 8, 7, 10])
+
+
 def test_linear_trend(xy):
     shift = [0, 0.25, 0.5, 0.75, 1]
     nx, ny = linear_trend(xy[0], xy[1], 1, normalized=True)
@@ -68,6 +108,72 @@ def test_noise(mock_normal_generator):
     assert_array_almost_equal(ny, y + stds)
 
 
+def test_noise_with_generator():
+    y = np.ones((3, 1000))
+
+    ny = noise_gauss(y, snr=10, rng=np.random.default_rng(42))
+    assert_array_equal(ny, noise_gauss(y, snr=10, rng=42))
+    assert_array_equal(ny, noise_gauss(y, snr=10, rng=np.random.SeedSequence(42)))
+    assert not np.array_equal(ny, noise_gauss(y, snr=10, rng=43))
+    # rows are noised with independent samples
+    assert not np.array_equal(ny[0], ny[1])
+    # noise std follows from snr
+    assert_array_almost_equal(np.std(ny, axis=-1), [0.1 ** 0.5] * 3, decimal=1)
+
+
+def test_noise_signal_power_over_axis():
+    y = np.stack([np.ones(10000), np.full(10000, 100.0)])
+
+    # by default, signal power of the whole array is used
+    ny = noise_gauss(y, snr=0, rng=0)
+    assert_array_almost_equal(np.std(ny - y, axis=-1) / np.mean(y ** 2) ** 0.5, [1, 1], decimal=1)
+    ny = noise_gauss(y, snr=0, rng=0, axis=-1)
+    assert_array_almost_equal(np.std(ny - y, axis=-1) / [1, 100], [1, 1], decimal=1)
+
+
+def test_noise_snr_for_each_signal_over_axis():
+    y = np.stack([np.ones(10000), np.full(10000, 100.0)])
+
+    ny = noise_gauss(y, snr=[4, 100], snr_in_db=False, rng=0, axis=-1)
+    assert ny.shape == y.shape
+    assert_array_almost_equal(np.std(ny - y, axis=-1) / [1 / 2, 100 / 10], [1, 1], decimal=1)
+
+    # snr with a value for each element of the signal is kept as it is
+    snr = np.full(y.shape, 0.0)
+    assert_array_equal(noise_gauss(y, snr=snr, rng=0, axis=-1), noise_gauss(y, snr=0, rng=0, axis=-1))
+
+
+@pytest.mark.parametrize("in_place", [True, False])
+def test_noise_with_generator_into_out(in_place):
+    y = np.linspace(1, 2, 100)
+    expected = noise_gauss(y, std=0.5, rng=0)
+
+    out = y.copy() if in_place else np.empty_like(y)
+    ny = noise_gauss(out if in_place else y, std=0.5, out=out, rng=0)
+    assert ny is out
+    assert_array_equal(ny, expected)
+
+
+def test_noise_with_spawned_generators():
+    y = np.ones(100)
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(0).spawn(2)]
+    same_rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(0).spawn(2)]
+
+    noised = [noise_gauss(y, std=1.0, rng=rng) for rng in rngs]
+    assert_array_equal(noised[0], noise_gauss(y, std=1.0, rng=same_rngs[0]))
+    assert_array_equal(noised[1], noise_gauss(y, std=1.0, rng=same_rngs[1]))
+    assert not np.array_equal(noised[0], noised[1])
+
+
+def test_noise_with_generator_for_each_row():
+    y = np.ones((3, 100))
+    expected = [noise_gauss(row, snr=10, rng=rng) for row, rng in zip(y, np.random.default_rng(0).spawn(3))]
+
+    assert_array_equal(noise_gauss(y, snr=10, rng=np.random.default_rng(0).spawn(3)), expected)
+    with pytest.raises(ValueError):
+        noise_gauss(y, snr=10, rng=np.random.default_rng(0).spawn(2))
+
+
 def test_average(xy):
     ax, ay = average(xy[0], xy[1], 2)
     expected_x = [0, 2, 4]
@@ -136,3 +242,11 @@ def test_truncate_smaller_range():
     res_y = np.arange(26, 13.9, -2)
     assert_array_equal(res_x, new_x)
     assert_array_equal(res_y, new_y)
+
+
+def test_normalize():
+    a = np.array([[0, 1, 2], [2, 4, 6]])
+    assert_array_almost_equal(normalize(a), [[0, 1 / 6, 2 / 6], [2 / 6, 4 / 6, 1]])
+    assert_array_almost_equal(normalize(a, -1, 1), [[-1, -2 / 3, -1 / 3], [-1 / 3, 1 / 3, 1]])
+    assert_array_equal(normalize(a, axis=-1), [[0, 0.5, 1], [0, 0.5, 1]])
+    assert_array_equal(normalize(a, axis=0), [[0, 0, 0], [1, 1, 1]])
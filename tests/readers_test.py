@@ -0,0 +1,96 @@
+import io
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from traffic_weaver import Weaver
+from traffic_weaver.datasets._base import RESOURCES_DATASETS
+from traffic_weaver.readers import read_csv, _default_backend, _PYARROW_MIN_FILE_SIZE
+
+
+def available_backends():
+    backends = ['numpy']
+    for backend in ['pyarrow', 'pandas']:
+        try:
+            __import__(backend)
+            backends.append(backend)
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.fixture(params=available_backends())
+def backend(request):
+    return request.param
+
+
+@pytest.mark.parametrize("content", [
+    b'0,1.5\n1,2.5\n2,0.5\n',
+    b'0,1.5\n1,2.5',
+    b'0,1.5\r\n1,2.5\r\n',
+    b'0, 0.0555\n1, 0.027\n',
+    b'1,2,3\n4,5,6\n',
+    b'1,2\n',
+    b'-1e-300,inf\n2.5,nan\n',
+    b'0.1,0.30000000000000004\n1e22,5e-324\n',
+])
+def test_read_csv(backend, content):
+    expected = np.loadtxt(io.BytesIO(content), delimiter=',', dtype=np.float64, ndmin=2)
+    data = read_csv(io.BytesIO(content), backend=backend)
+    assert data.dtype == np.float64
+    assert_array_equal(data, expected)
+
+
+def test_read_csv_values_identical_to_loadtxt(tmp_path, backend):
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((10000, 2)) * 10.0 ** rng.integers(-30, 30, (10000, 2))
+    file_name = tmp_path / 'series.csv'
+    np.savetxt(file_name, values, delimiter=',', fmt='%.17g')
+
+    data = read_csv(file_name, backend=backend)
+    assert_array_equal(data, np.loadtxt(file_name, delimiter=',', dtype=np.float64))
+    assert_array_equal(data, values)
+
+
+def test_read_csv_of_sandvine_datasets(backend):
+    from importlib import resources
+
+    for file in (resources.files(RESOURCES_DATASETS) / 'sandvine').iterdir():
+        if file.name.endswith('.csv'):
+            with resources.as_file(file) as file_name:
+                assert_array_equal(read_csv(file_name, backend=backend), np.loadtxt(file_name, delimiter=','))
+
+
+@pytest.mark.parametrize("size, expected_backend", [(10, 'numpy'), (_PYARROW_MIN_FILE_SIZE, 'pyarrow')])
+def test_default_backend(tmp_path, size, expected_backend):
+    if expected_backend not in available_backends():
+        expected_backend = 'numpy'
+    file_name = tmp_path / 'series.csv'
+    file_name.write_bytes(b'0' * size)
+    assert _default_backend(file_name) == expected_backend
+    assert _default_backend(io.BytesIO(b'0' * size)) == expected_backend
+
+
+def test_default_backend_without_pyarrow(mocker):
+    mocker.patch.dict(sys.modules, {'pyarrow': None, 'pyarrow.csv': None})
+    assert _default_backend(io.BytesIO(b'0' * _PYARROW_MIN_FILE_SIZE)) == 'numpy'
+
+
+def test_fail_read_csv_with_unknown_backend():
+    with pytest.raises(ValueError):
+        read_csv(io.BytesIO(b'1,2\n'), backend='no_such_backend')
+
+
+def test_fail_read_csv_with_invalid_values(backend):
+    with pytest.raises(ValueError):
+        read_csv(io.BytesIO(b'1,2\n3,x\n'), backend=backend)
+
+
+def test_from_csv(tmp_path, backend):
+    file_name = tmp_path / 'series.csv'
+    np.savetxt(file_name, np.column_stack((np.arange(5), np.arange(5) ** 2)), delimiter=',')
+    x, y = Weaver.from_csv(file_name, backend=backend).get()
+    assert_array_equal(x, np.arange(5))
+    assert_array_equal(y, np.arange(5) ** 2)
@@ -1,8 +1,12 @@
+import os
+
 import numpy as np
 import pytest
 from numpy.ma.testutils import assert_array_approx_equal
 
+from traffic_weaver.interval import IntervalArray
 from traffic_weaver.rfa import (
+    FunctionRFA,
     PiecewiseConstantRFA,
     CubicSplineRFA,
     LinearFixedRFA,
@@ -11,6 +15,16 @@ from traffic_weaver.rfa import (
     ExpAdaptiveRFA,
 )
 
+# outputs of the loop implementations before vectorization, see `baseline_rfa_case`
+RESOURCES = os.path.join(os.path.dirname(__file__), 'resources')
+BASELINE_CASES = [{}, {'beta': 0.0}, {'exp': 2.5}, {'alpha': 1.5, 'beta': 0.25, 'exp': 3.0}]
+
+
+def baseline_rfa_case(filename, case):
+    r"""Input `x`, `y` and output `y` stored for the case of `BASELINE_CASES`, recreated with `n=8`."""
+    baseline = np.load(os.path.join(RESOURCES, filename))
+    return baseline['x'], baseline['y'], baseline[f'y_{case}']
+
 
 @pytest.fixture
 def xy():
@@ -31,6 +45,25 @@ def test_cubic_spline_rfa(xy):
     assert_array_approx_equal(ov_y, expected)
 
 
+@pytest.mark.parametrize("y", [[1, 3, 4, 1], [[1, 3, 4, 1], [2, 0, 1, 5]]])
+def test_cubic_spline_rfa_vectorized_same_as_each_point(y):
+    x = [0, 1, 3, 4]
+    each_point_x, each_point_y = CubicSplineRFA(x, y, 4, vectorized=False).rfa()
+    vectorized_x, vectorized_y = CubicSplineRFA(x, y, 4).rfa()
+    assert isinstance(vectorized_y, np.ndarray)
+    np.testing.assert_array_equal(vectorized_x, each_point_x)
+    np.testing.assert_array_equal(vectorized_y, each_point_y)
+
+
+def test_function_rfa_with_scalar_sampling_function(xy):
+    def sampling_function_supplier(x, y):
+        return lambda value: float(y[int(value)])
+
+    ov_x, ov_y = FunctionRFA(xy[0], xy[1], 2, sampling_function_supplier=sampling_function_supplier).rfa()
+    assert isinstance(ov_y, np.ndarray)
+    np.testing.assert_array_equal(ov_y, [1, 1, 3, 3, 4, 4, 1])
+
+
 def test_linear_fixed_rfa(xy):
     ov_x, ov_y = LinearFixedRFA(xy[0], xy[1], 4).rfa()
     expected = np.array(
@@ -92,3 +125,166 @@ def test_special_cases_in_oversample():
     LinearAdaptiveRFA(x, y, 4).rfa()
     ExpAdaptiveRFA(x, y, 4, beta=0).rfa()
     assert True
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'alpha': 0.5, 'beta': 0.0}, {'alpha': 1.5, 'beta': 1.0},
+                                    {'adaptive_smooth': 2.0, 'exp': 3.0}, {'a': 3, 'beta': 0.25}, {'alpha': 3.0}])
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1], [1, 1, 1, 3, 3], [2, 2, 2, 2]])
+def test_exp_adaptive_rfa_vectorized_same_as_iterative(kwargs, y):
+    x = np.cumsum(np.linspace(0.5, 1.5, len(y)))
+    iterative_x, iterative_y = ExpAdaptiveRFA(x, y, 8, vectorized=False, **kwargs).rfa()
+    vectorized_x, vectorized_y = ExpAdaptiveRFA(x, y, 8, **kwargs).rfa()
+    np.testing.assert_array_equal(vectorized_x, iterative_x)
+    np.testing.assert_array_equal(vectorized_y, iterative_y)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+@pytest.mark.parametrize("case, kwargs", enumerate(BASELINE_CASES))
+def test_exp_adaptive_rfa_same_as_baseline(case, kwargs, vectorized):
+    x, y, expected_y = baseline_rfa_case('exp_adaptive_rfa_baseline.npz', case)
+    _, res_y = ExpAdaptiveRFA(x, y, 8, vectorized=vectorized, **kwargs).rfa()
+    np.testing.assert_array_equal(res_y, expected_y)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("exp", [1.7, 2.5, 3.0])
+def test_exp_adaptive_rfa_vectorized_same_as_iterative_on_random_series(seed, exp):
+    rng = np.random.default_rng(seed)
+    x, y = np.cumsum(rng.uniform(0.1, 1.1, 30)), rng.uniform(0, 10, 30)
+    kwargs = dict(alpha=rng.uniform(0.3, 2.0), beta=rng.uniform(0, 1), adaptive_smooth=rng.uniform(0.5, 3), exp=exp)
+    _, iterative_y = ExpAdaptiveRFA(x, y, 12, vectorized=False, **kwargs).rfa()
+    _, vectorized_y = ExpAdaptiveRFA(x, y, 12, **kwargs).rfa()
+    np.testing.assert_array_equal(vectorized_y, iterative_y)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'alpha': 0.3}, {'alpha': 1.5}, {'a': 2}, {'alpha': 2.0}])
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1], [1, 1, 1, 3, 3]])
+def test_linear_fixed_rfa_vectorized_same_as_iterative(kwargs, y):
+    x = np.cumsum(np.linspace(0.5, 1.5, len(y)))
+    iterative_x, iterative_y = LinearFixedRFA(x, y, 8, vectorized=False, **kwargs).rfa()
+    vectorized_x, vectorized_y = LinearFixedRFA(x, y, 8, **kwargs).rfa()
+    np.testing.assert_array_equal(vectorized_x, iterative_x)
+    np.testing.assert_array_equal(vectorized_y, iterative_y)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+@pytest.mark.parametrize("case, kwargs", enumerate(BASELINE_CASES))
+def test_exp_fixed_rfa_same_as_baseline(case, kwargs, vectorized):
+    x, y, expected_y = baseline_rfa_case('exp_fixed_rfa_baseline.npz', case)
+    _, res_y = ExpFixedRFA(x, y, 8, vectorized=vectorized, **kwargs).rfa()
+    np.testing.assert_array_equal(res_y, expected_y)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'alpha': 0.3, 'beta': 0.0}, {'alpha': 1.5, 'beta': 1.0},
+                                    {'exp': 3.0}, {'a': 3, 'beta': 0.25}])
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1], [1, 1, 1, 3, 3]])
+def test_exp_fixed_rfa_vectorized_same_as_iterative(kwargs, y):
+    x = np.cumsum(np.linspace(0.5, 1.5, len(y)))
+    iterative_x, iterative_y = ExpFixedRFA(x, y, 8, vectorized=False, **kwargs).rfa()
+    vectorized_x, vectorized_y = ExpFixedRFA(x, y, 8, **kwargs).rfa()
+    np.testing.assert_array_equal(vectorized_x, iterative_x)
+    np.testing.assert_array_equal(vectorized_y, iterative_y)
+
+
+@pytest.mark.parametrize("a, adaptive_smooth", [(2, 1.0), (8, 1.0), (5, 2.0), (16, 0.5)])
+def test_adaptive_transition_points_array_same_as_list(a, adaptive_smooth):
+    n = 4
+    y = np.array([1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1, 1, 1], dtype=float)
+    x = IntervalArray(np.arange((len(y) + 1) * n + 1, dtype=float), n)
+    y = IntervalArray(np.concatenate([[y[0]] * n, np.repeat(y, n)[:-n + 1], [y[-1]] * n]), n)
+
+    a_ls, a_rs, _ = LinearAdaptiveRFA.get_adaptive_transition_points(x, y, a, adaptive_smooth)
+    array_a_ls, array_a_rs, gammas = LinearAdaptiveRFA.get_adaptive_transition_points_array(x, y, a, adaptive_smooth)
+
+    assert array_a_ls.tolist() == a_ls
+    assert array_a_rs.tolist() == a_rs
+    assert len(gammas) == len(a_ls)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'alpha': 0.3}, {'alpha': 1.5}, {'adaptive_smooth': 2.0}, {'a': 3},
+                                    {'alpha': 3.0}])
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1], [1, 1, 1, 3, 3], [2, 2, 2, 2]])
+def test_linear_adaptive_rfa_vectorized_same_as_iterative(kwargs, y):
+    x = np.cumsum(np.linspace(0.5, 1.5, len(y)))
+    iterative_x, iterative_y = LinearAdaptiveRFA(x, y, 8, vectorized=False, **kwargs).rfa()
+    vectorized_x, vectorized_y = LinearAdaptiveRFA(x, y, 8, **kwargs).rfa()
+    np.testing.assert_array_equal(vectorized_x, iterative_x)
+    np.testing.assert_array_equal(vectorized_y, iterative_y)
+
+
+@pytest.mark.parametrize("rfa_class, kwargs", [
+    (PiecewiseConstantRFA, {}),
+    (CubicSplineRFA, {}),
+    (LinearFixedRFA, {}),
+    (LinearFixedRFA, {'vectorized': False}),
+    (LinearAdaptiveRFA, {}),
+    (LinearAdaptiveRFA, {'vectorized': False}),
+    (ExpFixedRFA, {}),
+    (ExpFixedRFA, {'vectorized': False}),
+    (ExpAdaptiveRFA, {}),
+    (ExpAdaptiveRFA, {'vectorized': False}),
+])
+def test_rfa_many_series_same_as_each_series(rfa_class, kwargs):
+    ys = np.array([[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1],
+                   [1, 1, 1, 3, 3, 3, 2, 2, 2, 4, 4],
+                   [2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]], dtype=float)
+    x = np.cumsum(np.linspace(0.5, 1.5, ys.shape[1]))
+    batch_x, batch_y = rfa_class(x, ys, 8, **kwargs).rfa()
+    assert batch_y.shape == (len(ys), len(batch_x))
+    for y, row in zip(ys, batch_y):
+        series_x, series_y = rfa_class(x, y, 8, **kwargs).rfa()
+        np.testing.assert_array_equal(batch_x, series_x)
+        np.testing.assert_array_equal(row, series_y)
+
+
+def test_fail_too_many_dimensions_rfa():
+    with pytest.raises(ValueError):
+        PiecewiseConstantRFA([1, 2, 3], np.ones((1, 2, 3)), 2)
+
+
+@pytest.mark.parametrize("rfa_class, kwargs", [
+    (PiecewiseConstantRFA, {}),
+    (CubicSplineRFA, {}),
+    (LinearFixedRFA, {}),
+    (LinearFixedRFA, {'alpha': 2.0}),
+    (LinearFixedRFA, {'alpha': 3.0}),
+    (LinearAdaptiveRFA, {}),
+    (LinearAdaptiveRFA, {'vectorized': False}),
+    (LinearAdaptiveRFA, {'alpha': 3.0}),
+    (LinearAdaptiveRFA, {'alpha': 3.0, 'vectorized': False}),
+    (ExpFixedRFA, {}),
+    (ExpFixedRFA, {'alpha': 3.0}),
+    (ExpAdaptiveRFA, {}),
+    (ExpAdaptiveRFA, {'alpha': 3.0}),
+])
+@pytest.mark.parametrize("chunk_intervals", [1, 2, 3, 7, 100])
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1],
+                               [[1, 3, 4, 1, 2, 2, 2, 5, 0, 0, 1], [1, 1, 1, 3, 3, 3, 2, 2, 2, 4, 4]]])
+def test_rfa_iter_same_as_rfa(rfa_class, kwargs, chunk_intervals, y):
+    x = np.cumsum(np.linspace(0.5, 1.5, np.shape(y)[-1]))
+    rfa = rfa_class(x, y, 4, **kwargs)
+    expected_x, expected_y = rfa.rfa()
+
+    chunks = list(rfa.rfa_iter(chunk_intervals=chunk_intervals))
+    assert len(chunks) == int(np.ceil(len(x) / chunk_intervals))
+    np.testing.assert_array_equal(np.concatenate([xs for xs, _ in chunks]), expected_x)
+    np.testing.assert_array_equal(np.concatenate([ys for _, ys in chunks], axis=-1), expected_y)
+
+
+@pytest.mark.parametrize("rfa_class", [LinearFixedRFA, LinearAdaptiveRFA, ExpFixedRFA, ExpAdaptiveRFA])
+@pytest.mark.parametrize("alpha", [3.0, 6.0])
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_wide_transition_windows_depend_only_on_close_points(rfa_class, alpha, vectorized):
+    x = np.cumsum(np.linspace(0.5, 1.5, 30))
+    y = np.tile([1, 3, 4, 1, 2, 2], 5)
+    _, ys = rfa_class(x, y, 4, alpha=alpha, vectorized=vectorized).rfa()
+
+    x[-1], y[-1] = x[-1] + 3, y[-1] + 7
+    _, changed_ys = rfa_class(x, y, 4, alpha=alpha, vectorized=vectorized).rfa()
+    np.testing.assert_array_equal(changed_ys[:4 * 10], ys[:4 * 10])
+
+
+@pytest.mark.parametrize("rfa_class", [PiecewiseConstantRFA, CubicSplineRFA])
+def test_fail_rfa_iter_empty_chunks(rfa_class, xy):
+    with pytest.raises(ValueError):
+        next(rfa_class(xy[0], xy[1], 4).rfa_iter(chunk_intervals=0))
@@ -0,0 +1,76 @@
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from traffic_weaver import Weaver
+from traffic_weaver.rfa import ExpAdaptiveRFA
+from traffic_weaver.sinks import write_csv, write_npy, write_parquet
+
+
+@pytest.fixture
+def x():
+    return np.linspace(0, 10, 11)
+
+
+@pytest.fixture(params=[1, 2])
+def y(request, x):
+    y = np.sin(x) + 2
+    return y if request.param == 1 else np.stack([y, 2 * y])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_to_csv(tmp_path, x, y, chunk_size):
+    file_name = tmp_path / 'series.csv'
+    Weaver(x, y).to_csv(file_name, chunk_size=chunk_size)
+    assert_array_equal(np.loadtxt(file_name, delimiter=','), Weaver(x, y).to_2d_array())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_to_npy(tmp_path, x, y, chunk_size):
+    file_name = tmp_path / 'series.npy'
+    Weaver(x, y).to_npy(file_name, chunk_size=chunk_size)
+    assert_array_equal(np.load(file_name), Weaver(x, y).to_2d_array())
+
+
+def test_write_npy_from_rfa_iter(tmp_path, x, y):
+    file_name = tmp_path / 'series.npy'
+    rfa = ExpAdaptiveRFA(x, y, 4)
+    write_npy(file_name, rfa.rfa_iter(chunk_intervals=3), (len(x) - 1) * 4 + 1)
+    assert_array_equal(np.load(file_name), Weaver(*rfa.rfa()).to_2d_array())
+
+
+@pytest.mark.parametrize("nr_of_samples", [0, 10, 12])
+def test_fail_write_npy_with_wrong_nr_of_samples(tmp_path, x, y, nr_of_samples):
+    with pytest.raises(ValueError):
+        write_npy(tmp_path / 'series.npy', [(x[:5], y[..., :5]), (x[5:], y[..., 5:])], nr_of_samples)
+
+
+def test_write_csv_without_chunks(tmp_path):
+    file_name = tmp_path / 'series.csv'
+    write_csv(file_name, [])
+    assert file_name.read_text() == ''
+
+
+def test_fail_to_csv_with_empty_chunks(tmp_path, x, y):
+    with pytest.raises(ValueError):
+        Weaver(x, y).to_csv(tmp_path / 'series.csv', chunk_size=0)
+
+
+def test_to_parquet(tmp_path, x, y):
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_name = tmp_path / 'series.parquet'
+    Weaver(x, y).to_parquet(file_name, chunk_size=4)
+
+    table = pq.read_table(file_name)
+    assert pq.ParquetFile(file_name).num_row_groups == 3
+    assert_array_equal(np.column_stack([column.to_numpy() for column in table.columns]),
+                       Weaver(x, y).to_2d_array())
+    assert table.column_names == (['x', 'y'] if y.ndim == 1 else ['x', 'y0', 'y1'])
+
+
+def test_fail_write_parquet_without_pyarrow(mocker, tmp_path, x, y):
+    mocker.patch.dict(sys.modules, {'pyarrow': None, 'pyarrow.parquet': None})
+    with pytest.raises(ImportError):
+        write_parquet(tmp_path / 'series.parquet', [(x, y)])
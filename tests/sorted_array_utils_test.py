@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
@@ -80,9 +81,159 @@ def test_find_closest_element_lower_or_higher_indices_to_values(a, values, expec
     assert_array_equal(indices, expected)
 
 
+# original iterator-based implementations, searchsorted versions have to give the same indices
+def _loop_closest_lower_equal(x, lookup, fill_not_valid=True):
+    indices = np.zeros(len(lookup), dtype=np.int64)
+
+    x_it = iter(x)
+    x_val = next(x_it)
+    x_next_val = next(x_it, None)
+    x_idx = 0
+
+    lookup_it = iter(lookup)
+    lookup_val = next(lookup_it)
+    lookup_idx = 0
+
+    # lookup value lower than x
+    # shift lookup until it is higher equal than the first element in x
+    while lookup_val is not None and lookup_val < x_val:
+        indices[lookup_idx] = x_idx if fill_not_valid else -1
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+
+    # lookup value is higher than the first element in x
+    while lookup_val is not None:
+        # if lookup is higher than the next x
+        # move x to the right
+        while x_next_val is not None and x_next_val <= lookup_val:
+            x_next_val = next(x_it, None)
+            x_idx += 1
+            if x_next_val is None:
+                break
+        # lookup value is higher than the current x and lower than the next x
+        indices[lookup_idx] = x_idx
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+    return indices
+
+
+def _loop_closest_higher_equal(x, lookup, fill_not_valid=True):
+    indices = np.zeros(len(lookup), dtype=np.int64)
+
+    x_it = iter(x)
+    x_val = next(x_it)
+    x_next_val = next(x_it, None)
+    x_idx = 0
+
+    lookup_it = iter(lookup)
+    lookup_val = next(lookup_it)
+    lookup_idx = 0
+
+    # lookup value lower than x
+    # shift lookup until it is higher than the first element in x
+    while lookup_val is not None and lookup_val <= x_val:
+        indices[lookup_idx] = x_idx
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+
+    # lookup value is higher than the first element in x
+    while lookup_val is not None:
+        # if lookup is higher than the next x
+        # move x to the right
+        while x_next_val is not None and x_next_val < lookup_val:
+            x_next_val = next(x_it, None)
+            x_idx += 1
+            if x_next_val is None:
+                break
+        # lookup value is higher than the current x and lower than the next x
+        if x_next_val is None:
+            indices[lookup_idx] = x_idx if fill_not_valid else len(x)
+        else:
+            indices[lookup_idx] = x_idx + 1
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+    return indices
+
+
+def _loop_closest_lower_or_higher(x, lookup):
+    indices = np.zeros(len(lookup), dtype=np.int64)
+
+    x_it = iter(x)
+    x_val = next(x_it)
+    x_next_val = next(x_it, None)
+    x_idx = 0
+
+    lookup_it = iter(lookup)
+    lookup_val = next(lookup_it)
+    lookup_idx = 0
+
+    # lookup value lower than x
+    # shift lookup until it is higher than the first element in x
+    while lookup_val is not None and lookup_val <= x_val:
+        indices[lookup_idx] = x_idx
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+
+    # lookup value is higher than the first element in x
+    while lookup_val is not None:
+        # if lookup is higher than the next x
+        # move x to the right
+        while x_next_val is not None and x_next_val < lookup_val:
+            x_val = x_next_val
+            x_next_val = next(x_it, None)
+            x_idx += 1
+            if x_next_val is None:
+                break
+        # lookup value is higher than the last element in x
+        if x_next_val is None:
+            indices[lookup_idx] = x_idx
+        else:
+            # lookup value is higher than the current x and lower than the next x
+            # check which one is closer
+            if lookup_val - x_val <= x_next_val - lookup_val:
+                indices[lookup_idx] = x_idx
+            else:
+                indices[lookup_idx] = x_idx + 1
+        lookup_val = next(lookup_it, None)
+        lookup_idx += 1
+    return indices
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("fill_not_valid", [True, False])
+def test_find_closest_element_indices_to_values_same_as_loop(seed, fill_not_valid):
+    rng = np.random.default_rng(seed)
+    # integer valued points to get ties and repeated elements
+    x = np.sort(rng.integers(0, 10, rng.integers(1, 20)).astype(float))
+    if seed % 2:
+        x = np.unique(x)
+    lookup = np.sort(np.concatenate([rng.choice(x, 10), rng.uniform(-2, 12, 10), (x[1:] + x[:-1]) / 2]))
+
+    assert_array_equal(find_closest_lower_equal_element_indices_to_values(x, lookup, fill_not_valid),
+                       _loop_closest_lower_equal(x, lookup, fill_not_valid))
+    assert_array_equal(find_closest_higher_equal_element_indices_to_values(x, lookup, fill_not_valid),
+                       _loop_closest_higher_equal(x, lookup, fill_not_valid))
+    assert_array_equal(find_closest_lower_or_higher_element_indices_to_values(x, lookup),
+                       _loop_closest_lower_or_higher(x, lookup))
+
+
 @pytest.mark.parametrize("a, indices, expected",
                          [([1, 2, 3, 4, 5], [0, 5], [15]), ([1, 2, 3, 4, 5], [0, 1, 2, 3, 4, 5], [1, 2, 3, 4, 5]),
-                          ([1, 2, 3, 4, 5], [0, 2, 4], [3, 7]), ])
+                          ([1, 2, 3, 4, 5], [0, 2, 4], [3, 7]),
+                          ([1, 2, 3, 4, 5], [0, 0, 2, 2, 5, 5], [0, 3, 0, 12, 0]),
+                          ([1, 2, 3, 4, 5], [1], []),
+                          ([[1, 2, 3, 4, 5], [2, 4, 6, 8, 10]], [0, 2, 2, 5], [[3, 0, 12], [6, 0, 24]]), ])
 def test_sum_over_indices(a, indices, expected):
     res = sum_over_indices(a, indices)
     assert_array_equal(res, expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("shape", [(), (3,)])
+def test_sum_over_indices_same_as_sum_of_each_range(seed, shape):
+    rng = np.random.default_rng(seed)
+    a = rng.lognormal(0, 3, shape + (2000,))
+    indices = np.sort(rng.integers(0, 2001, 50))
+    expected = np.stack([a[..., start:stop].sum(axis=-1) for start, stop in zip(indices[:-1], indices[1:])], axis=-1)
+    # exactly equal, ranges are summed in the same order
+    assert_array_equal(sum_over_indices(a, indices), expected)
@@ -1,9 +1,11 @@
+import inspect
+
 import numpy as np
 import pandas as pd
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
-from traffic_weaver import Weaver
+from traffic_weaver import Weaver, WeaverPipeline
 from traffic_weaver.rfa import PiecewiseConstantRFA
 
 
@@ -33,7 +35,7 @@ def mock_weaver_delegates(mocker, xy):
         if not np.isscalar(xin)
         else y[np.argmax(x == xin)],
     )
-    mocker.patch("traffic_weaver.weaver.noise_gauss", side_effect=lambda y, snr: y)
+    mocker.patch("traffic_weaver.weaver.noise_gauss", side_effect=lambda y, snr, **kwargs: y)
     return mocker
 
 
@@ -123,3 +125,139 @@ def test_copy(xy):
     assert_array_equal(weaver.get()[1], weaver2.get()[1])
     weaver2.get()[0][0] = 100
     assert weaver.get()[0][0] != weaver2.get()[0][0]
+
+
+def _process_chain(weaver):
+    return (weaver.append_one_sample(make_periodic=True)
+            .recreate_from_average(4)
+            .scale_y(2)
+            .shift_y(1)
+            .trend(lambda x: 0.5 * x)
+            .noise(20)
+            .integral_match()
+            .scale_y(0.5)
+            .smooth(1.0)
+            .shift_y(-1)
+            .noise(30))
+
+
+@pytest.mark.parametrize("y", [[1, 3, 4, 1, 2], [1.5, 3.0, 4.5, 1.0, 2.0]])
+def test_lazy_weaver_same_as_eager(xy, y):
+    np.random.seed(0)
+    eager = _process_chain(Weaver(xy[0], y))
+
+    np.random.seed(0)
+    lazy = _process_chain(Weaver(xy[0], y, lazy=True))
+    # nothing is executed until the time series is accessed
+    assert_array_equal(lazy.x, xy[0])
+    assert len(lazy._operations) == 11
+
+    assert_array_equal(lazy.get()[0], eager.get()[0])
+    assert_array_equal(lazy.get()[1], eager.get()[1])
+    assert_array_equal(lazy.get_reference()[1], eager.get_reference()[1])
+    assert lazy.y_scale == eager.y_scale
+    assert len(lazy._operations) == 0
+
+
+def test_lazy_weaver_with_fused_trend_same_as_eager():
+    x, y = np.arange(5), np.array([1, 3, 4, 1, 2])
+    eager = Weaver(x, y).scale_y(2).trend(lambda x: x)
+    lazy = Weaver(x, y, lazy=True).scale_y(2).trend(lambda x: x)
+
+    lazy_x, lazy_y = lazy.get()
+    eager_x, eager_y = eager.get()
+    assert lazy_x.dtype == eager_x.dtype
+    assert_array_equal(lazy_x, eager_x)
+    assert_array_equal(lazy_y, eager_y)
+    assert lazy.to_2d_array().dtype == eager.to_2d_array().dtype
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_weaver_noise_with_generator(xy, lazy):
+    y = np.array([1.5, 3.0, 4.5, 1.0, 2.0])
+    res_y = Weaver(xy[0], y, lazy=lazy).shift_y(1).noise(20, rng=np.random.default_rng(0)).get()[1]
+    same_seed_y = Weaver(xy[0], y, lazy=lazy).shift_y(1).noise(20, rng=0).get()[1]
+
+    assert_array_equal(res_y, same_seed_y)
+    assert not np.array_equal(res_y, y + 1)
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_weaver_noise_targets_snr_in_each_series(lazy):
+    y = np.stack([np.ones(10000), np.full(10000, 100.0)])
+    res_y = Weaver(np.arange(10000), y, lazy=lazy).noise(0, rng=0).get()[1]
+
+    assert_array_almost_equal(np.std(res_y - y, axis=-1) / [1, 100], [1, 1], decimal=1)
+
+
+def test_lazy_weaver_fuses_elementwise_operations(mocker, xy):
+    weaver = Weaver(xy[0], xy[1], lazy=True).scale_y(2).shift_y(1).trend(lambda x: x)
+    apply_elementwise_y = mocker.spy(weaver, '_apply_elementwise_y')
+
+    assert_array_equal(weaver.to_2d_array(), np.column_stack([xy[0], 2 * xy[1] + 1 + xy[0]]))
+    apply_elementwise_y.assert_called_once()
+    assert_array_equal(weaver.get_reference()[1], 2 * xy[1] + 1)
+
+
+def test_lazy_weaver_keeps_integer_type(xy):
+    weaver = Weaver(xy[0], xy[1], lazy=True).scale_y(2).shift_y(1)
+    assert weaver.get()[1].dtype == (2 * xy[1] + 1).dtype
+
+
+def _recipe(weaver):
+    return (weaver.append_one_sample(make_periodic=True)
+            .recreate_from_average(4)
+            .integral_match()
+            .smooth(0.5)
+            .scale_y(2)
+            .trend(lambda x: 0.1 * x)
+            .normalize_y(0, 10))
+
+
+def test_weaver_with_many_series_same_as_each_series(xy):
+    ys = np.array([xy[1], 2 * xy[1] + 1, xy[1][::-1]])
+    batch_x, batch_y = _recipe(Weaver(xy[0], ys)).get()
+    assert batch_y.shape[0] == len(ys)
+    for y, batch_row in zip(ys, batch_y):
+        res_x, res_y = _recipe(Weaver(xy[0], y)).get()
+        assert_array_equal(batch_x, res_x)
+        np.testing.assert_allclose(batch_row, res_y, rtol=1e-12, atol=1e-12)
+
+
+def test_weaver_pipeline_same_as_weaver(mocker, xy):
+    series = [(xy[0], xy[1]), (None, 2 * xy[1]), (xy[0] * 2, xy[1]), (xy[0], xy[1][::-1])]
+    pipeline = _recipe(WeaverPipeline())
+    run = mocker.spy(pipeline, '_run')
+
+    results = pipeline.run_many(series)
+
+    # series sharing x are processed together
+    assert run.call_count == 2
+    assert len(results) == len(series)
+    for (x, y), (res_x, res_y) in zip(series, results):
+        expected_x, expected_y = _recipe(Weaver(x, y)).get()
+        assert_array_equal(res_x, expected_x)
+        np.testing.assert_allclose(res_y, expected_y, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("name", ['recreate_from_average', 'noise', 'normalize_y', 'truncate_by_index'])
+def test_weaver_pipeline_methods_documented_as_weaver_methods(name):
+    method = getattr(WeaverPipeline, name)
+    assert method.__name__ == name
+    assert method.__doc__ == getattr(Weaver, name).__doc__
+    assert inspect.signature(method) == inspect.signature(getattr(Weaver, name))
+
+
+def test_weaver_pipeline_spawns_generator_for_each_series(xy):
+    series = [(xy[0], xy[1]), (xy[0], xy[1]), (xy[0] * 2, xy[1])]
+    pipeline = WeaverPipeline().recreate_from_average(4).noise(10, rng=0)
+
+    results = pipeline.run_many(series)
+
+    rngs = np.random.default_rng(0).spawn(len(series))
+    for (x, y), rng, (res_x, res_y) in zip(series, rngs, results):
+        expected_x, expected_y = WeaverPipeline().recreate_from_average(4).noise(10, rng=rng).run(x, y)
+        assert_array_equal(res_x, expected_x)
+        np.testing.assert_allclose(res_y, expected_y, rtol=1e-12, atol=1e-12)
+    # series with the same values get independent noise
+    assert not np.array_equal(results[0][1], results[1][1])